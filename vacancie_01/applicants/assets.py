@@ -0,0 +1,251 @@
+"""
+Content-hashed URLs for the applicant PDFs and images under _static/applicants/.
+
+A build step fingerprints every asset and writes a manifest mapping each logical name
+(e.g. 'applicants_a/cv_a1.pdf') to a content-hashed name ('applicants_a/cv_a1.3f9c0b2e71d4.pdf').
+Pages resolve logical names through resolve_asset(); the static file server maps hashed names
+back to the file on disk and marks them as immutable, so browsers download each asset once.
+Hashed names are virtual, no copies of the files are written.
+
+Rebuild after adding or editing any PDF or image:
+    python -m applicants.assets
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+
+from .documents import APPLICANTS_STATIC_DIR
+from .metadata import file_sha256
+
+logger = logging.getLogger(__name__)
+
+ASSET_MANIFEST_VERSION = 1
+ASSET_MANIFEST_PATH = os.path.join(APPLICANTS_STATIC_DIR, 'asset_manifest.json')
+ASSET_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.webp', '.mp4')
+HASH_LENGTH = 12
+
+# URL prefix of APPLICANTS_STATIC_DIR inside the static file server
+STATIC_URL_PREFIX = 'applicants/'
+# Folders whose URLs contain a version and therefore never change content (see vendor.py)
+IMMUTABLE_URL_PREFIXES = ('vendor/',)
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_manifest = None
+_hashed_to_logical = {}
+
+# Verified assets: (logical name, expected sha256) -> ((mtime_ns, size), is_current)
+_VERIFIED_ASSETS = {}
+_VERIFIED_ASSETS_LOCK = threading.Lock()
+
+
+def hashed_asset_name(logical_name, sha256):
+    """
+    Inserts the first characters of the content hash before the file extension.
+
+    Args:
+    logical_name (str): Path relative to _static/applicants/, e.g. 'Email_1.pdf'
+    sha256 (str): Hex digest of the file contents
+
+    Returns:
+    str: Hashed name, e.g. 'Email_1.5be0c2f1a9d7.pdf'
+    """
+    root, extension = os.path.splitext(logical_name)
+    return f'{root}.{sha256[:HASH_LENGTH]}{extension}'
+
+
+def find_assets(static_dir=APPLICANTS_STATIC_DIR):
+    """
+    Lists all PDFs, images and videos below the applicants static folder.
+
+    Returns:
+    list: Sorted logical names using '/' as separator
+    """
+    logical_names = []
+    for directory, _, filenames in os.walk(static_dir):
+        for filename in filenames:
+            if filename.lower().endswith(ASSET_EXTENSIONS):
+                relative_path = os.path.relpath(os.path.join(directory, filename), static_dir)
+                logical_names.append(relative_path.replace(os.sep, '/'))
+    return sorted(logical_names)
+
+
+def build_asset_manifest(static_dir=APPLICANTS_STATIC_DIR, manifest_path=ASSET_MANIFEST_PATH):
+    """
+    Fingerprints all assets and writes the manifest.
+
+    Args:
+    static_dir (str): Folder containing the assets
+    manifest_path (str): Where to write the manifest
+
+    Returns:
+    dict: Manifest with 'version' and 'assets' (logical name -> hashed name, sha256, size)
+    """
+    assets = {}
+    for logical_name in find_assets(static_dir):
+        path = os.path.join(static_dir, logical_name)
+        sha256 = file_sha256(path)
+        assets[logical_name] = {
+            'hashed': hashed_asset_name(logical_name, sha256),
+            'sha256': sha256,
+            'size': os.path.getsize(path),
+        }
+
+    manifest = {'version': ASSET_MANIFEST_VERSION, 'assets': assets}
+
+    # Write atomically so running servers never read a half-written manifest
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+def read_asset_manifest(manifest_path=ASSET_MANIFEST_PATH):
+    """
+    Loads the asset manifest, re-reading it only when the file has changed.
+
+    Returns:
+    dict: Manifest assets (logical name -> entry), empty if missing or of another version
+    """
+    global _manifest, _hashed_to_logical
+
+    try:
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+        if _manifest and _manifest[0] == mtime_ns:
+            return _manifest[1]
+
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get('version') != ASSET_MANIFEST_VERSION:
+        logger.warning("Asset manifest %s has version %s, expected %s",
+                       manifest_path, manifest.get('version'), ASSET_MANIFEST_VERSION)
+        return {}
+
+    assets = manifest['assets']
+    _hashed_to_logical = {entry['hashed']: logical_name for logical_name, entry in assets.items()}
+    _manifest = (mtime_ns, assets)
+    return assets
+
+
+def asset_is_current(logical_name, entry, build_command='python -m applicants.assets'):
+    """
+    Checks that the file on disk still has the content recorded in a manifest entry.
+    The file is hashed once per modification time and size.
+
+    Args:
+    logical_name (str): Path relative to _static/applicants/
+    entry (dict): Manifest entry with the expected 'sha256' and 'size'
+    build_command (str): Command that rebuilds the manifest, shown in the stale warning
+
+    Returns:
+    bool: True if the file exists and matches the entry
+    """
+    path = os.path.join(APPLICANTS_STATIC_DIR, logical_name)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    key = (logical_name, entry['sha256'])
+
+    with _VERIFIED_ASSETS_LOCK:
+        verified = _VERIFIED_ASSETS.get(key)
+        if verified and verified[0] == fingerprint:
+            return verified[1]
+
+    is_current = stat.st_size == entry['size'] and file_sha256(path) == entry['sha256']
+    if not is_current:
+        logger.warning("Manifest entry is stale for %s, serving it unoptimized. "
+                       "Run '%s' to update it.", logical_name, build_command)
+
+    with _VERIFIED_ASSETS_LOCK:
+        _VERIFIED_ASSETS[key] = (fingerprint, is_current)
+    return is_current
+
+
+def resolve_asset(logical_name):
+    """
+    Returns the content-hashed name of an asset for use in templates.
+
+    Args:
+    logical_name (str): Path relative to _static/applicants/, e.g. 'applicants_a/cv_a1.pdf'
+
+    Returns:
+    str: Hashed name if the manifest is up to date for this file, otherwise the logical name
+    """
+    entry = read_asset_manifest().get(logical_name)
+    if entry and asset_is_current(logical_name, entry):
+        return entry['hashed']
+    return logical_name
+
+
+def logical_asset_name(hashed_name):
+    """
+    Maps a hashed name back to its logical name.
+
+    Returns:
+    str: Logical name, or None if the name is unknown or the file no longer matches its hash
+    """
+    assets = read_asset_manifest()
+    logical_name = _hashed_to_logical.get(hashed_name)
+    if logical_name not in assets or not asset_is_current(logical_name, assets[logical_name]):
+        return None
+    return logical_name
+
+
+def install_immutable_static_caching(static_app=None):
+    """
+    Teaches oTree's static file server to serve hashed asset names.
+    Requests for a hashed name are answered with the original file and far-future
+    immutable cache headers, as are versioned vendor files; all other static files
+    are served unchanged.
+
+    Args:
+    static_app: Starlette StaticFiles instance (default: oTree's /static app)
+    """
+    if static_app is None:
+        from otree.common2 import static_files_app as static_app
+
+    if getattr(static_app, 'serves_hashed_assets', False):
+        return
+
+    get_response = static_app.get_response
+
+    async def get_hashed_response(path, scope):
+        url_path = path.replace(os.sep, '/')
+        logical_name = None
+        if url_path.startswith(STATIC_URL_PREFIX):
+            logical_name = logical_asset_name(url_path[len(STATIC_URL_PREFIX):])
+        if logical_name is None:
+            response = await get_response(path, scope)
+            if url_path.startswith(IMMUTABLE_URL_PREFIXES) and response.status_code in (200, 206, 304):
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+        response = await get_response(STATIC_URL_PREFIX + logical_name, scope)
+        if response.status_code in (200, 206, 304):
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    static_app.get_response = get_hashed_response
+    static_app.serves_hashed_assets = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint applicant PDFs and images into a manifest.")
+    parser.add_argument('--output', default=ASSET_MANIFEST_PATH, help="Manifest path")
+    args = parser.parse_args()
+
+    manifest = build_asset_manifest(manifest_path=args.output)
+    total_size = sum(entry['size'] for entry in manifest['assets'].values())
+    print(f"{len(manifest['assets'])} assets ({total_size / 1024 / 1024:.1f} MB)")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
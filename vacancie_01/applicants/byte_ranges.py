@@ -0,0 +1,186 @@
+"""
+HTTP byte-range support for the static files opened in the PDF modals.
+
+oTree's static file server (Starlette 0.14) always sends whole files. This module teaches it
+single byte-range requests (Accept-Ranges, 206 Partial Content, 416, If-Range) and strong
+ETags, so browser PDF viewers can fetch the first page of a linearized PDF before the rest
+of the file arrives.
+"""
+import hashlib
+import os
+from email.utils import formatdate
+
+import aiofiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+from .assets import APPLICANTS_STATIC_DIR, asset_is_current, read_asset_manifest
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    Raised when a requested byte range lies entirely outside the file.
+    """
+
+
+def parse_byte_range(range_header, size):
+    """
+    Parses a Range header for a file of the given size.
+    Only a single range is supported; other forms are ignored and the whole file is sent,
+    as HTTP allows.
+
+    Args:
+    range_header (str): Header value, e.g. 'bytes=0-65535', 'bytes=1000-' or 'bytes=-500'
+    size (int): File size in bytes
+
+    Returns:
+    tuple: (start, end) inclusive byte positions, or None to send the whole file
+
+    Raises:
+    RangeNotSatisfiable: If the range starts beyond the end of the file
+    """
+    unit, _, spec = range_header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+
+    start_text, separator, end_text = spec.strip().partition('-')
+    if not separator:
+        return None
+
+    try:
+        if not start_text:
+            # Suffix range: the last N bytes
+            length = int(end_text)
+            if length <= 0 or size == 0:
+                raise RangeNotSatisfiable(range_header)
+            return max(0, size - length), size - 1
+
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable(range_header)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def strip_weak_prefix(tag):
+    # Only the 'W/' prefix itself; lstrip('W/') would also eat leading 'W' and '/' characters
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def etag_matches(header_value, etag):
+    """
+    Checks an If-None-Match header against an ETag (weak comparison).
+    """
+    if not header_value:
+        return False
+    if header_value.strip() == '*':
+        return True
+    return strip_weak_prefix(etag) in (strip_weak_prefix(tag.strip()) for tag in header_value.split(','))
+
+
+def file_etag(full_path, stat_result):
+    """
+    Returns a strong ETag for a static file.
+    Files listed in the asset manifest use their content hash, so the ETag stays the same
+    across deployments; other files use modification time and size.
+    """
+    relative_path = os.path.relpath(full_path, APPLICANTS_STATIC_DIR).replace(os.sep, '/')
+    entry = read_asset_manifest().get(relative_path)
+    if entry and asset_is_current(relative_path, entry):
+        return f'"{entry["sha256"][:32]}"'
+
+    etag_base = f'{stat_result.st_mtime}-{stat_result.st_size}'
+    return f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
+
+
+class PartialFileResponse(FileResponse):
+    """
+    Sends bytes start..end (inclusive) of a file with status 206.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, path, start, end, stat_result, headers, method=None):
+        headers = dict(headers)
+        headers['content-range'] = f'bytes {start}-{end}/{stat_result.st_size}'
+        headers['content-length'] = str(end - start + 1)
+        super().__init__(path, status_code=206, headers=headers, stat_result=stat_result, method=method)
+        self.start = start
+        self.end = end
+
+    async def __call__(self, scope, receive, send):
+        await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.raw_headers})
+        if self.send_header_only:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+            return
+
+        remaining = self.end - self.start + 1
+        async with aiofiles.open(self.path, mode='rb') as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break  # File shrank while sending
+                remaining -= len(chunk)
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': remaining > 0})
+        if remaining > 0:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+
+def install_byte_range_support(static_app=None):
+    """
+    Replaces the file response of oTree's static file server with one that
+    supports byte ranges, conditional requests and strong ETags.
+
+    Args:
+    static_app: Starlette StaticFiles instance (default: oTree's /static app)
+    """
+    if static_app is None:
+        from otree.common2 import static_files_app as static_app
+
+    if getattr(static_app, 'serves_byte_ranges', False):
+        return
+
+    def file_response(full_path, stat_result, scope, status_code=200):
+        method = scope['method']
+        request_headers = Headers(scope=scope)
+        etag = file_etag(full_path, stat_result)
+        headers = {
+            'accept-ranges': 'bytes',
+            'etag': etag,
+            'last-modified': formatdate(stat_result.st_mtime, usegmt=True),
+        }
+
+        if status_code != 200:
+            return FileResponse(full_path, status_code=status_code, headers=headers,
+                                stat_result=stat_result, method=method)
+
+        if etag_matches(request_headers.get('if-none-match'), etag):
+            return NotModifiedResponse(Headers(headers))
+
+        range_header = request_headers.get('range')
+        if_range = request_headers.get('if-range')
+        # If-Range: only honour the range if the client's copy is still current
+        if range_header and (if_range is None or if_range in (etag, headers['last-modified'])):
+            try:
+                byte_range = parse_byte_range(range_header, stat_result.st_size)
+            except RangeNotSatisfiable:
+                return Response(status_code=416, headers={
+                    'content-range': f'bytes */{stat_result.st_size}',
+                    'accept-ranges': 'bytes',
+                })
+            if byte_range is not None:
+                return PartialFileResponse(full_path, *byte_range, stat_result, headers, method)
+
+        response = FileResponse(full_path, headers=headers, stat_result=stat_result, method=method)
+        if static_app.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    static_app.file_response = file_response
+    static_app.serves_byte_ranges = True
@@ -0,0 +1,273 @@
+"""
+Server-side SVG charts for the Final Results page.
+
+FinalResults.vars_for_template already has every value the charts show, so they are drawn
+here as static inline SVG instead of shipping a charting library to the browser. The SVG
+scales with its container; hovering a marker shows its value.
+
+The charts of a participant cannot change once the final round is reached, so they are
+cached per participant code (least recently used entries are dropped).
+"""
+import html
+import os
+import threading
+from collections import OrderedDict
+
+WIDTH = 800
+HEIGHT = 400
+FONT = 'font-family="Arial, sans-serif"'
+AXIS_COLOR = '#333'
+GRID_COLOR = '#e5e5e5'
+
+# (label, session key, color, dashed) of the task progression lines
+PROGRESSION_SERIES = [
+    ('Fatigue', 'fatigue_level', '#dc3545', False),
+    ('Mental Effort', 'mental_effort', '#fd7e14', False),
+    ('Concentration Difficulty', 'concentration_difficulty', '#ffc107', False),
+    ('Motivation', 'motivation_level', '#28a745', False),
+]
+EFFORT_WORTH_SERIES = ('Effort Worth It', 'effort_cost_worth', '#17a2b8', True)
+
+# Viridis color scale, used to color sessions from first to last
+VIRIDIS = ['#440154', '#414487', '#2a788e', '#22a884', '#7ad151', '#fde725']
+
+CHART_CACHE_SIZE = int(os.environ.get('FINAL_RESULTS_CHART_CACHE_SIZE', 64))
+
+_CHART_CACHE = OrderedDict()
+_CHART_CACHE_LOCK = threading.Lock()
+
+
+def _number(value):
+    return f'{value:.1f}'.rstrip('0').rstrip('.')
+
+
+def _text(x, y, content, anchor='middle', size=12, extra=''):
+    return (f'<text x="{_number(x)}" y="{_number(y)}" text-anchor="{anchor}" font-size="{size}" '
+            f'{FONT} fill="{AXIS_COLOR}"{extra}>{html.escape(str(content))}</text>')
+
+
+def _plot_area(margin):
+    """
+    Returns (left, top, right, bottom) of the plotting area inside the chart margins.
+    """
+    left, top, right, bottom = margin
+    return left, top, WIDTH - right, HEIGHT - bottom
+
+
+def _y_axis(area, y_label, y_range):
+    """
+    Draws horizontal grid lines with tick labels and the rotated y axis title.
+    """
+    left, top, right, bottom = area
+    low, high = y_range
+    parts = []
+    for tick in range(low, high + 1, (high - low) // 5):
+        y = bottom - (tick - low) / (high - low) * (bottom - top)
+        parts.append(f'<line x1="{left}" y1="{_number(y)}" x2="{right}" y2="{_number(y)}" '
+                     f'stroke="{GRID_COLOR}"/>')
+        parts.append(_text(left - 8, y + 4, tick, anchor='end'))
+    middle = (top + bottom) / 2
+    parts.append(_text(18, middle, y_label, size=13,
+                       extra=f' transform="rotate(-90 18 {_number(middle)})"'))
+    parts.append(f'<line x1="{left}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="{AXIS_COLOR}"/>')
+    parts.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" stroke="{AXIS_COLOR}"/>')
+    return parts
+
+
+def _svg(parts, title):
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+            f'style="width:100%;height:auto;display:block" role="img" aria-label="{html.escape(title)}">'
+            + ''.join(parts) + '</svg>')
+
+
+def line_chart_svg(categories, series, title, x_label, y_label, y_range=(0, 100)):
+    """
+    Renders lines with markers over evenly spaced categories, with a legend below.
+
+    Args:
+    categories (list): X axis labels, e.g. ['Vacancy 1', 'Vacancy 2']
+    series (list): Dicts with 'name', 'values' (one per category, None for a gap), 'color', 'dashed'
+    title (str): Accessible name of the chart
+    x_label (str): X axis title
+    y_label (str): Y axis title
+    y_range (tuple): Lowest and highest y value shown
+
+    Returns:
+    str: SVG markup
+    """
+    area = left, top, right, bottom = _plot_area((60, 20, 20, 100))
+    low, high = y_range
+    step = (right - left) / len(categories)
+    parts = _y_axis(area, y_label, y_range)
+
+    def point(index, value):
+        x = left + step * (index + 0.5)
+        y = bottom - (min(max(value, low), high) - low) / (high - low) * (bottom - top)
+        return x, y
+
+    for index, category in enumerate(categories):
+        parts.append(_text(left + step * (index + 0.5), bottom + 20, category))
+    parts.append(_text((left + right) / 2, bottom + 45, x_label, size=13))
+
+    for line in series:
+        dash = ' stroke-dasharray="8 5"' if line.get('dashed') else ''
+        segment = []
+        # A gap (None) ends the current line segment
+        for index, value in enumerate(line['values'] + [None]):
+            if value is not None:
+                segment.append(point(index, value))
+                continue
+            if len(segment) > 1:
+                coordinates = ' '.join(f'{_number(x)},{_number(y)}' for x, y in segment)
+                parts.append(f'<polyline points="{coordinates}" fill="none" stroke="{line["color"]}" '
+                             f'stroke-width="3"{dash}/>')
+            segment = []
+
+        for index, value in enumerate(line['values']):
+            if value is None:
+                continue
+            x, y = point(index, value)
+            tooltip = html.escape(f"{categories[index]} - {line['name']}: {_number(value)}")
+            parts.append(f'<circle cx="{_number(x)}" cy="{_number(y)}" r="5" fill="{line["color"]}">'
+                         f'<title>{tooltip}</title></circle>')
+
+    # Legend: one row, centered below the axis title
+    entry_widths = [34 + 7 * len(line['name']) for line in series]
+    x = (WIDTH - sum(entry_widths)) / 2
+    y = HEIGHT - 22
+    for line, entry_width in zip(series, entry_widths):
+        dash = ' stroke-dasharray="8 5"' if line.get('dashed') else ''
+        parts.append(f'<line x1="{_number(x)}" y1="{y}" x2="{_number(x + 24)}" y2="{y}" '
+                     f'stroke="{line["color"]}" stroke-width="3"{dash}/>')
+        parts.append(_text(x + 30, y + 4, line['name'], anchor='start'))
+        x += entry_width
+
+    return _svg(parts, title)
+
+
+def scatter_chart_svg(points, title, x_label, y_label, x_range=(0, 100), y_range=(0, 100)):
+    """
+    Renders points connected in order, each colored and labelled by its session.
+
+    Args:
+    points (list): Dicts with 'x', 'y', 'session' (int) and 'name' (str), in drawing order
+    title (str): Accessible name of the chart
+    x_label (str): X axis title
+    y_label (str): Y axis title
+    x_range (tuple): Lowest and highest x value shown
+    y_range (tuple): Lowest and highest y value shown
+
+    Returns:
+    str: SVG markup
+    """
+    area = left, top, right, bottom = _plot_area((60, 20, 30, 60))
+    x_low, x_high = x_range
+    y_low, y_high = y_range
+    parts = _y_axis(area, y_label, y_range)
+
+    for tick in range(x_low, x_high + 1, (x_high - x_low) // 5):
+        x = left + (tick - x_low) / (x_high - x_low) * (right - left)
+        parts.append(_text(x, bottom + 18, tick))
+    parts.append(_text((left + right) / 2, bottom + 45, x_label, size=13))
+
+    def position(point):
+        x = left + (min(max(point['x'], x_low), x_high) - x_low) / (x_high - x_low) * (right - left)
+        y = bottom - (min(max(point['y'], y_low), y_high) - y_low) / (y_high - y_low) * (bottom - top)
+        return x, y
+
+    coordinates = ' '.join(f'{_number(x)},{_number(y)}' for x, y in map(position, points))
+    parts.append(f'<polyline points="{coordinates}" fill="none" stroke="#007bff" stroke-width="2"/>')
+
+    sessions = [point['session'] for point in points]
+    first, last = min(sessions), max(sessions)
+    for point in points:
+        x, y = position(point)
+        share = (point['session'] - first) / (last - first) if last > first else 0
+        color = VIRIDIS[round(share * (len(VIRIDIS) - 1))]
+        tooltip = html.escape(f"{point['name']}: fatigue {_number(point['x'])}, accuracy {_number(point['y'])}%")
+        parts.append(f'<circle cx="{_number(x)}" cy="{_number(y)}" r="7" fill="{color}" stroke="#fff">'
+                     f'<title>{tooltip}</title></circle>')
+        parts.append(_text(x + 10, y - 8, f"V{point['session']}", anchor='start', size=11))
+
+    return _svg(parts, title)
+
+
+def task_progression_svg(task_sessions):
+    """
+    Draws fatigue, effort, concentration and motivation across the vacancies.
+    Sessions missing any of these ratings are left out.
+
+    Returns:
+    str: SVG markup, or '' if fewer than two sessions have all ratings
+    """
+    valid_sessions = [session for session in task_sessions
+                      if all(session[key] for _, key, _, _ in PROGRESSION_SERIES)]
+    if len(valid_sessions) < 2:
+        return ''
+
+    series_config = list(PROGRESSION_SERIES)
+    if any(session['effort_cost_worth'] for session in valid_sessions):
+        series_config.append(EFFORT_WORTH_SERIES)
+
+    series = [{
+        'name': name,
+        'values': [session[key] or None for session in valid_sessions],
+        'color': color,
+        'dashed': dashed,
+    } for name, key, color, dashed in series_config]
+
+    return line_chart_svg([session['session_name'] for session in valid_sessions], series,
+                          title='Task progression trends', x_label='Work Session', y_label='Rating (0-100)')
+
+
+def fatigue_accuracy_svg(task_sessions):
+    """
+    Draws the HR criteria accuracy of each session against the fatigue reported in it.
+
+    Returns:
+    str: SVG markup, or '' if fewer than two sessions have both criteria and fatigue ratings
+    """
+    points = []
+    for session in task_sessions:
+        total = session['criteria_correct'] + session['criteria_incorrect']
+        if total > 0 and session['fatigue_level'] > 0:
+            points.append({
+                'x': session['fatigue_level'],
+                'y': session['criteria_correct'] / total * 100,
+                'session': session['session'],
+                'name': session['session_name'],
+            })
+    if len(points) < 2:
+        return ''
+
+    return scatter_chart_svg(points, title='Task fatigue vs performance accuracy',
+                             x_label='Fatigue Level (0-100)', y_label='Task Accuracy (%)')
+
+
+def get_final_results_charts(participant_code, task_sessions):
+    """
+    Returns the Final Results charts of a participant, rendering them on first use.
+
+    Args:
+    participant_code (str): Cache key; the charts must only be requested in the final round
+    task_sessions (list): Session dicts as assembled by FinalResults.vars_for_template
+
+    Returns:
+    dict: 'task_progression_svg' and 'fatigue_accuracy_svg' (empty strings if not enough data)
+    """
+    with _CHART_CACHE_LOCK:
+        charts = _CHART_CACHE.get(participant_code)
+        if charts is not None:
+            _CHART_CACHE.move_to_end(participant_code)
+            return charts
+
+    charts = {
+        'task_progression_svg': task_progression_svg(task_sessions),
+        'fatigue_accuracy_svg': fatigue_accuracy_svg(task_sessions),
+    }
+
+    with _CHART_CACHE_LOCK:
+        _CHART_CACHE[participant_code] = charts
+        while len(_CHART_CACHE) > CHART_CACHE_SIZE:
+            _CHART_CACHE.popitem(last=False)
+    return charts
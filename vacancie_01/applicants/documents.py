@@ -0,0 +1,598 @@
+"""
+Recruiter mask documents: loads the Word files shown on the Recruiter page and converts them to HTML.
+
+The masks are pre-rendered at build time into static HTML fragments, so server processes
+do not need python-docx. Rebuild after editing any recruiter_maske_*.docx:
+    python -m applicants.documents
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from .metadata import file_sha256
+
+logger = logging.getLogger(__name__)
+
+# Folder containing recruiter_maske_{applicant_id}{doc_suffix}.docx
+APPLICANTS_STATIC_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '_static', 'applicants')
+)
+MASK_FILE_PATTERN = re.compile(r'recruiter_maske_([a-z])(\d+)\.docx')
+
+# Pre-rendered fragments and their manifest
+MASKS_OUTPUT_DIR = os.path.join(APPLICANTS_STATIC_DIR, 'recruiter_masks')
+MASKS_MANIFEST_PATH = os.path.join(MASKS_OUTPUT_DIR, 'manifest.json')
+# Increase whenever convert_docx_to_html() output changes, so old fragments count as stale
+CONVERTER_VERSION = 2
+
+EMPTY_DOCUMENT_HTML = "<p><em>The Word document is empty or could not be read.</em></p>"
+SLOW_DOCUMENT_HTML = "<p><em>This document is still loading. Please reload the page in a moment.</em></p>"
+
+# Concurrent loading on the Recruiter page (override via environment)
+MASK_LOADER_WORKERS = int(os.environ.get('RECRUITER_MASK_WORKERS', 3))
+MASK_LOAD_TIMEOUT_SECONDS = float(os.environ.get('RECRUITER_MASK_TIMEOUT', 5))
+
+
+def recruiter_mask_path(applicant_id, doc_suffix='1'):
+    """
+    Builds the absolute path to a recruiter mask Word document.
+
+    Args:
+    applicant_id (str): Applicant identifier ('a', 'b', or 'c')
+    doc_suffix (str): Vacancy-specific suffix
+
+    Returns:
+    str: Normalized absolute file path
+    """
+    return os.path.join(APPLICANTS_STATIC_DIR, f'recruiter_maske_{applicant_id}{doc_suffix}.docx')
+
+
+def render_recruiter_mask(applicant_id, doc_suffix='1'):
+    """
+    Loads a recruiter mask Word document and converts it to HTML.
+
+    Args:
+    applicant_id (str): Applicant identifier ('a', 'b', or 'c')
+    doc_suffix (str): Vacancy-specific suffix
+
+    Returns:
+    str: HTML content for web display
+
+    Raises:
+    Exception: If the document is missing or cannot be parsed
+    """
+    return convert_docx_to_html(recruiter_mask_path(applicant_id, doc_suffix))
+
+
+_manifest = None  # (mtime_ns, parsed manifest) of the last loaded manifest file
+
+
+def read_mask_manifest(manifest_path=MASKS_MANIFEST_PATH):
+    """
+    Loads the pre-rendered mask manifest, re-reading it only when the file has changed.
+
+    Returns:
+    dict: Manifest contents, or None if missing, unreadable or built by another converter version
+    """
+    global _manifest
+
+    try:
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+        if _manifest and _manifest[0] == mtime_ns:
+            return _manifest[1]
+
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('version') != CONVERTER_VERSION:
+        logger.warning("Recruiter mask manifest %s has version %s, expected %s",
+                       manifest_path, manifest.get('version'), CONVERTER_VERSION)
+        return None
+
+    _manifest = (mtime_ns, manifest)
+    return manifest
+
+
+def load_prerendered_mask(applicant_id, doc_suffix='1'):
+    """
+    Returns the pre-rendered HTML fragment of a recruiter mask if it matches the Word file.
+
+    Returns:
+    str: HTML content, or None if there is no up-to-date fragment
+    """
+    manifest = read_mask_manifest()
+    entry = manifest['masks'].get(f'{applicant_id}{doc_suffix}') if manifest else None
+
+    if entry and entry['sha256'] == file_sha256(recruiter_mask_path(applicant_id, doc_suffix)):
+        with open(os.path.join(MASKS_OUTPUT_DIR, entry['fragment']), encoding='utf-8') as f:
+            return f.read()
+
+    if manifest:
+        logger.warning("Pre-rendered recruiter mask is stale for %s%s, converting Word file instead. "
+                       "Run 'python -m applicants.documents' to update it.", applicant_id, doc_suffix)
+    return None
+
+
+def build_mask_fragments(output_dir=MASKS_OUTPUT_DIR):
+    """
+    Renders all recruiter masks into static HTML fragments and writes the manifest.
+    Nothing is written if any document fails to convert.
+
+    Args:
+    output_dir (str): Target folder for fragments and manifest.json
+
+    Returns:
+    tuple: (manifest, errors) where errors lists one message per failed document
+    """
+    manifest = {'version': CONVERTER_VERSION, 'masks': {}}
+    fragments = {}
+    errors = []
+
+    for file_name in sorted(os.listdir(APPLICANTS_STATIC_DIR)):
+        match = MASK_FILE_PATTERN.fullmatch(file_name)
+        if not match:
+            continue
+        applicant_id, doc_suffix = match.groups()
+
+        try:
+            html_content = render_recruiter_mask(applicant_id, doc_suffix)
+        except Exception as e:
+            errors.append(f'{file_name}: {type(e).__name__}: {e}')
+            continue
+        if html_content == EMPTY_DOCUMENT_HTML:
+            errors.append(f'{file_name}: document has no content')
+            continue
+
+        fragment_name = file_name.replace('.docx', '.html')
+        fragments[fragment_name] = html_content
+        manifest['masks'][f'{applicant_id}{doc_suffix}'] = {
+            'source': file_name,
+            'sha256': file_sha256(recruiter_mask_path(applicant_id, doc_suffix)),
+            'fragment': fragment_name
+        }
+
+    if errors:
+        return manifest, errors
+
+    os.makedirs(output_dir, exist_ok=True)
+    for fragment_name, html_content in fragments.items():
+        with open(os.path.join(output_dir, fragment_name), 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+    # Manifest last, so running servers only see it once all fragments exist
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    return manifest, errors
+
+
+# Converted HTML per (applicant_id, doc_suffix), least recently used first
+_MASK_CACHE = OrderedDict()
+_MASK_CACHE_LOCK = threading.Lock()
+_MASK_CACHE_STATS = {'hits': 0, 'misses': 0, 'evictions': 0}
+# 18 masks (3 applicants x 6 vacancies) fit with the default size, override via environment
+_mask_cache_size = int(os.environ.get('RECRUITER_MASK_CACHE_SIZE', 32))
+
+
+def set_mask_cache_size(max_entries):
+    """
+    Changes the maximum number of cached recruiter masks, evicting the oldest entries if needed.
+
+    Args:
+    max_entries (int): New size limit (0 disables caching)
+    """
+    global _mask_cache_size
+
+    with _MASK_CACHE_LOCK:
+        _mask_cache_size = max(0, int(max_entries))
+        _evict_masks()
+
+
+def get_mask_cache_stats():
+    """
+    Provides hit/miss statistics of the recruiter mask cache for logging.
+
+    Returns:
+    dict: Cache statistics containing:
+        - hits: Masks served from the cache
+        - misses: Masks converted from the Word file
+        - evictions: Entries dropped because of the size limit
+        - entries: Number of cached masks
+        - max_entries: Current size limit
+    """
+    with _MASK_CACHE_LOCK:
+        return dict(_MASK_CACHE_STATS, entries=len(_MASK_CACHE), max_entries=_mask_cache_size)
+
+
+def clear_mask_cache():
+    """
+    Drops all cached recruiter masks and resets the statistics.
+    """
+    with _MASK_CACHE_LOCK:
+        _MASK_CACHE.clear()
+        for key in _MASK_CACHE_STATS:
+            _MASK_CACHE_STATS[key] = 0
+
+
+def _evict_masks():
+    # Caller holds _MASK_CACHE_LOCK
+    while len(_MASK_CACHE) > _mask_cache_size:
+        _MASK_CACHE.popitem(last=False)
+        _MASK_CACHE_STATS['evictions'] += 1
+
+
+def _lookup_mask(key, fingerprint):
+    # Caller holds _MASK_CACHE_LOCK; returns None on a miss without counting it
+    entry = _MASK_CACHE.get(key)
+    if entry and entry[0] == fingerprint:
+        _MASK_CACHE.move_to_end(key)
+        _MASK_CACHE_STATS['hits'] += 1
+        return entry[1]
+    return None
+
+
+def get_cached_mask_html(applicant_id, doc_suffix='1'):
+    """
+    Returns the cached HTML of a recruiter mask without loading anything.
+
+    Returns:
+    str: Cached HTML, or None if the mask is not cached, outdated or missing
+    """
+    try:
+        stat = os.stat(recruiter_mask_path(applicant_id, doc_suffix))
+    except OSError:
+        return None
+    with _MASK_CACHE_LOCK:
+        return _lookup_mask((applicant_id, doc_suffix), (stat.st_mtime_ns, stat.st_size))
+
+
+def load_recruiter_mask_html(applicant_id, doc_suffix='1'):
+    """
+    Returns the HTML of a recruiter mask, converting the Word document only if needed.
+    Cached HTML is reused as long as the file's modification time and size are unchanged.
+    On a miss the pre-rendered fragment is used when it is up to date.
+
+    Args:
+    applicant_id (str): Applicant identifier ('a', 'b', or 'c')
+    doc_suffix (str): Vacancy-specific suffix
+
+    Returns:
+    str: HTML content for web display
+
+    Raises:
+    Exception: If the document is missing or cannot be parsed (errors are not cached)
+    """
+    key = (applicant_id, doc_suffix)
+    stat = os.stat(recruiter_mask_path(applicant_id, doc_suffix))
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+    with _MASK_CACHE_LOCK:
+        html_content = _lookup_mask(key, fingerprint)
+        if html_content is not None:
+            return html_content
+        _MASK_CACHE_STATS['misses'] += 1
+
+    html_content = load_prerendered_mask(applicant_id, doc_suffix)
+    if html_content is None:
+        html_content = render_recruiter_mask(applicant_id, doc_suffix)
+
+    with _MASK_CACHE_LOCK:
+        _MASK_CACHE[key] = (fingerprint, html_content)
+        _MASK_CACHE.move_to_end(key)
+        _evict_masks()
+    return html_content
+
+
+# Thread pool for loading masks concurrently, created on first use
+_LOADER_POOL = None
+_LOADER_POOL_LOCK = threading.Lock()
+
+# Most recent per-document load timings, newest last
+_LOAD_TIMINGS = deque(maxlen=500)
+
+
+def _get_loader_pool():
+    global _LOADER_POOL
+    with _LOADER_POOL_LOCK:
+        if _LOADER_POOL is None:
+            _LOADER_POOL = ThreadPoolExecutor(max_workers=MASK_LOADER_WORKERS,
+                                              thread_name_prefix='recruiter-masks')
+        return _LOADER_POOL
+
+
+def _timed_load(applicant_id, doc_suffix):
+    # Runs on the loader pool; measures the load itself, excluding time spent queued
+    start = time.perf_counter()
+    html_content = load_recruiter_mask_html(applicant_id, doc_suffix)
+    return html_content, time.perf_counter() - start
+
+
+def _record_timing(applicant_id, doc_suffix, status, seconds):
+    timing = {
+        'document': f'recruiter_maske_{applicant_id}{doc_suffix}.docx',
+        'status': status,
+        'ms': round(seconds * 1e3, 2),
+        'timestamp': time.time(),
+    }
+    _LOAD_TIMINGS.append(timing)
+    if status in ('timeout', 'error'):
+        log = logger.warning
+    else:
+        log = logger.debug if status == 'hit' else logger.info
+    log("Recruiter mask %s: %s in %.1f ms", timing['document'], status, timing['ms'])
+    return timing
+
+
+def get_mask_load_timings():
+    """
+    Returns the most recent per-document load timings of the Recruiter page.
+
+    Returns:
+    list: Dicts with keys 'document', 'status' ('hit', 'loaded', 'timeout' or 'error'),
+          'ms' and 'timestamp', oldest first
+    """
+    return list(_LOAD_TIMINGS)
+
+
+def load_recruiter_masks(applicant_ids, doc_suffix='1', timeout=None):
+    """
+    Returns the HTML of several recruiter masks, loading cache misses concurrently.
+    Cached masks are returned directly. Misses are loaded on a bounded thread pool;
+    a document that fails or takes longer than the timeout is replaced by an inline
+    placeholder, so one bad document does not block the page. A timed-out load keeps
+    running and fills the cache for the next request.
+
+    Args:
+    applicant_ids (list): Applicant identifiers ('a', 'b', 'c')
+    doc_suffix (str): Vacancy-specific suffix
+    timeout (float): Seconds to wait per document (default MASK_LOAD_TIMEOUT_SECONDS)
+
+    Returns:
+    dict: Applicant ID -> HTML content (or placeholder)
+    """
+    if timeout is None:
+        timeout = MASK_LOAD_TIMEOUT_SECONDS
+
+    results = {}
+    pending = {}
+    for applicant_id in applicant_ids:
+        start = time.perf_counter()
+        html_content = get_cached_mask_html(applicant_id, doc_suffix)
+        if html_content is not None:
+            results[applicant_id] = html_content
+            _record_timing(applicant_id, doc_suffix, 'hit', time.perf_counter() - start)
+        else:
+            pending[applicant_id] = (_get_loader_pool().submit(_timed_load, applicant_id, doc_suffix),
+                                     time.perf_counter())
+
+    # All documents load in parallel, so each deadline counts from its own submission
+    for applicant_id, (future, submitted) in pending.items():
+        remaining = max(0.0, submitted + timeout - time.perf_counter())
+        try:
+            html_content, seconds = future.result(timeout=remaining)
+            _record_timing(applicant_id, doc_suffix, 'loaded', seconds)
+        except FutureTimeoutError:
+            html_content = SLOW_DOCUMENT_HTML
+            _record_timing(applicant_id, doc_suffix, 'timeout', time.perf_counter() - submitted)
+        except Exception as e:
+            html_content = f"<p><em>Error loading document: {str(e)}</em></p>"
+            _record_timing(applicant_id, doc_suffix, 'error', time.perf_counter() - submitted)
+        results[applicant_id] = html_content
+
+    return results
+
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+BODY_TAG = W_NS + 'body'
+PARAGRAPH_TAG = W_NS + 'p'
+TABLE_TAG = W_NS + 'tbl'
+
+# Run content elements and their text equivalent (same rules as python-docx Run.text)
+RUN_TEXT_TAGS = {W_NS + 'tab': '\t', W_NS + 'ptab': '\t', W_NS + 'cr': '\n', W_NS + 'noBreakHyphen': '-'}
+
+
+def convert_docx_to_html(source):
+    """
+    Processes Word document content and converts it to styled HTML.
+    Streams through word/document.xml once and emits paragraphs, headings and tables
+    in document order, discarding each block once it has been converted.
+
+    Args:
+    source: Path or binary file object of the .docx file
+
+    Returns:
+    str: HTML content with styling ready for web display
+    """
+    from lxml import etree
+
+    html_parts = []
+
+    with zipfile.ZipFile(source) as archive:
+        style_names = read_paragraph_style_names(archive)
+
+        with archive.open('word/document.xml') as document_xml:
+            for event, element in etree.iterparse(document_xml, events=('end',), tag=(PARAGRAPH_TAG, TABLE_TAG)):
+                parent = element.getparent()
+                # Paragraphs and tables inside table cells are handled with their top-level table
+                if parent is None or parent.tag != BODY_TAG:
+                    continue
+
+                if element.tag == PARAGRAPH_TAG:
+                    append_paragraph_html(html_parts, element, style_names)
+                else:
+                    append_table_html(html_parts, element)
+
+                # Free converted blocks so memory stays flat for long documents
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    if not html_parts:
+        return EMPTY_DOCUMENT_HTML
+
+    # Combine all HTML parts into final output
+    return ''.join(html_parts)
+
+
+def read_paragraph_style_names(archive):
+    """
+    Reads paragraph style IDs and display names from word/styles.xml.
+
+    Returns:
+    dict: Style ID -> name (e.g. 'Heading1' -> 'Heading 1'), with the default style under None
+    """
+    from lxml import etree
+
+    style_names = {None: 'Normal'}
+    try:
+        styles_root = etree.fromstring(archive.read('word/styles.xml'))
+    except KeyError:
+        return style_names
+
+    for style in styles_root.iterchildren(W_NS + 'style'):
+        if style.get(W_NS + 'type') != 'paragraph':
+            continue
+        name_element = style.find(W_NS + 'name')
+        name = name_element.get(W_NS + 'val', '') if name_element is not None else ''
+        # Built-in heading styles are stored in lower case ('heading 1')
+        if name.startswith('heading '):
+            name = 'H' + name[1:]
+        style_names[style.get(W_NS + 'styleId')] = name
+        if style.get(W_NS + 'default') in ('1', 'true', 'on'):
+            style_names[None] = name
+
+    return style_names
+
+
+def paragraph_text(paragraph):
+    """
+    Returns the text of a w:p element, including hyperlink runs.
+    """
+    text_parts = []
+    for child in paragraph:
+        if child.tag == W_NS + 'r':
+            runs = [child]
+        elif child.tag == W_NS + 'hyperlink':
+            runs = child.iterchildren(W_NS + 'r')
+        else:
+            continue
+
+        for run in runs:
+            for content in run:
+                if content.tag == W_NS + 't':
+                    text_parts.append(content.text or '')
+                elif content.tag == W_NS + 'br':
+                    # Only line breaks produce text, page and column breaks do not
+                    if content.get(W_NS + 'type', 'textWrapping') == 'textWrapping':
+                        text_parts.append('\n')
+                elif content.tag in RUN_TEXT_TAGS:
+                    text_parts.append(RUN_TEXT_TAGS[content.tag])
+    return ''.join(text_parts)
+
+
+def paragraph_has_bold_run(paragraph):
+    """
+    Checks whether any direct run of a w:p element is formatted bold.
+    """
+    for bold in paragraph.iterfind(f'{W_NS}r/{W_NS}rPr/{W_NS}b'):
+        if bold.get(W_NS + 'val', 'true') not in ('0', 'false', 'off'):
+            return True
+    return False
+
+
+def append_paragraph_html(html_parts, paragraph, style_names):
+    text = paragraph_text(paragraph).strip()
+    if not text:
+        return
+
+    style_element = paragraph.find(f'{W_NS}pPr/{W_NS}pStyle')
+    style_id = style_element.get(W_NS + 'val') if style_element is not None else None
+    style_name = style_names.get(style_id, style_names[None])
+
+    # Convert Word headings to HTML heading tags
+    if style_name.startswith('Heading'):
+        level = 3
+        if 'Heading 1' in style_name:
+            level = 2
+        elif 'Heading 2' in style_name:
+            level = 3
+        html_parts.append(f'<h{level}>{text}</h{level}>')
+    else:
+        # Regular paragraphs with bold text detection
+        if paragraph_has_bold_run(paragraph):
+            html_parts.append(f'<p><strong>{text}</strong></p>')
+        else:
+            html_parts.append(f'<p>{text}</p>')
+
+
+def append_table_html(html_parts, table):
+    html_parts.append('<table style="width:100%; border-collapse: collapse; margin: 10px 0;">')
+
+    cells_above = {}  # Grid column -> (text, bold) of the previous row, for vertically merged cells
+    for row_idx, row in enumerate(table.iterchildren(W_NS + 'tr')):
+        html_parts.append('<tr>')
+
+        grid_before = row.find(f'{W_NS}trPr/{W_NS}gridBefore')
+        grid_offset = int(grid_before.get(W_NS + 'val', 0)) if grid_before is not None else 0
+        row_cells = {}
+
+        for cell in row.iterchildren(W_NS + 'tc'):
+            grid_span = cell.find(f'{W_NS}tcPr/{W_NS}gridSpan')
+            span = int(grid_span.get(W_NS + 'val', 1)) if grid_span is not None else 1
+            v_merge = cell.find(f'{W_NS}tcPr/{W_NS}vMerge')
+
+            if v_merge is not None and v_merge.get(W_NS + 'val', 'continue') == 'continue' \
+                    and grid_offset in cells_above:
+                # Continuation of a vertical merge shows the content of the cell above
+                cell_text, cell_bold = cells_above[grid_offset]
+            else:
+                paragraphs = list(cell.iterchildren(PARAGRAPH_TAG))
+                cell_text = '\n'.join(paragraph_text(paragraph) for paragraph in paragraphs).strip()
+                cell_bold = any(paragraph_has_bold_run(paragraph) for paragraph in paragraphs)
+
+            # Horizontally merged cells are repeated once per spanned grid column
+            for _ in range(span):
+                row_cells[grid_offset] = (cell_text, cell_bold)
+                # Style header cells differently
+                if row_idx == 0 or cell_bold:
+                    html_parts.append(
+                        f'<td style="border: 1px solid #ddd; padding: 5px; font-weight: bold; background-color: #f5f5f5;">{cell_text}</td>')
+                else:
+                    html_parts.append(f'<td style="border: 1px solid #ddd; padding: 5px;">{cell_text}</td>')
+                grid_offset += 1
+
+        cells_above = row_cells
+        html_parts.append('</tr>')
+
+    html_parts.append('</table>')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render recruiter mask Word documents into HTML fragments.")
+    parser.add_argument('--output', default=MASKS_OUTPUT_DIR, help="Output folder")
+    args = parser.parse_args()
+
+    manifest, errors = build_mask_fragments(args.output)
+    if errors:
+        for error in errors:
+            print(f"FAILED {error}")
+        raise SystemExit(f"{len(errors)} recruiter mask(s) could not be converted, nothing written")
+
+    for key, entry in manifest['masks'].items():
+        print(f"{entry['source']} -> {entry['fragment']}")
+    print(f"Wrote {len(manifest['masks'])} fragments and manifest to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+Running per-participant summary of the fatigue and cognitive measurements.
+
+The summary is updated whenever a participant submits SelfAssessment or CognitiveTest and is
+stored in the participant field 'fatigue_summary' (see settings.PARTICIPANT_FIELDS). Besides
+the baseline and the values of each vacancy, it keeps per measure the running sum, count and
+the first and last valid value, so Final Results and the data export read trends and averages
+directly instead of going over all rounds. As on the Final Results page, only values above 0
+count as valid.
+"""
+import copy
+
+SUMMARY_VERSION = 1
+SUMMARY_FIELD = 'fatigue_summary'
+
+# Player fields measured at the baseline and after each vacancy
+BASELINE_MEASURES = (
+    'baseline_kss_alertness', 'baseline_mfi_concentration', 'baseline_mfi_wander',
+    'baseline_zfe_dread', 'baseline_motivation', 'baseline_afi_follow',
+)
+SELF_ASSESSMENT_MEASURES = (
+    'fatigue_level', 'mental_effort', 'concentration_difficulty', 'motivation_level', 'effort_cost_worth',
+)
+COGNITIVE_TEST_MEASURES = ('cognitive_test_score', 'cognitive_test_reaction_time')
+
+
+def new_summary():
+    """
+    Returns an empty summary.
+
+    Returns:
+    dict: Summary with keys:
+        - version: SUMMARY_VERSION
+        - baseline: Baseline measure -> value
+        - vacancies: Vacancy number -> {measure: value}
+        - measures: Measure -> {'sum', 'count', 'first', 'last'} over valid vacancy values,
+                    where first and last are [vacancy number, value] or None
+    """
+    return {'version': SUMMARY_VERSION, 'baseline': {}, 'vacancies': {}, 'measures': {}}
+
+
+def is_valid(value):
+    return value is not None and value > 0
+
+
+def record_baseline(summary, values):
+    """
+    Stores baseline measurements (values may be None if a question was skipped).
+    """
+    summary['baseline'].update(values)
+
+
+def record_vacancy(summary, vacancy_number, values):
+    """
+    Adds or replaces measurements of one vacancy and updates the running statistics.
+
+    Args:
+    summary (dict): Summary from new_summary(), modified in place
+    vacancy_number (int): Vacancy the values belong to (1-6)
+    values (dict): Measure -> value (None if not answered)
+    """
+    recorded = summary['vacancies'].setdefault(vacancy_number, {})
+
+    for measure, value in values.items():
+        previous = recorded.get(measure)
+        recorded[measure] = value
+        stats = summary['measures'].setdefault(measure, {'sum': 0, 'count': 0, 'first': None, 'last': None})
+
+        if is_valid(previous):
+            stats['sum'] -= previous
+            stats['count'] -= 1
+        if is_valid(value):
+            stats['sum'] += value
+            stats['count'] += 1
+            if stats['first'] is None or vacancy_number <= stats['first'][0]:
+                stats['first'] = [vacancy_number, value]
+            if stats['last'] is None or vacancy_number >= stats['last'][0]:
+                stats['last'] = [vacancy_number, value]
+        elif is_valid(previous):
+            # A valid value was replaced by an invalid one, the endpoints may have moved
+            valid = [(number, vacancy[measure]) for number, vacancy in sorted(summary['vacancies'].items())
+                     if is_valid(vacancy.get(measure))]
+            stats['first'] = list(valid[0]) if valid else None
+            stats['last'] = list(valid[-1]) if valid else None
+
+
+def valid_values(summary, measure):
+    """
+    Returns the valid values of a measure in vacancy order.
+    """
+    return [vacancy[measure] for _, vacancy in sorted(summary['vacancies'].items())
+            if is_valid(vacancy.get(measure))]
+
+
+def measure_change(summary, measure):
+    """
+    Returns last minus first valid value, or 0 with fewer than two valid values.
+    """
+    stats = summary['measures'].get(measure)
+    if not stats or stats['count'] < 2:
+        return 0
+    return stats['last'][1] - stats['first'][1]
+
+
+def measure_average(summary, measure):
+    """
+    Returns the mean of the valid values, or 0 if there are none.
+    """
+    stats = summary['measures'].get(measure)
+    if not stats or not stats['count']:
+        return 0
+    return stats['sum'] / stats['count']
+
+
+def summary_metrics(summary, max_vacancies):
+    """
+    Derives the progression metrics shown on the Final Results page.
+
+    Args:
+    summary (dict): Participant summary
+    max_vacancies (int): Number of per-vacancy values to report
+
+    Returns:
+    dict: Changes first -> last vacancy, averages, and the n-th valid fatigue and cognitive
+          values with the changes between them (0 where not available)
+    """
+    metrics = {
+        'task_fatigue_increase': measure_change(summary, 'fatigue_level'),
+        'task_cognitive_decline': -measure_change(summary, 'cognitive_test_score'),
+        'task_effort_increase': measure_change(summary, 'mental_effort'),
+        'task_motivation_change': measure_change(summary, 'motivation_level'),
+
+        'average_task_fatigue': measure_average(summary, 'fatigue_level'),
+        'average_task_effort': measure_average(summary, 'mental_effort'),
+        'average_task_concentration': measure_average(summary, 'concentration_difficulty'),
+        'average_task_motivation': measure_average(summary, 'motivation_level'),
+    }
+
+    fatigue_values = valid_values(summary, 'fatigue_level')
+    cognitive_values = valid_values(summary, 'cognitive_test_score')
+    for n in range(1, max_vacancies + 1):
+        metrics[f'v{n}_fatigue'] = fatigue_values[n - 1] if len(fatigue_values) >= n else 0
+        metrics[f'v{n}_cognitive'] = cognitive_values[n - 1] if len(cognitive_values) >= n else 0
+    # Fatigue increase and cognitive decline from one vacancy to the next
+    for n in range(1, max_vacancies):
+        metrics[f'v{n}_to_v{n + 1}_fatigue_change'] = (fatigue_values[n] - fatigue_values[n - 1]
+                                                       if len(fatigue_values) > n else 0)
+        metrics[f'v{n}_to_v{n + 1}_cognitive_change'] = (cognitive_values[n - 1] - cognitive_values[n]
+                                                         if len(cognitive_values) > n else 0)
+    return metrics
+
+
+def get_fatigue_summary(participant):
+    """
+    Returns the participant's summary, or None if nothing was recorded yet.
+    """
+    summary = participant.vars.get(SUMMARY_FIELD)
+    if summary and summary.get('version') == SUMMARY_VERSION:
+        return summary
+    return None
+
+
+def record_measurements(player, vacancy_number, measures):
+    """
+    Copies the given fields of a player into the participant's summary.
+
+    Args:
+    player (Player): Player who just submitted a page
+    vacancy_number (int): Vacancy of the player's round, 0 for the baseline
+    measures (tuple): Player field names to record
+
+    Returns:
+    dict: Updated summary
+    """
+    participant = player.participant
+    values = {measure: player.field_maybe_none(measure) for measure in measures}
+
+    # Work on a copy, so a failed update never leaves a half-written summary behind
+    summary = copy.deepcopy(get_fatigue_summary(participant) or new_summary())
+    if vacancy_number:
+        record_vacancy(summary, vacancy_number, values)
+    else:
+        record_baseline(summary, values)
+
+    setattr(participant, SUMMARY_FIELD, summary)
+    return summary
+
+
+def summary_from_rounds(rounds, baseline_round, vacancy_rounds):
+    """
+    Builds a summary from already loaded round data, for participants who started before
+    summaries were recorded.
+
+    Args:
+    rounds (dict): Round number -> field values (see models.load_round_summaries)
+    baseline_round (int): Round of the baseline measurement
+    vacancy_rounds (tuple): Round of each vacancy, in vacancy order
+
+    Returns:
+    dict: Summary as maintained by record_measurements()
+    """
+    summary = new_summary()
+    baseline = rounds.get(baseline_round, {})
+    record_baseline(summary, {measure: baseline.get(measure)
+                              for measure in BASELINE_MEASURES + COGNITIVE_TEST_MEASURES})
+    for vacancy_number, round_number in enumerate(vacancy_rounds, start=1):
+        if round_number in rounds:
+            record_vacancy(summary, vacancy_number, {
+                measure: rounds[round_number].get(measure)
+                for measure in SELF_ASSESSMENT_MEASURES + COGNITIVE_TEST_MEASURES
+            })
+    return summary
@@ -0,0 +1,252 @@
+"""
+Image optimization for the sticky notes and page graphics under _static/applicants/.
+
+Pages refer to images by logical name without extension ('StickyNotes_6', 'notebook').
+An offline build step resizes each image to the largest size it is displayed at,
+recompresses it as WebP and in its original format, and writes a manifest mapping each
+logical name to its source file and to the lightest variant. Missing images, duplicate
+sources and extensions that do not match the file contents fail the build instead of
+showing a broken image during a timed session.
+
+Requires Pillow at build time only (pip install Pillow). Rebuild after editing any image:
+    python -m applicants.images
+"""
+import argparse
+import json
+import logging
+import os
+
+from .assets import asset_is_current, build_asset_manifest, resolve_asset
+from .documents import APPLICANTS_STATIC_DIR
+from .metadata import file_sha256
+
+logger = logging.getLogger(__name__)
+
+IMAGE_MANIFEST_VERSION = 1
+IMAGE_MANIFEST_PATH = os.path.join(APPLICANTS_STATIC_DIR, 'image_manifest.json')
+VARIANTS_DIR = 'images'  # Relative to APPLICANTS_STATIC_DIR
+BUILD_COMMAND = 'python -m applicants.images'
+
+# Image formats by file extension, as reported by Pillow
+IMAGE_FORMATS = {'.jpg': 'JPEG', '.jpeg': 'JPEG', '.png': 'PNG'}
+
+# Largest width each image is displayed at (CSS pixels x 2 for high-density screens)
+IMAGE_MAX_WIDTHS = {
+    'notebook': 700,                # 350px catalog button on the Business Partner page
+    'job_description_cover': 480,   # 220px cover on the HR Coordinator page
+}
+for _vacancy_number in range(1, 7):
+    IMAGE_MAX_WIDTHS[f'StickyNotes_{_vacancy_number}'] = 1200  # Full-screen modal
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+_manifest = None
+
+
+def find_image_sources(logical_name, static_dir=APPLICANTS_STATIC_DIR):
+    """
+    Lists the files on disk that match a logical image name.
+
+    Returns:
+    list: File names such as ['StickyNotes_6.png'], in IMAGE_FORMATS order
+    """
+    return [logical_name + extension for extension in IMAGE_FORMATS
+            if os.path.isfile(os.path.join(static_dir, logical_name + extension))]
+
+
+def check_image_source(logical_name, static_dir=APPLICANTS_STATIC_DIR):
+    """
+    Validates that exactly one readable source exists and its extension matches its format.
+
+    Returns:
+    tuple: (source file name or None, list of error messages)
+    """
+    from PIL import Image
+
+    sources = find_image_sources(logical_name, static_dir)
+    if not sources:
+        return None, [f"{logical_name}: no source image ({', '.join(IMAGE_FORMATS)})"]
+    if len(sources) > 1:
+        return None, [f"{logical_name}: several source images {sources}"]
+
+    source = sources[0]
+    try:
+        with Image.open(os.path.join(static_dir, source)) as image:
+            actual_format = image.format
+    except Exception as e:
+        return None, [f"{source}: cannot be read: {type(e).__name__}: {e}"]
+
+    expected_format = IMAGE_FORMATS[os.path.splitext(source)[1]]
+    if actual_format != expected_format:
+        return None, [f"{source}: file contains {actual_format} data, extension expects {expected_format}"]
+    return source, []
+
+
+def render_variants(logical_name, source, max_width, static_dir=APPLICANTS_STATIC_DIR):
+    """
+    Resizes an image to max_width (never upscaling) and encodes it as WebP and in its source format.
+
+    Returns:
+    list: Variants as dicts with 'file' (relative name), 'width', 'height', 'data' (bytes)
+    """
+    import io
+    from PIL import Image
+
+    with Image.open(os.path.join(static_dir, source)) as image:
+        image.load()
+        if image.width > max_width:
+            height = round(image.height * max_width / image.width)
+            image = image.resize((max_width, height), Image.LANCZOS)
+
+        has_alpha = image.mode in ('RGBA', 'LA', 'P')
+        encodings = [('webp', {'format': 'WEBP', 'quality': WEBP_QUALITY, 'method': 6})]
+        if has_alpha:
+            encodings.append(('png', {'format': 'PNG', 'optimize': True}))
+        else:
+            encodings.append(('jpg', {'format': 'JPEG', 'quality': JPEG_QUALITY,
+                                      'optimize': True, 'progressive': True}))
+
+        variants = []
+        for extension, options in encodings:
+            buffer = io.BytesIO()
+            converted = image if has_alpha or image.mode == 'RGB' else image.convert('RGB')
+            converted.save(buffer, **options)
+            variants.append({
+                'file': f'{VARIANTS_DIR}/{logical_name}.w{image.width}.{extension}',
+                'width': image.width,
+                'height': image.height,
+                'data': buffer.getvalue(),
+            })
+        return variants
+
+
+def build_image_variants(static_dir=APPLICANTS_STATIC_DIR, manifest_path=IMAGE_MANIFEST_PATH):
+    """
+    Validates all images, writes their variants and the image manifest.
+    Nothing is written if any image fails validation.
+
+    Returns:
+    tuple: (manifest, errors) where errors lists one message per invalid image
+    """
+    manifest = {'version': IMAGE_MANIFEST_VERSION, 'images': {}}
+    outputs = {}
+    errors = []
+
+    for logical_name, max_width in sorted(IMAGE_MAX_WIDTHS.items()):
+        source, source_errors = check_image_source(logical_name, static_dir)
+        if source_errors:
+            errors.extend(source_errors)
+            continue
+
+        source_size = os.path.getsize(os.path.join(static_dir, source))
+        variants = render_variants(logical_name, source, max_width, static_dir)
+        for variant in variants:
+            outputs[variant['file']] = variant.pop('data')
+            variant['size'] = len(outputs[variant['file']])
+
+        # Lightest file wins; the original is kept if no variant is smaller
+        lightest = min(variants, key=lambda variant: variant['size'])
+        manifest['images'][logical_name] = {
+            'source': source,
+            'sha256': file_sha256(os.path.join(static_dir, source)),
+            'size': source_size,
+            'variants': variants,
+            'best': lightest['file'] if lightest['size'] < source_size else source,
+        }
+
+    if errors:
+        return manifest, errors
+
+    variants_dir = os.path.join(static_dir, VARIANTS_DIR)
+    os.makedirs(variants_dir, exist_ok=True)
+    for file_name in os.listdir(variants_dir):
+        if f'{VARIANTS_DIR}/{file_name}' not in outputs:
+            os.remove(os.path.join(variants_dir, file_name))  # Variant of an older build
+    for relative_path, data in outputs.items():
+        with open(os.path.join(static_dir, relative_path), 'wb') as f:
+            f.write(data)
+
+    # Manifest last, so running servers only see it once all variants exist
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    return manifest, errors
+
+
+def read_image_manifest(manifest_path=IMAGE_MANIFEST_PATH):
+    """
+    Loads the image manifest, re-reading it only when the file has changed.
+
+    Returns:
+    dict: Images (logical name -> entry), empty if missing or of another version
+    """
+    global _manifest
+
+    try:
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+        if _manifest and _manifest[0] == mtime_ns:
+            return _manifest[1]
+
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get('version') != IMAGE_MANIFEST_VERSION:
+        logger.warning("Image manifest %s has version %s, expected %s",
+                       manifest_path, manifest.get('version'), IMAGE_MANIFEST_VERSION)
+        return {}
+
+    _manifest = (mtime_ns, manifest['images'])
+    return manifest['images']
+
+
+def resolve_image(logical_name):
+    """
+    Returns the static file name to show for a logical image name.
+
+    Args:
+    logical_name (str): Image name without extension, e.g. 'StickyNotes_6'
+
+    Returns:
+    str: Lightest up-to-date variant (content-hashed where possible). Falls back to the
+         source image found on disk if the manifest is missing or stale.
+    """
+    entry = read_image_manifest().get(logical_name)
+    if entry and asset_is_current(entry['source'], entry, BUILD_COMMAND) \
+            and os.path.isfile(os.path.join(APPLICANTS_STATIC_DIR, entry['best'])):
+        return resolve_asset(entry['best'])
+
+    sources = find_image_sources(logical_name)
+    if not sources:
+        logger.warning("No image found for %s", logical_name)
+        return logical_name
+    return resolve_asset(sources[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resize and recompress applicant images into a manifest.")
+    parser.parse_args()
+
+    manifest, errors = build_image_variants()
+    if errors:
+        for error in errors:
+            print(f"FAILED {error}")
+        raise SystemExit(f"{len(errors)} image(s) failed validation, nothing written")
+
+    for logical_name, entry in manifest['images'].items():
+        best_size = entry['size']
+        for variant in entry['variants']:
+            if variant['file'] == entry['best']:
+                best_size = variant['size']
+        print(f"{entry['source']:<28} {entry['size'] / 1024:>7.1f} KB -> {entry['best']:<36} {best_size / 1024:>7.1f} KB")
+
+    # Variants need content-hashed URLs as well
+    build_asset_manifest()
+    print(f"Wrote {len(manifest['images'])} images and updated the asset manifest")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,455 @@
+"""
+Live synchronization and autosave of the HR coordinator's evaluation within a group.
+
+The HR Coordinator page sends every change of a criterion over oTree's live channel
+(Player.live_evaluation). The server holds the group's evaluation and is the only place
+it changes: each accepted change gets the next sequence number and is pushed as a delta
+to all members of the group, who render the ranking from their copy. A page that sees a
+gap in the sequence numbers, or (re)connects, asks for a snapshot instead.
+
+Changes are saved as EvaluationPatch rows (models.py), one per changed criterion, but not
+on every message: they are collected per group and written at most once every
+AUTOSAVE_INTERVAL seconds, when the page reports a pause in editing, and when the HR
+coordinator submits. Repeated edits of a criterion in between are written once. When the
+HR Coordinator page is reloaded, the evaluation is rebuilt from the stored patches plus
+the ones not written yet. The unsaved changes live in the server process, which assumes a
+single server process, as oTree runs.
+
+Each change is also scored as it arrives: the changed criterion is checked against the
+vacancy's answer index (metadata.build_answer_index) and the group's correct/incorrect
+counts are adjusted by its old and new verdict. Every patch stores the verdict and the
+counts after the change, a timestamped correctness trace of the vacancy, and submitting
+the page only writes the counts to the player (finalize_evaluation).
+
+Messages from the browser:
+    {'type': 'sync'}                                                  -> snapshot to the sender
+    {'type': 'set', 'name': str, 'scores': {id: int}, 'relevance': str}    (HR coordinator)
+    {'type': 'delete', 'name': str}                                        (HR coordinator)
+    {'type': 'flush'}                             -> save unsaved changes (HR coordinator)
+Messages to the browser:
+    {'type': 'snapshot', 'seq': int, 'criteria': {name: criterion}}
+    {'type': 'delta', 'seq': int, 'name': str, 'criterion': dict or None (deleted)}
+
+oTree only delivers live messages to players on the sender's page. The Recruiter,
+HR Coordinator and Business Partner pages share one live method, and
+install_shared_live_pages() extends delivery to all pages of a round that share it.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .metadata import validate_criterion
+
+logger = logging.getLogger(__name__)
+
+MAX_CRITERION_NAME_LENGTH = 200
+
+# Seconds between two autosaves of a group while its HR coordinator is editing
+AUTOSAVE_INTERVAL = float(os.environ.get('HR_AUTOSAVE_INTERVAL', 5))
+EVALUATION_CACHE_SIZE = 256
+
+# Parameters of otree.live._live_send_back that install_shared_live_pages() relies on
+LIVE_SEND_BACK_PARAMETERS = ['session_code', 'page_index', 'pcode_retval']
+
+# Group id -> {'evaluation', 'scoring', 'pending': {name: patch}, 'saved_at'}, least recently used first
+_EVALUATIONS = OrderedDict()
+_EVALUATIONS_LOCK = threading.Lock()
+
+
+def new_evaluation():
+    """
+    Returns an empty group evaluation.
+
+    Returns:
+    dict: Evaluation with keys:
+        - seq: Sequence number of the last accepted change (0 = none yet)
+        - criteria: Criterion name -> {'name', 'scores': {applicant_id: score}, 'relevance'}
+    """
+    return {'seq': 0, 'criteria': {}}
+
+
+def clean_criterion(message, applicant_ids, score_range, relevance_factors):
+    """
+    Validates a 'set' message from the browser.
+
+    Args:
+    message (dict): Message with 'name', 'scores' and 'relevance'
+    applicant_ids (list): Valid applicant IDs
+    score_range (tuple): Lowest and highest valid score
+    relevance_factors (dict): Valid relevance levels ('' = not chosen yet)
+
+    Returns:
+    dict: Criterion as stored in the evaluation
+
+    Raises:
+    ValueError: If the message is malformed
+    """
+    name = message.get('name')
+    if not isinstance(name, str) or not name.strip() or len(name) > MAX_CRITERION_NAME_LENGTH:
+        raise ValueError(f"invalid criterion name: {name!r}")
+
+    scores = message.get('scores') or {}
+    if not isinstance(scores, dict):
+        raise ValueError(f"invalid scores: {scores!r}")
+    low, high = score_range
+    for applicant_id, score in scores.items():
+        if applicant_id not in applicant_ids or type(score) is not int or not low <= score <= high:
+            raise ValueError(f"invalid score {score!r} for applicant {applicant_id!r}")
+
+    relevance = message.get('relevance') or ''
+    if relevance and relevance not in relevance_factors:
+        raise ValueError(f"invalid relevance: {relevance!r}")
+
+    return {'name': name.strip(), 'scores': dict(scores), 'relevance': relevance}
+
+
+def clean_submitted_criteria(submitted_criteria, applicant_ids, score_range, relevance_factors):
+    """
+    Validates the criteria the HR Coordinator page posts with the form (validation_data_json)
+    like live 'set' messages. Malformed entries are logged and left out.
+
+    Args:
+    submitted_criteria (dict): Criterion name -> {'scores', 'relevance'}
+    applicant_ids, score_range, relevance_factors: See clean_criterion()
+
+    Returns:
+    tuple: (criteria, skipped) - valid criteria by cleaned name, and the (stripped) names
+           of the entries left out
+    """
+    criteria = {}
+    skipped = set()
+    for name, data in submitted_criteria.items():
+        try:
+            if not isinstance(data, dict):
+                raise ValueError(f"invalid criterion data: {data!r}")
+            criterion = clean_criterion(dict(data, name=name), applicant_ids, score_range, relevance_factors)
+        except ValueError as e:
+            logger.warning("Ignoring submitted criterion: %s", e)
+            skipped.add(name.strip())
+            continue
+        criteria[criterion['name']] = criterion
+    return criteria, skipped
+
+
+def apply_change(evaluation, name, criterion):
+    """
+    Stores (or with criterion None removes) a criterion and advances the sequence number.
+
+    Returns:
+    dict: Delta message for the group, or None if the change does not alter the evaluation
+    """
+    if evaluation['criteria'].get(name) == criterion:
+        return None
+    if criterion is None:
+        del evaluation['criteria'][name]
+    else:
+        evaluation['criteria'][name] = criterion
+    evaluation['seq'] += 1
+    return {'type': 'delta', 'seq': evaluation['seq'], 'name': name, 'criterion': criterion}
+
+
+def new_scoring():
+    """
+    Returns the correctness state of an empty evaluation.
+
+    Returns:
+    dict: Scoring with keys:
+        - verdicts: Criterion name -> whether it is correct
+        - correct/incorrect: Number of correct and incorrect criteria
+    """
+    return {'verdicts': {}, 'correct': 0, 'incorrect': 0}
+
+
+def score_change(scoring, name, criterion, answer_index):
+    """
+    Replaces the verdict of one criterion and adjusts the counts, so that they always equal
+    metadata.validate_criteria() over the whole evaluation.
+
+    Args:
+    scoring (dict): Scoring from new_scoring(), modified in place
+    name (str): Changed criterion
+    criterion (dict): New criterion, None if deleted
+    answer_index (dict): Lookup from metadata.build_answer_index()
+
+    Returns:
+    bool: Whether the criterion is now correct, None if deleted
+    """
+    previous = scoring['verdicts'].pop(name, None)
+    if previous is not None:
+        scoring['correct' if previous else 'incorrect'] -= 1
+    if criterion is None:
+        return None
+
+    # The page submits a relevance that was not chosen yet as 'normal'
+    data = {'scores': criterion['scores'], 'relevance': criterion['relevance'] or 'normal'}
+    correct = validate_criterion(name, data, answer_index)['correct']
+    scoring['verdicts'][name] = correct
+    scoring['correct' if correct else 'incorrect'] += 1
+    return correct
+
+
+def evaluation_from_patches(patches):
+    """
+    Rebuilds an evaluation by applying patches in sequence order.
+
+    Args:
+    patches (list): Dicts with 'seq', 'name' and 'criterion' (None = deleted)
+    """
+    evaluation = new_evaluation()
+    for patch in sorted(patches, key=lambda patch: patch['seq']):
+        if patch['criterion'] is None:
+            evaluation['criteria'].pop(patch['name'], None)
+        else:
+            evaluation['criteria'][patch['name']] = patch['criterion']
+        evaluation['seq'] = patch['seq']
+    return evaluation
+
+
+def load_stored_patches(group):
+    from .models import EvaluationPatch
+
+    return [{
+        'seq': row.seq,
+        'name': row.criterion_name,
+        'criterion': json.loads(row.criterion_json) if row.criterion_json else None,
+        'time': row.created,
+    } for row in EvaluationPatch.filter(group=group)]
+
+
+def write_patches(group, player, patches):
+    from .models import EvaluationPatch
+
+    for patch in patches:
+        EvaluationPatch.create(
+            group=group, player=player, seq=patch['seq'], criterion_name=patch['name'],
+            criterion_json=json.dumps(patch['criterion']) if patch['criterion'] is not None else '',
+            created=patch['time'], correct=patch['correct'],
+            correct_total=patch['correct_total'], incorrect_total=patch['incorrect_total'],
+        )
+
+
+def _group_entry(group, answer_index):
+    """
+    Returns the cached evaluation state of a group, loading it from the stored patches on
+    first use. Groups with unsaved changes are never dropped from the cache.
+    """
+    with _EVALUATIONS_LOCK:
+        entry = _EVALUATIONS.get(group.id)
+        if entry is not None:
+            _EVALUATIONS.move_to_end(group.id)
+            return entry
+
+    evaluation = evaluation_from_patches(load_stored_patches(group))
+    scoring = new_scoring()
+    for name, criterion in evaluation['criteria'].items():
+        score_change(scoring, name, criterion, answer_index)
+
+    entry = {
+        'evaluation': evaluation,
+        'scoring': scoring,
+        'pending': {},
+        'saved_at': time.monotonic(),
+    }
+    with _EVALUATIONS_LOCK:
+        entry = _EVALUATIONS.setdefault(group.id, entry)
+        for group_id in list(_EVALUATIONS):
+            if len(_EVALUATIONS) <= EVALUATION_CACHE_SIZE:
+                break
+            if not _EVALUATIONS[group_id]['pending']:
+                del _EVALUATIONS[group_id]
+    return entry
+
+
+def get_evaluation(group, answer_index):
+    """
+    Returns the group's current evaluation, including changes not saved yet.
+    Used by HRCoordinator.vars_for_template to restore the page after a reload.
+    """
+    return _group_entry(group, answer_index)['evaluation']
+
+
+def save_evaluation(group, player, answer_index):
+    """
+    Writes the group's unsaved changes as patches and the current correct/incorrect counts
+    to the player (the HR coordinator).
+
+    Returns:
+    int: Number of patches written
+    """
+    entry = _group_entry(group, answer_index)
+    with _EVALUATIONS_LOCK:
+        patches = list(entry['pending'].values())
+        entry['pending'] = {}
+        entry['saved_at'] = time.monotonic()
+        correct, incorrect = entry['scoring']['correct'], entry['scoring']['incorrect']
+    write_patches(group, player, patches)
+    player.criteria_correct_this_session = correct
+    player.criteria_incorrect_this_session = incorrect
+    return len(patches)
+
+
+def record_change(group, player, name, criterion, answer_index):
+    """
+    Applies and scores a change of the group's evaluation, and saves the unsaved changes if
+    the last save is at least AUTOSAVE_INTERVAL seconds ago.
+
+    Returns:
+    dict: Delta message for the group, or None if nothing changed
+    """
+    entry = _group_entry(group, answer_index)
+    with _EVALUATIONS_LOCK:
+        delta = apply_change(entry['evaluation'], name, criterion)
+        if delta is None:
+            return None
+        scoring = entry['scoring']
+        correct = score_change(scoring, name, criterion, answer_index)
+        # Only the latest change of a criterion needs to be written
+        entry['pending'].pop(name, None)
+        entry['pending'][name] = {
+            'seq': delta['seq'], 'name': name, 'criterion': criterion, 'time': time.time(),
+            'correct': correct, 'correct_total': scoring['correct'], 'incorrect_total': scoring['incorrect'],
+        }
+        due = time.monotonic() - entry['saved_at'] >= AUTOSAVE_INTERVAL
+
+    if due:
+        save_evaluation(group, player, answer_index)
+    return delta
+
+
+def finalize_evaluation(group, player, answer_index, submitted_criteria, applicant_ids, score_range,
+                        relevance_factors):
+    """
+    Completes the evaluation when the HR coordinator submits: saves it and writes the final
+    correct/incorrect counts to the player.
+
+    Live messages sent right before the submit can be lost with the page, so the criteria
+    posted with the form (Criterion name -> {'scores', 'relevance'}) are compared with the
+    live evaluation first and only the criteria that differ are recorded and scored.
+    Posted entries that fail validation change nothing.
+
+    Args:
+    submitted_criteria (dict): Posted criteria, None if the form carried none
+    applicant_ids, score_range, relevance_factors: See clean_criterion()
+
+    Returns:
+    tuple: (correct_count, incorrect_count)
+    """
+    if submitted_criteria is not None:
+        criteria, skipped = clean_submitted_criteria(submitted_criteria, applicant_ids, score_range,
+                                                     relevance_factors)
+        current = dict(_group_entry(group, answer_index)['evaluation']['criteria'])
+        for name in current.keys() - criteria.keys() - skipped:
+            record_change(group, player, name, None, answer_index)
+        for name, criterion in criteria.items():
+            live = current.get(name)
+            # The form posts 'normal' for a relevance the live evaluation holds as not chosen
+            if live is None or live['scores'] != criterion['scores'] or \
+                    (live['relevance'] or 'normal') != (criterion['relevance'] or 'normal'):
+                record_change(group, player, name, criterion, answer_index)
+
+    save_evaluation(group, player, answer_index)
+    return player.criteria_correct_this_session, player.criteria_incorrect_this_session
+
+
+def snapshot_message(evaluation):
+    # Copied, the cached evaluation may change before the message is sent
+    return {'type': 'snapshot', 'seq': evaluation['seq'], 'criteria': dict(evaluation['criteria'])}
+
+
+def handle_message(player, message, can_edit, applicant_ids, score_range, relevance_factors, answer_index):
+    """
+    Processes one live message of a group member.
+
+    Args:
+    player (Player): Sender
+    message (dict): Message as sent by the browser
+    can_edit (bool): Whether the sender may change the evaluation (HR coordinator)
+    applicant_ids, score_range, relevance_factors: See clean_criterion()
+    answer_index (dict): Lookup from metadata.build_answer_index() for scoring changes
+
+    Returns:
+    tuple: (message, broadcast) - the reply, and whether it goes to the whole group
+           rather than only the sender; (None, False) if there is nothing to send
+    """
+    group = player.group
+    message_type = message.get('type') if isinstance(message, dict) else None
+
+    if message_type == 'sync':
+        return snapshot_message(get_evaluation(group, answer_index)), False
+
+    if message_type not in ('set', 'delete', 'flush'):
+        logger.warning("Ignoring live evaluation message of unknown type %r", message_type)
+        return None, False
+    if not can_edit:
+        logger.warning("Ignoring live evaluation change from a player who is not the HR coordinator")
+        return None, False
+
+    if message_type == 'flush':
+        save_evaluation(group, player, answer_index)
+        return None, False
+
+    try:
+        if message_type == 'set':
+            criterion = clean_criterion(message, applicant_ids, score_range, relevance_factors)
+            name = criterion['name']
+        else:
+            criterion = None
+            name = message.get('name')
+            if not isinstance(name, str):
+                raise ValueError(f"invalid criterion name: {name!r}")
+            name = name.strip()
+    except ValueError as e:
+        logger.warning("Ignoring live evaluation message: %s", e)
+        return None, False
+
+    delta = record_change(group, player, name, criterion, answer_index)
+    return delta, delta is not None
+
+
+def shared_live_page_indexes(session_code, page_index):
+    """
+    Returns the page indexes of the round of page_index whose pages share its live method.
+    """
+    from otree.lookup import _get_session_lookups
+
+    pages = _get_session_lookups(session_code)
+    sender = pages[page_index]
+    live_method = sender.page_class.live_method
+    if not live_method:
+        return [page_index]
+    return [index for index, page in pages.items()
+            if page.app_name == sender.app_name and page.round_number == sender.round_number
+            and page.page_class.live_method == live_method]
+
+
+def install_shared_live_pages():
+    """
+    Makes oTree deliver live method replies to group members on any page of the same round
+    that uses the same live method, not only to those on the sender's page.
+
+    Wraps oTree's private otree.live._live_send_back (oTree 5.11, see requirements.txt) and
+    raises RuntimeError if it is missing or its signature changed, rather than leaving the
+    pages without shared replies.
+    """
+    import inspect
+    import otree.live
+
+    if getattr(otree.live, 'shares_live_pages', False):
+        return
+
+    live_send_back = getattr(otree.live, '_live_send_back', None)
+    if not inspect.iscoroutinefunction(live_send_back) or \
+            list(inspect.signature(live_send_back).parameters) != LIVE_SEND_BACK_PARAMETERS:
+        raise RuntimeError("otree.live._live_send_back is missing or has changed; shared live pages need "
+                           f"an async _live_send_back({', '.join(LIVE_SEND_BACK_PARAMETERS)}) as in oTree 5.11")
+
+    async def send_back_to_shared_pages(session_code, page_index, pcode_retval):
+        # Recipients listen on the index of their own page; sockets of other pages get nothing
+        for index in shared_live_page_indexes(session_code, page_index):
+            await live_send_back(session_code, index, pcode_retval)
+
+    otree.live._live_send_back = send_back_to_shared_pages
+    otree.live.shares_live_pages = True
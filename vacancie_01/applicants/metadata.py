@@ -0,0 +1,359 @@
+"""
+Metadata compilation for the applicants app.
+
+Parses the Excel metadata files (metadata1.xlsx - metadata6.xlsx) into the criteria structure
+used by the HR Coordinator and Business Partner pages, and writes a compiled JSON snapshot so
+server processes can load the criteria without importing pandas/openpyxl.
+
+Usage (from the project directory, after editing any metadata file):
+    python -m applicants.metadata
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Increase whenever the structure produced by parse_metadata_file() changes
+SNAPSHOT_VERSION = 1
+METADATA_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '_static', 'applicants')
+)
+SNAPSHOT_PATH = os.path.join(METADATA_DIR, 'metadata_compiled.json')
+METADATA_FILES = [os.path.join(METADATA_DIR, f'metadata{vacancy_number}.xlsx') for vacancy_number in range(1, 7)]
+
+
+APPLICANT_IDS = ['a', 'b', 'c']
+POINT_FIELDS = [f'requirement_point_is_{points}' for points in range(9)]  # 0-8
+
+
+def parse_metadata_file(file_path):
+    """
+    Parses one Excel metadata file into the criteria structure.
+
+    Args:
+    file_path (str): Path to the Excel metadata file
+
+    Returns:
+    dict: Organized criteria data containing:
+        - criteria: List of all criteria with scores and metadata
+        - predefined_criteria: List of criteria that should be pre-loaded in HR interface
+        - categories: List of unique category names
+        - criteria_by_category: Dictionary grouping criteria by category
+    """
+    import pandas as pd  # Only needed when no up-to-date snapshot exists
+
+    # Load Excel file with pandas (header=1 means second row contains headers)
+    df = pd.read_excel(file_path, header=1)
+
+    return organize_criteria(compile_criteria_frame(df))
+
+
+def compile_criteria_frame(df):
+    """
+    Converts a metadata DataFrame into criterion dictionaries.
+    Null handling, stripping and int casting run once per column instead of once per cell.
+
+    Args:
+    df (DataFrame): Metadata sheet with 'requirement_*' and 'applicant_*_points' columns
+
+    Returns:
+    list: Criterion dictionaries for all rows with a non-empty requirement name
+    """
+    import pandas as pd
+
+    def text_column(name, default=None):
+        # Stripped strings, with default for missing cells (or None to mark them as missing)
+        if name not in df.columns:
+            return pd.Series(default, index=df.index, dtype=object)
+        column = df[name]
+        text = column.astype(str).str.strip().astype(object)
+        return text.where(column.notna(), default)
+
+    def points_column(name):
+        if name not in df.columns:
+            return pd.Series(0, index=df.index)
+        return df[name].fillna(0).astype('int64')
+
+    # Only process rows with valid criterion names
+    names = text_column('requirement_name', '')
+    valid = (names != '').to_numpy()
+
+    def values(column):
+        return column[valid].tolist()
+
+    rows = zip(
+        values(names),
+        values(text_column('requirement_category', 'general')),
+        values(text_column('requirement_relevance', 'normal')),
+        values(text_column('requirement_need_defined_by', 'tender')),
+        *(values(points_column(f'applicant_{applicant_id}_points')) for applicant_id in APPLICANT_IDS),
+        *(values(text_column(point_field)) for point_field in POINT_FIELDS)
+    )
+
+    criteria_data = []  # List of all criteria objects
+    for name, category, relevance, need_defined_by, score_a, score_b, score_c, *point_values in rows:
+        # Build criterion object with all metadata
+        criterion = {
+            'name': name,
+            'category': category,
+            'relevance': relevance,
+            'need_defined_by': need_defined_by,
+            'scores': {
+                'applicant_a': score_a,
+                'applicant_b': score_b,
+                'applicant_c': score_c,
+            }
+        }
+
+        # Add Business Partner point descriptions
+        for point_field, point_value in zip(POINT_FIELDS, point_values):
+            if point_value is not None:
+                criterion[point_field] = point_value
+
+        criteria_data.append(criterion)
+
+    return criteria_data
+
+
+def organize_criteria(criteria_data):
+    """
+    Builds the predefined list and category grouping for a list of parsed criteria in a single pass.
+    The snapshot only stores the criteria list, this restores the full structure on load.
+
+    Args:
+    criteria_data (list): Criterion dictionaries as produced by compile_criteria_frame()
+
+    Returns:
+    dict: Organized criteria data as described in parse_metadata_file()
+    """
+    predefined_criteria = []  # List of predefined criteria for auto-loading
+    criteria_by_category = {}  # Category -> criteria, in order of first appearance
+
+    for criterion in criteria_data:
+        # Check if this criterion should be predefined in HR interface
+        if criterion['need_defined_by'].lower() == 'predefined':
+            predefined_criteria.append(criterion)
+
+        criteria_by_category.setdefault(criterion['category'], []).append(criterion)
+
+    return {
+        'criteria': criteria_data,
+        'predefined_criteria': predefined_criteria,
+        'categories': list(criteria_by_category),
+        'criteria_by_category': criteria_by_category
+    }
+
+
+def normalize_criterion_name(name):
+    """
+    Normalizes a criterion name for matching player input against the metadata.
+    """
+    return str(name).strip().lower()
+
+
+def build_answer_index(criteria_data):
+    """
+    Builds a lookup from normalized criterion name to the correct scores and relevance.
+    Built once per vacancy so validation does not scan the whole catalog per submitted criterion.
+
+    Args:
+    criteria_data (list): Criterion dictionaries as produced by compile_criteria_frame()
+
+    Returns:
+    dict: Normalized name -> {'scores': {'a': int, 'b': int, 'c': int}, 'relevance': str}
+    """
+    answer_index = {}
+    for criterion in criteria_data:
+        key = normalize_criterion_name(criterion['name'])
+        # First occurrence wins if a name appears twice in the sheet
+        if key not in answer_index:
+            answer_index[key] = {
+                'scores': {
+                    applicant_id: int(criterion['scores'].get(f'applicant_{applicant_id}', 0))
+                    for applicant_id in APPLICANT_IDS
+                },
+                'relevance': criterion.get('relevance', 'normal')
+            }
+    return answer_index
+
+
+def validate_criterion(criterion_name, data, answer_index):
+    """
+    Checks one evaluated criterion against the answer index.
+
+    Args:
+    criterion_name (str): Criterion name as entered/selected by the player
+    data (dict): Player input with 'scores' ({applicant_id: score}) and 'relevance'
+    answer_index (dict): Lookup from build_answer_index()
+
+    Returns:
+    dict: Verdict containing:
+        - name: Criterion name as submitted
+        - found: Whether the criterion exists in the metadata
+        - wrong_scores: Applicant IDs whose entered score differs from the correct one
+        - relevance_correct: Whether the relevance level matches
+        - correct: True only if found, all scores match and relevance matches
+    """
+    expected = answer_index.get(normalize_criterion_name(criterion_name))
+    if expected is None:
+        return {'name': criterion_name, 'found': False, 'wrong_scores': [],
+                'relevance_correct': False, 'correct': False}
+
+    entered_scores = data.get('scores') or {}
+    wrong_scores = []
+    for applicant_id, correct_score in expected['scores'].items():
+        try:
+            entered_score = int(entered_scores.get(applicant_id) or 0)
+        except (TypeError, ValueError):
+            entered_score = None  # Unparseable input never matches
+        if entered_score != correct_score:
+            wrong_scores.append(applicant_id)
+
+    relevance_correct = data.get('relevance', 'normal') == expected['relevance']
+
+    return {
+        'name': criterion_name,
+        'found': True,
+        'wrong_scores': wrong_scores,
+        'relevance_correct': relevance_correct,
+        'correct': not wrong_scores and relevance_correct
+    }
+
+
+def validate_criteria(criteria_data, answer_index):
+    """
+    Validates all criteria a player evaluated, in time linear in the number of submitted criteria.
+    Criteria that do not exist in the metadata count as incorrect.
+
+    Args:
+    criteria_data (dict): Criterion name -> player input (see validate_criterion)
+    answer_index (dict): Lookup from build_answer_index()
+
+    Returns:
+    tuple: (correct_count, incorrect_count, verdicts) with one verdict per submitted criterion
+    """
+    verdicts = [validate_criterion(name, data, answer_index) for name, data in criteria_data.items()]
+    correct_count = sum(1 for verdict in verdicts if verdict['correct'])
+    return correct_count, len(verdicts) - correct_count, verdicts
+
+
+def file_sha256(file_path):
+    """
+    Computes the content hash used to detect stale snapshot entries.
+
+    Args:
+    file_path (str): Path to the file
+
+    Returns:
+    str: Hex-encoded SHA-256 digest of the file contents
+    """
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_snapshot(metadata_files=None, snapshot_path=SNAPSHOT_PATH):
+    """
+    Parses metadata files and writes the compiled snapshot.
+    When only some files are given, the entries of the other files are kept from the
+    existing snapshot (if it has the current version).
+
+    Args:
+    metadata_files (list, optional): Excel files to compile, defaults to METADATA_FILES
+    snapshot_path (str): Output path of the JSON snapshot
+
+    Returns:
+    dict: The written snapshot
+    """
+    snapshot = {'version': SNAPSHOT_VERSION, 'files': {}}
+    if metadata_files:
+        existing = read_snapshot(snapshot_path)
+        if existing:
+            snapshot['files'].update(existing['files'])
+
+    for file_path in metadata_files or METADATA_FILES:
+        snapshot['files'][os.path.basename(file_path)] = {
+            'sha256': file_sha256(file_path),
+            'criteria': parse_metadata_file(file_path)['criteria']
+        }
+
+    # Write to a temporary file first so running servers never read a half-written snapshot
+    tmp_path = snapshot_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, snapshot_path)
+
+    return snapshot
+
+
+_snapshot = None  # (mtime_ns, parsed snapshot) of the last loaded snapshot file
+
+
+def read_snapshot(snapshot_path=SNAPSHOT_PATH):
+    """
+    Loads the compiled snapshot, re-reading it only when the file has changed.
+
+    Returns:
+    dict: Snapshot contents, or None if missing, unreadable or of another version
+    """
+    global _snapshot
+
+    try:
+        mtime_ns = os.stat(snapshot_path).st_mtime_ns
+        if _snapshot and _snapshot[0] == mtime_ns:
+            return _snapshot[1]
+
+        with open(snapshot_path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        logger.warning("Metadata snapshot %s has version %s, expected %s",
+                       snapshot_path, snapshot.get('version'), SNAPSHOT_VERSION)
+        return None
+
+    _snapshot = (mtime_ns, snapshot)
+    return snapshot
+
+
+def load_compiled_metadata(file_path, snapshot_path=SNAPSHOT_PATH):
+    """
+    Returns the criteria structure for a metadata file.
+    Uses the compiled snapshot if it matches the file contents, otherwise parses the Excel file.
+
+    Args:
+    file_path (str): Path to the Excel metadata file
+    snapshot_path (str): Path of the JSON snapshot
+
+    Returns:
+    dict: Criteria data as described in parse_metadata_file()
+    """
+    snapshot = read_snapshot(snapshot_path)
+    entry = snapshot['files'].get(os.path.basename(file_path)) if snapshot else None
+
+    if entry and entry['sha256'] == file_sha256(file_path):
+        return organize_criteria(entry['criteria'])
+
+    if snapshot:
+        logger.warning("Metadata snapshot is stale for %s, parsing Excel file instead. "
+                       "Run 'python -m applicants.metadata' to update it.", file_path)
+    return parse_metadata_file(file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile metadata Excel files into a JSON snapshot.")
+    parser.add_argument('files', nargs='*', help="Excel files to compile (default: all six vacancies)")
+    parser.add_argument('--output', default=SNAPSHOT_PATH, help="Snapshot path")
+    args = parser.parse_args()
+
+    snapshot = compile_snapshot(args.files or None, args.output)
+    for name, entry in snapshot['files'].items():
+        print(f"{name}: {len(entry['criteria'])} criteria")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,14 @@
 from otree.api import *
-import pandas as pd
+from .metadata import load_compiled_metadata, build_answer_index, validate_criteria
+from .assets import resolve_asset
+from .images import resolve_image
+from .live_sync import handle_message as handle_live_evaluation_message, clean_submitted_criteria
+from .fatigue_summary import SELF_ASSESSMENT_MEASURES, get_fatigue_summary, new_summary, \
+    measure_average, measure_change
+import json
 import os
+import threading
+from collections import OrderedDict
 
 doc = """
 Mental Fatigue Experiment: 8 rounds: Baseline + 6 Vacancies + Final Results
@@ -28,11 +36,11 @@ class Applicant:
         self.description = description
         self.doc_suffix = doc_suffix
 
-    def get_documents(self):
+    def get_document_names(self):
         """
-        Generates file paths for applicant documents based on current vacancy.
+        Generates logical file names of the applicant documents for the current vacancy.
         Returns:
-        dict: Document paths with keys 'cv', 'job_reference', 'cover_letter'
+        dict: Paths relative to _static/applicants/ with keys 'cv', 'job_reference', 'cover_letter'
         """
         return {
             'cv': f'applicants_{self.id}/cv_{self.id}{self.doc_suffix}.pdf',
@@ -40,6 +48,15 @@ class Applicant:
             'cover_letter': f'applicants_{self.id}/cover_letter_{self.id}{self.doc_suffix}.pdf'
         }
 
+    def get_documents(self):
+        """
+        Generates file paths for applicant documents based on current vacancy.
+        Paths are content-hashed (see assets.py) so browsers can cache them permanently.
+        Returns:
+        dict: Document paths with keys 'cv', 'job_reference', 'cover_letter'
+        """
+        return {document: resolve_asset(logical_name) for document, logical_name in self.get_document_names().items()}
+
     def to_dict(self):
         """
         Converts applicant object to dictionary format for template usage.
@@ -56,9 +73,150 @@ class Applicant:
         }
 
 
+class ReadOnlyDict(dict):
+    """
+    Dictionary that rejects modification after construction.
+    Used for cached metadata shared between all players of a server process.
+    Keeps the plain dict representation so templates render it unchanged.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached metadata is read-only, copy it before modifying")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return ReadOnlyDict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """
+    List that rejects modification after construction.
+    Counterpart of ReadOnlyDict for cached criteria lists.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached metadata is read-only, copy it before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return ReadOnlyList, (list(self),)
+
+
+def freeze_metadata(value, _memo=None):
+    """
+    Recursively converts dictionaries and lists into their read-only counterparts.
+    Objects referenced several times (e.g. a criterion in 'criteria' and 'criteria_by_category')
+    stay shared in the frozen copy.
+
+    Args:
+    value: Parsed metadata structure (dicts, lists, strings, numbers)
+
+    Returns:
+    Read-only copy of the structure
+    """
+    if _memo is None:
+        _memo = {}
+    if id(value) in _memo:
+        return _memo[id(value)]
+
+    if isinstance(value, dict):
+        frozen = ReadOnlyDict({key: freeze_metadata(item, _memo) for key, item in value.items()})
+    elif isinstance(value, list):
+        frozen = ReadOnlyList(freeze_metadata(item, _memo) for item in value)
+    else:
+        return value
+
+    _memo[id(value)] = frozen
+    return frozen
+
+
+# Compiled metadata per vacancy number, shared by all requests of this process
+_METADATA_CACHE = {}
+_METADATA_CACHE_LOCK = threading.Lock()
+_METADATA_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def get_metadata_cache_stats():
+    """
+    Provides hit/miss counters of the metadata cache for logging.
+
+    Returns:
+    dict: Cache statistics containing:
+        - hits: Requests served from the cache
+        - misses: Requests that had to parse the Excel file
+        - entries: Number of cached vacancies
+    """
+    with _METADATA_CACHE_LOCK:
+        return {
+            'hits': _METADATA_CACHE_STATS['hits'],
+            'misses': _METADATA_CACHE_STATS['misses'],
+            'entries': len(_METADATA_CACHE)
+        }
+
+
+def clear_metadata_cache():
+    """
+    Drops all cached metadata and resets the hit/miss counters.
+    """
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE.clear()
+        _METADATA_CACHE_STATS['hits'] = 0
+        _METADATA_CACHE_STATS['misses'] = 0
+
+
+def get_cached_metadata(cache_key, file_path):
+    """
+    Returns compiled criteria for a metadata file, parsing it only when needed.
+    The cached entry is reused as long as the file's modification time and size are unchanged,
+    so edited Excel files are picked up without restarting the server.
+    On a miss the compiled snapshot is used when it is up to date (see metadata.py).
+
+    Args:
+    cache_key: Vacancy number the metadata belongs to
+    file_path (str): Path to the Excel metadata file
+
+    Returns:
+    ReadOnlyDict: Compiled criteria structure (see metadata.parse_metadata_file)
+    """
+    stat = os.stat(file_path)
+    fingerprint = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(cache_key)
+        if entry and entry[0] == fingerprint:
+            _METADATA_CACHE_STATS['hits'] += 1
+            return entry[1]
+        _METADATA_CACHE_STATS['misses'] += 1
+
+    # Parse outside the lock so other vacancies are not blocked meanwhile
+    metadata = load_compiled_metadata(file_path)
+    metadata['answer_index'] = build_answer_index(metadata['criteria'])
+    metadata = freeze_metadata(metadata)
+
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[cache_key] = (fingerprint, metadata)
+    return metadata
+
+
+# Returned when a vacancy's metadata cannot be loaded
+EMPTY_METADATA = freeze_metadata({
+    'criteria': [],
+    'predefined_criteria': [],
+    'categories': [],
+    'criteria_by_category': {},
+    'answer_index': {}
+})
+
+
 def load_metadata_criteria(round_number=None, player=None):
     """
     Loads evaluation criteria from Excel metadata files for current vacancy.
+    Parsed files are cached per vacancy, the returned structure is shared and read-only.
 
     Returns:
     dict: Organized criteria data containing:
@@ -66,168 +224,237 @@ def load_metadata_criteria(round_number=None, player=None):
         - predefined_criteria: List of criteria that should be pre-loaded in HR interface
         - categories: List of unique category names
         - criteria_by_category: Dictionary grouping criteria by category
+        - answer_index: Correct scores and relevance by normalized criterion name
     """
     try:
         # Determine which metadata files to use based on vacancy
-        if round_number and player:
-            vacancy_info = get_vacancy_info(round_number, player)
-            if vacancy_info:
-                metadata_paths = vacancy_info['metadata_files']
-            else:
-                # Fallback to all three files if vacancy info not available
-                metadata_paths = ['_static/applicants/metadata1.xlsx', '_static/applicants/metadatanew.xlsx']
-
-        # Find first existing metadata file from the paths list
-        file_path = None
-        for path in metadata_paths:
-            if os.path.exists(path):
-                file_path = path
-                break
-
-        if not file_path:
-            raise FileNotFoundError("metadata Excel file not found")
-
-        # Load Excel file with pandas (header=1 means second row contains headers)
-        df = pd.read_excel(file_path, header=1)
-
-        criteria_data = []  # List of all criteria objects
-        predefined_criteria = []  # List of predefined criteria for auto-loading
-        categories = []  # List of unique category names
-
-        for index, row in df.iterrows():
-            name_value = row.get('requirement_name')
-            category_value = row.get('requirement_category')
-            relevance_value = row.get('requirement_relevance')
-            need_defined_by = row.get('requirement_need_defined_by')  # Check for predefined criteria
-
-            applicant_a_score = row.get('applicant_a_points')
-            applicant_b_score = row.get('applicant_b_points')
-            applicant_c_score = row.get('applicant_c_points')
-
-            # Only process rows with valid criterion names
-            if pd.notna(name_value) and str(name_value).strip():
-                # Build criterion object with all metadata
-                criterion = {
-                    'name': str(name_value).strip(),
-                    'category': str(category_value).strip() if pd.notna(category_value) else 'general',
-                    'relevance': str(relevance_value).strip() if pd.notna(relevance_value) else 'normal',
-                    'need_defined_by': str(need_defined_by).strip() if pd.notna(need_defined_by) else 'tender',
-                    'scores': {
-                        'applicant_a': int(applicant_a_score) if pd.notna(applicant_a_score) else 0,
-                        'applicant_b': int(applicant_b_score) if pd.notna(applicant_b_score) else 0,
-                        'applicant_c': int(applicant_c_score) if pd.notna(applicant_c_score) else 0,
-                    }
-                }
-
-                # Add Business Partner point descriptions
-                for points in range(9):  # 0-8
-                    point_field = f'requirement_point_is_{points}'
-                    point_value = row.get(point_field)
-                    if pd.notna(point_value):
-                        criterion[point_field] = str(point_value).strip()
-
-                # Add criterion to main list
-                criteria_data.append(criterion)
-
-                # Check if this criterion should be predefined in HR interface
-                if need_defined_by and str(need_defined_by).strip().lower() == 'predefined':
-                    predefined_criteria.append(criterion)
-
-                if criterion['category'] not in categories:
-                    categories.append(criterion['category'])
-
-        # Organize criteria by category for template dropdown menus
-        criteria_by_category = {}
-        for category in categories:
-            criteria_by_category[category] = [
-                c for c in criteria_data if c['category'] == category
-            ]
-
-        return {
-            'criteria': criteria_data,
-            'predefined_criteria': predefined_criteria,
-            'categories': categories,
-            'criteria_by_category': criteria_by_category
-        }
+        vacancy_info = get_vacancy_info(round_number, player) if round_number and player else None
+        return load_vacancy_metadata(vacancy_info)
 
     except Exception as e:
-        return {
-            'criteria': [],
-            'predefined_criteria': [],
-            'categories': [],
-            'criteria_by_category': {}
-        }
+        return EMPTY_METADATA
+
+
+class LazyConstant:
+    """
+    Class attribute that is computed on first access and cached afterwards.
+    Keeps expensive constants (Excel metadata, applicant data) out of module import time,
+    so server start and devserver reloads do not pay for them.
+    """
+
+    def __init__(self, compute):
+        """
+        Args:
+        compute (callable): Function without arguments returning the constant's value
+        """
+        self.compute = compute
+        self.lock = threading.Lock()
+        self.computed = False
+        self.value = None
+
+    def __get__(self, instance, owner):
+        if not self.computed:
+            with self.lock:
+                if not self.computed:
+                    self.value = self.compute()
+                    self.computed = True
+        return self.value
+
+
+def load_vacancy_metadata(vacancy_info=None):
+    """
+    Loads the cached criteria structure for a vacancy configuration.
+
+    Args:
+    vacancy_info (dict, optional): Vacancy configuration from get_vacancy_config().
+                                If None, defaults to vacancy 1 metadata.
+
+    Returns:
+    ReadOnlyDict: Criteria data as described in load_metadata_criteria()
+
+    Raises:
+    FileNotFoundError: If none of the vacancy's metadata files exists
+    """
+    vacancy_number = None
+    # Fallback to vacancy 1 files if vacancy info not available (e.g. baseline round, no player)
+    metadata_paths = ['_static/applicants/metadata1.xlsx', '_static/applicants/metadatanew.xlsx']
+
+    if vacancy_info:
+        metadata_paths = vacancy_info['metadata_files']
+        vacancy_number = vacancy_info['vacancy']
+
+    # Find first existing metadata file from the paths list
+    file_path = None
+    for path in metadata_paths:
+        if os.path.exists(path):
+            file_path = path
+            break
+
+    if not file_path:
+        raise FileNotFoundError("metadata Excel file not found")
+
+    return get_cached_metadata(vacancy_number, file_path)
+
+
+# Structure of the experiment: baseline, up to MAX_VACANCIES vacancies, final results
+MAX_VACANCIES = 6
+FIRST_VACANCY_ROUND = 2
+
+# Session config keys (see settings.py) and their defaults
+DEFAULT_VACANCY_SETTINGS = {
+    'num_vacancies': MAX_VACANCIES,
+    'vacancy_duration_minutes': 12,
+    'first_vacancy_unlimited': True,  # Vacancy 1 is a practice run without time limit
+}
+
+APPLICANT_NAMES = {'a': 'Applicant A', 'b': 'Applicant B', 'c': 'Applicant C'}
+
+
+class VacancyRegistry:
+    """
+    Immutable lookup of all vacancies of one session configuration.
+    Built once per configuration, so page methods only do a dictionary lookup
+    instead of rebuilding vacancy settings and applicant data on every call.
+    """
+    __slots__ = ('num_vacancies', 'vacancies', 'vacancy_rounds', '_by_round')
+
+    def __init__(self, num_vacancies, vacancy_duration_minutes, first_vacancy_unlimited):
+        """
+        Args:
+        num_vacancies (int): Number of vacancies played (1 to MAX_VACANCIES)
+        vacancy_duration_minutes (int): Time limit of each timed vacancy
+        first_vacancy_unlimited (bool): Whether vacancy 1 has no time limit
+
+        Raises:
+        ValueError: If the number of vacancies or the duration is out of range
+        """
+        if not 1 <= num_vacancies <= MAX_VACANCIES:
+            raise ValueError(f"num_vacancies must be between 1 and {MAX_VACANCIES}, got {num_vacancies}")
+        if vacancy_duration_minutes <= 0:
+            raise ValueError(f"vacancy_duration_minutes must be positive, got {vacancy_duration_minutes}")
+
+        vacancies = []
+        for vacancy_number in range(1, num_vacancies + 1):
+            unlimited = vacancy_number == 1 and first_vacancy_unlimited
+            doc_suffix = str(vacancy_number)
+            vacancies.append(freeze_metadata({
+                'vacancy': vacancy_number,
+                'round_number': FIRST_VACANCY_ROUND + vacancy_number - 1,
+                'duration_seconds': None if unlimited else round(vacancy_duration_minutes * 60),
+                'metadata_files': [f'_static/applicants/metadata{vacancy_number}.xlsx'],
+                'doc_suffix': doc_suffix,
+                'job_desc_file': f'job_description_{vacancy_number}.pdf',
+                'email_file': f'Email_{vacancy_number}.pdf',
+                'sticky_notes_image': f'StickyNotes_{vacancy_number}',
+                # Logical document names; content-hashed URLs are resolved per request
+                'applicants': [
+                    {'id': applicant_id, 'name': name, 'description': 'Recruiter Mask',
+                     'documents': Applicant(applicant_id, name, '', doc_suffix).get_document_names()}
+                    for applicant_id, name in APPLICANT_NAMES.items()
+                ],
+            }))
+
+        set_slot = super().__setattr__
+        set_slot('num_vacancies', num_vacancies)
+        set_slot('vacancies', tuple(vacancies))
+        set_slot('vacancy_rounds', tuple(vacancy['round_number'] for vacancy in vacancies))
+        set_slot('_by_round', {vacancy['round_number']: vacancy for vacancy in vacancies})
+
+    def __setattr__(self, name, value):
+        raise TypeError("VacancyRegistry is read-only")
+
+    def for_round(self, round_number):
+        """
+        Returns the vacancy played in a round, or None for baseline, results and unused rounds.
+        """
+        return self._by_round.get(round_number)
+
+    def is_vacancy_round(self, round_number):
+        return round_number in self._by_round
+
+
+_VACANCY_REGISTRIES = {}
+_VACANCY_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_vacancy_registry(session_config=None):
+    """
+    Returns the vacancy registry for a session configuration, building it on first use.
+
+    Args:
+    session_config (dict, optional): Session config; missing keys use DEFAULT_VACANCY_SETTINGS
+
+    Returns:
+    VacancyRegistry: Shared, read-only registry
+
+    Raises:
+    ValueError: If the configured vacancies are invalid
+    """
+    settings = DEFAULT_VACANCY_SETTINGS if not session_config else {
+        key: session_config.get(key, default) for key, default in DEFAULT_VACANCY_SETTINGS.items()
+    }
+    key = (int(settings['num_vacancies']), float(settings['vacancy_duration_minutes']),
+           bool(settings['first_vacancy_unlimited']))
+
+    registry = _VACANCY_REGISTRIES.get(key)
+    if registry is None:
+        with _VACANCY_REGISTRIES_LOCK:
+            registry = _VACANCY_REGISTRIES.get(key)
+            if registry is None:
+                registry = _VACANCY_REGISTRIES[key] = VacancyRegistry(*key)
+    return registry
+
+
+DEFAULT_VACANCY_REGISTRY = get_vacancy_registry()
+
+
+def get_player_vacancy_registry(player):
+    """
+    Returns the vacancy registry of the player's session (the default one without a session).
+    """
+    session = getattr(player, 'session', None)
+    return get_vacancy_registry(session.config if session is not None else None)
 
 
 def get_vacancy_info(round_number, player):
     """
-    Maps round numbers to vacancy periods for the 5-round structure.
+    Maps a round number to the vacancy played in it.
 
     Args:
-    round_number (int): Current round number (1-5)
-    player (Player): Player object (not used but kept for consistency)
+    round_number (int): Round number (1 to C.NUM_ROUNDS)
+    player (Player): Player whose session config defines the vacancies (None for the defaults)
 
     Returns:
-    dict: Vacancy configuration from get_vacancy_config(), or None if baseline/results rounds
-    """
-    from . import models  # Import to avoid circular import
-
-    if round_number == models.C.VACANCY_1_ROUND:
-        return get_vacancy_config(1)
-    elif round_number == models.C.VACANCY_2_ROUND:
-        return get_vacancy_config(2)
-    elif round_number == models.C.VACANCY_3_ROUND:
-        return get_vacancy_config(3)
-    elif round_number == models.C.VACANCY_4_ROUND:
-        return get_vacancy_config(4)
-    elif round_number == models.C.VACANCY_5_ROUND:
-        return get_vacancy_config(5)
-    elif round_number == models.C.VACANCY_6_ROUND:
-        return get_vacancy_config(6)
-    else:
-        return None
+    dict: Vacancy configuration (see get_vacancy_config), or None if baseline/results rounds
+    """
+    return get_player_vacancy_registry(player).for_round(round_number)
 
 
 def get_vacancy_config(vacancy_number):
     """
-    Provides vacancy-specific settings with unlimited time for Vacancy 1.
+    Provides the settings of a vacancy in the default session configuration.
 
     Args:
         vacancy_number (int): Vacancy identifier (1-6)
 
     Returns:
-        dict: Vacancy configuration containing:
+        ReadOnlyDict: Vacancy configuration containing:
             - vacancy: Vacancy number (1-6)
+            - round_number: Round in which the vacancy is played
             - duration_seconds: None for vacancy 1 (unlimited), 720s (12 minutes) for vacancies 2-6
             - metadata_files: List with Excel metadata file path
             - doc_suffix: String suffix for document versioning ('1' to '6')
             - job_desc_file: PDF filename for job description
+            - email_file: PDF filename of the Business Partner's email
+            - sticky_notes_image: Logical image name of the Business Partner's sticky notes (see images.py)
+            - applicants: Applicants with logical document names (see get_applicants_data_for_vacancy)
     """
-    if vacancy_number == 1:
-        job_desc_file = 'job_description_1.pdf'
-    elif vacancy_number == 2:
-        job_desc_file = 'job_description_2.pdf'
-    elif vacancy_number == 3:
-        job_desc_file = 'job_description_3.pdf'
-    elif vacancy_number == 4:
-        job_desc_file = 'job_description_4.pdf'
-    elif vacancy_number == 5:
-        job_desc_file = 'job_description_5.pdf'
-    else:  # vacancy_number == 6
-        job_desc_file = 'job_description_6.pdf'
-
-    return {
-        'vacancy': vacancy_number,
-        'duration_seconds': None if vacancy_number == 1 else 12 * 60,  # Unlimited for V1, 12min for V2, V3
-        'metadata_files': [f'_static/applicants/metadata{vacancy_number}.xlsx'],
-        'doc_suffix': str(vacancy_number),
-        'job_desc_file': job_desc_file
-    }
+    return DEFAULT_VACANCY_REGISTRY.vacancies[vacancy_number - 1]
 
 
 def get_applicants_data_for_vacancy(vacancy_info=None):
     """
-    Creates applicant objects with appropriate document suffixes for current vacancy.
+    Provides the applicants of a vacancy with content-hashed document paths.
 
     Args:
     vacancy_info (dict, optional): Vacancy configuration from get_vacancy_config().
@@ -240,21 +467,16 @@ def get_applicants_data_for_vacancy(vacancy_info=None):
         - description: Role description placeholder
         - documents: Dictionary with CV, job reference, and cover letter paths
     """
-    applicants = []
-
-    # Extract document suffix from vacancy info, default to '1' for vacancy 1
-    doc_suffix = vacancy_info['doc_suffix'] if vacancy_info else '1'
-
-    # Create three standard applicants with vacancy-specific document suffixes
-    applicant_a = Applicant('a', 'Applicant A', 'Recruiter Mask', doc_suffix)
-    applicant_b = Applicant('b', 'Applicant B', 'Recruiter Mask', doc_suffix)
-    applicant_c = Applicant('c', 'Applicant C', 'Recruiter Mask', doc_suffix)
+    if not vacancy_info:
+        vacancy_info = get_vacancy_config(1)
 
-    # Add all applicants to list
-    applicants.extend([applicant_a, applicant_b, applicant_c])
-
-    # Convert applicant objects to dictionaries for template usage
-    return [applicant.to_dict() for applicant in applicants]
+    return [{
+        'id': applicant['id'],
+        'name': applicant['name'],
+        'description': applicant['description'],
+        'documents': {document: resolve_asset(logical_name)
+                      for document, logical_name in applicant['documents'].items()},
+    } for applicant in vacancy_info['applicants']]
 
 
 def get_applicant_ids():
@@ -265,24 +487,175 @@ def get_applicant_ids():
     Returns:
     list: Applicant IDs ['a', 'b', 'c']
     """
-    applicants = get_applicants_data_for_vacancy()
-    return [applicant['id'] for applicant in applicants]
+    return list(APPLICANT_NAMES)
 
 
-def should_show_vacancy_session(round_number):
+def should_show_vacancy_session(round_number, player=None):
     """
     Determines if current round should display vacancy task sessions.
 
     Args:
         round_number (int): Current round number to check (1-8)
+        player (Player, optional): Player whose session config defines the vacancies
+
+    Returns:
+        bool: True if a vacancy is played in the round, False otherwise
+    """
+    return get_player_vacancy_registry(player).is_vacancy_round(round_number)
+
+
+def is_measurement_round(round_number, player=None):
+    """
+    Checks whether fatigue and cognitive measurements are taken in a round (baseline and vacancies).
+    """
+    return round_number == C.CONSENT_ROUND or should_show_vacancy_session(round_number, player)
+
+
+def get_static_role(player):
+    """
+    Returns the role a player has in every vacancy, without storing it.
+
+    Args:
+    player (Player): Player object
+
+    Returns:
+    str: Role name based on the player's ID in group
+    """
+    roles = [C.RECRUITER_ROLE, C.HR_COORDINATOR_ROLE, C.BUSINESS_PARTNER_ROLE]
+    return roles[(player.id_in_group - 1) % 3]
+
+
+def get_prefetch_assets(role, vacancy_info):
+    """
+    Lists the static files a role opens during a vacancy, so the browser can fetch
+    them in advance while participants are still on earlier pages.
+
+    Args:
+    role (str): C.RECRUITER_ROLE, C.HR_COORDINATOR_ROLE or C.BUSINESS_PARTNER_ROLE
+    vacancy_info (dict): Vacancy configuration from get_vacancy_config(), or None
+
+    Returns:
+    list: Static URLs (content-hashed where possible), empty if there is no vacancy
+    """
+    if not vacancy_info:
+        return []
+
+    if role == C.RECRUITER_ROLE:
+        # CV, job reference and cover letter of every applicant
+        assets = [path for applicant in get_applicants_data_for_vacancy(vacancy_info)
+                  for path in applicant['documents'].values()]
+    elif role == C.HR_COORDINATOR_ROLE:
+        assets = [resolve_asset(vacancy_info['job_desc_file']), resolve_image('job_description_cover')]
+    elif role == C.BUSINESS_PARTNER_ROLE:
+        assets = [resolve_asset(vacancy_info['email_file']), resolve_image(vacancy_info['sticky_notes_image']),
+                  resolve_image('notebook')]
+    else:
+        assets = []
+
+    return [C.STATIC_APPLICANTS_PATH + asset for asset in assets]
+
+
+VACANCY_CONTEXT_VERSION = 1
+VACANCY_CONTEXT_CACHE_SIZE = 256
+
+# Parsed group snapshots by group id; a snapshot never changes once written
+_VACANCY_CONTEXTS = OrderedDict()
+_VACANCY_CONTEXTS_LOCK = threading.Lock()
+
+
+def build_vacancy_context(vacancy_info, num_vacancies):
+    """
+    Resolves everything the three role pages of a vacancy need besides the criteria themselves.
+    Built once per group when the vacancy starts, so all members see the same document
+    versions and the work is not repeated for each of them.
+
+    Args:
+    vacancy_info (dict): Vacancy configuration from get_vacancy_info()
+    num_vacancies (int): Number of vacancies in the session
+
+    Returns:
+    dict: JSON-serializable context containing:
+        - version: VACANCY_CONTEXT_VERSION
+        - vacancy, doc_suffix, duration_seconds, total_sessions: Vacancy settings
+        - applicants: Applicants with content-hashed document paths
+        - job_desc_file, job_desc_cover_file, email_file, sticky_notes_file, notebook_file:
+          Resolved static file names of the role pages
+        - metadata_file: Excel file the criteria are compiled from (they stay in the
+          in-process metadata cache, see get_cached_metadata)
+    """
+    metadata_file = next((path for path in vacancy_info['metadata_files'] if os.path.exists(path)), None)
+
+    return {
+        'version': VACANCY_CONTEXT_VERSION,
+        'vacancy': vacancy_info['vacancy'],
+        'doc_suffix': vacancy_info['doc_suffix'],
+        'duration_seconds': vacancy_info['duration_seconds'],
+        'total_sessions': num_vacancies,
+        'applicants': get_applicants_data_for_vacancy(vacancy_info),
+        'job_desc_file': resolve_asset(vacancy_info['job_desc_file']),
+        'job_desc_cover_file': resolve_image('job_description_cover'),
+        'email_file': resolve_asset(vacancy_info['email_file']),
+        'sticky_notes_file': resolve_image(vacancy_info['sticky_notes_image']),
+        'notebook_file': resolve_image('notebook'),
+        'metadata_file': metadata_file,
+    }
+
+
+def store_vacancy_context(group):
+    """
+    Writes the vacancy context snapshot of a group's round to the group.
+    """
+    registry = get_vacancy_registry(group.session.config)
+    vacancy_info = registry.for_round(group.round_number)
+    if vacancy_info:
+        group.vacancy_context_json = json.dumps(build_vacancy_context(vacancy_info, registry.num_vacancies))
+
+
+def get_vacancy_context(player):
+    """
+    Returns the vacancy context of the player's group and round.
+    Falls back to building it without storing if the group has no snapshot, e.g. in a
+    round that is not a vacancy (defaults to vacancy 1, as before).
+
+    Args:
+    player (Player): Current player
 
     Returns:
-        bool: True if round is a vacancy session (rounds 2-7), False otherwise
+    ReadOnlyDict: Shared context as described in build_vacancy_context()
     """
-    from . import models  # Import to avoid circular import
+    group = player.group
+    with _VACANCY_CONTEXTS_LOCK:
+        context = _VACANCY_CONTEXTS.get(group.id)
+        if context is not None:
+            _VACANCY_CONTEXTS.move_to_end(group.id)
+            return context
+
+    snapshot = group.field_maybe_none('vacancy_context_json')
+    context = json.loads(snapshot) if snapshot else None
+    if not context or context.get('version') != VACANCY_CONTEXT_VERSION:
+        registry = get_player_vacancy_registry(player)
+        vacancy_info = registry.for_round(player.round_number) or get_vacancy_config(1)
+        return freeze_metadata(build_vacancy_context(vacancy_info, registry.num_vacancies))
+
+    context = freeze_metadata(context)
+    with _VACANCY_CONTEXTS_LOCK:
+        _VACANCY_CONTEXTS[group.id] = context
+        while len(_VACANCY_CONTEXTS) > VACANCY_CONTEXT_CACHE_SIZE:
+            _VACANCY_CONTEXTS.popitem(last=False)
+    return context
+
+
+def load_context_metadata(context):
+    """
+    Returns the compiled criteria referenced by a vacancy context.
 
-    return round_number in [models.C.VACANCY_1_ROUND, models.C.VACANCY_2_ROUND, models.C.VACANCY_3_ROUND,
-                            models.C.VACANCY_4_ROUND, models.C.VACANCY_5_ROUND, models.C.VACANCY_6_ROUND]
+    Returns:
+    dict: Criteria data as described in load_metadata_criteria(), empty if the file is missing
+    """
+    try:
+        return get_cached_metadata(context['vacancy'], context['metadata_file'])
+    except Exception:
+        return EMPTY_METADATA
 
 
 def assign_static_role(player):
@@ -303,11 +676,8 @@ def assign_static_role(player):
 
     # This prevents overwriting historical player data when accessing in_round()
     if not player.selected_role:
-        roles = [C.RECRUITER_ROLE, C.HR_COORDINATOR_ROLE, C.BUSINESS_PARTNER_ROLE]
-
         # Static role assignment based on player ID (no rotation)
-        role_index = (player.id_in_group - 1) % 3
-        player.selected_role = roles[role_index]
+        player.selected_role = get_static_role(player)
 
     return player.selected_role
 
@@ -319,39 +689,19 @@ class C(BaseConstants):
 
     NAME_IN_URL = 'mental_fatigue'
     PLAYERS_PER_GROUP = 3
-    NUM_ROUNDS = 8
+    NUM_ROUNDS = MAX_VACANCIES + 2
 
-    # 8-round structure definition
+    # Round structure: baseline, vacancies (number and durations from the session config,
+    # see get_vacancy_registry), final results. Rounds of unused vacancies are skipped.
     CONSENT_ROUND = 1
-    VACANCY_1_ROUND = 2
-    VACANCY_2_ROUND = 3
-    VACANCY_3_ROUND = 4
-    VACANCY_4_ROUND = 5
-    VACANCY_5_ROUND = 6
-    VACANCY_6_ROUND = 7
-    FINAL_RESULTS_ROUND = 8
-
-    VACANCY_2_DURATION_MINUTES = 12
-    VACANCY_2_DURATION_SECONDS = VACANCY_2_DURATION_MINUTES * 60
+    FINAL_RESULTS_ROUND = NUM_ROUNDS
 
-    VACANCY_3_DURATION_MINUTES = 12
-    VACANCY_3_DURATION_SECONDS = VACANCY_3_DURATION_MINUTES * 60
-
-    VACANCY_4_DURATION_MINUTES = 12
-    VACANCY_4_DURATION_SECONDS = VACANCY_4_DURATION_MINUTES * 60
-
-    VACANCY_5_DURATION_MINUTES = 12
-    VACANCY_5_DURATION_SECONDS = VACANCY_5_DURATION_MINUTES * 60
-
-    VACANCY_6_DURATION_MINUTES = 12
-    VACANCY_6_DURATION_SECONDS = VACANCY_6_DURATION_MINUTES * 60
-
-    # Data for templates
-    APPLICANTS = get_applicants_data_for_vacancy()
-    METADATA = load_metadata_criteria()
-    CRITERIA_DATA = METADATA['criteria']
-    CATEGORIES = METADATA['categories']
-    CRITERIA_BY_CATEGORY = METADATA['criteria_by_category']
+    # Data for templates (vacancy 1 defaults), computed on first access
+    APPLICANTS = LazyConstant(get_applicants_data_for_vacancy)
+    METADATA = LazyConstant(load_metadata_criteria)
+    CRITERIA_DATA = LazyConstant(lambda: C.METADATA['criteria'])
+    CATEGORIES = LazyConstant(lambda: C.METADATA['categories'])
+    CRITERIA_BY_CATEGORY = LazyConstant(lambda: C.METADATA['criteria_by_category'])
 
     # Evaluation settings
     MIN_SCORE = 0
@@ -387,11 +737,33 @@ class C(BaseConstants):
 
 
 class Subsession(BaseSubsession):
-    pass
+
+    def creating_session(self):
+        """
+        Validates the vacancy settings of the session config, so a misconfigured session
+        fails when it is created instead of during the experiment.
+        """
+        get_vacancy_registry(self.session.config)
+
+    def vars_for_admin_report(self):
+        """
+        Lists the Nutzwert ranking of each group of this round, scored in one batch.
+        Read-only: the values are stored when the HR coordinator submits, or for older sessions
+        with 'python -m applicants.nutzwert_backfill'.
+        """
+        # Loaded in one query; the players then find their group without one each
+        groups = sorted(self.get_groups(), key=lambda group: group.id_in_subsession)
+        results = score_nutzwert(self.get_players())
+        return {'nutzwert_groups': [dict(results[group], group=group.id_in_subsession)
+                                    for group in groups if group in results]}
 
 
 class Group(BaseGroup):
-    pass
+    # Vacancy context snapshot written by WaitForVacancy (see build_vacancy_context)
+    vacancy_context_json = models.LongStringField(
+        blank=True,
+        doc="JSON snapshot of vacancy settings and document paths shared by the group"
+    )
 
 
 class Player(BasePlayer):
@@ -431,6 +803,27 @@ class Player(BasePlayer):
         doc="Number of criteria incorrectly entered"
     )
 
+    # Nutzwert ranking of the group's HR evaluation (see store_nutzwert), same for the whole group
+    nutzwert_total_a = models.IntegerField(blank=True, doc="Nutzwert points of applicant a")
+    nutzwert_total_b = models.IntegerField(blank=True, doc="Nutzwert points of applicant b")
+    nutzwert_total_c = models.IntegerField(blank=True, doc="Nutzwert points of applicant c")
+    nutzwert_percentage_a = models.IntegerField(blank=True, doc="Share of all Nutzwert points of applicant a (%)")
+    nutzwert_percentage_b = models.IntegerField(blank=True, doc="Share of all Nutzwert points of applicant b (%)")
+    nutzwert_percentage_c = models.IntegerField(blank=True, doc="Share of all Nutzwert points of applicant c (%)")
+    nutzwert_ranking = models.StringField(blank=True, doc="Applicant IDs by descending Nutzwert, e.g. 'b,a,c'")
+    nutzwert_true_ranking = models.StringField(
+        blank=True,
+        doc="Applicant IDs by descending Nutzwert of the correct evaluation from the metadata"
+    )
+    nutzwert_ranking_distance = models.FloatField(
+        blank=True,
+        doc="Applicant pairs ranked differently than in the correct evaluation (ties count half)"
+    )
+    nutzwert_percentage_deviation = models.FloatField(
+        blank=True,
+        doc="Percentage points of the ranking that differ from the correct evaluation"
+    )
+
     # Post-Task Self-Assessment (0-100 scale)
     fatigue_level = models.IntegerField(
         min=0, max=100,
@@ -526,51 +919,202 @@ class Player(BasePlayer):
     def is_business_partner(self):
         return self.selected_role == C.BUSINESS_PARTNER_ROLE
 
-    def validate_criteria_data(self, criteria_data):
+    def live_evaluation(self, data):
         """
-        Validates criteria data against metadata and updates correct/incorrect counters
+        Live method of the Recruiter, HR Coordinator and Business Partner pages.
+        Only the HR coordinator may change the group's evaluation; changes are sent to the
+        whole group, snapshots only to the player who asked.
         """
-        correct_count = 0
-        incorrect_count = 0
+        reply, broadcast = handle_live_evaluation_message(
+            self, data, can_edit=self.is_hr_coordinator(), applicant_ids=get_applicant_ids(),
+            score_range=(C.MIN_SCORE, C.MAX_SCORE), relevance_factors=C.RELEVANCE_FACTORS,
+            answer_index=load_context_metadata(get_vacancy_context(self))['answer_index']
+        )
+        if reply is None:
+            return None
+        return {0: reply} if broadcast else {self.id_in_group: reply}
 
+    def validate_criteria_data(self, criteria_data):
+        """
+        Validates criteria data against metadata and updates correct/incorrect counters.
+        Criteria that do not exist in the metadata count as incorrect.
+
+        Args:
+        criteria_data (dict): Criterion name -> {'scores': {applicant_id: score}, 'relevance': str}
+
+        Returns:
+        list: Per-criterion verdicts (see metadata.validate_criterion)
+        """
         # Load correct answers from metadata for current vacancy
         metadata = load_metadata_criteria(self.round_number, self)
 
-        # Check each criterion the player evaluated
-        for criterion_name, data in criteria_data.items():
-            # Find correct answers for this criterion
-            criterion_metadata = None
-            for criterion in metadata['criteria']:
-                if criterion['name'].strip().lower() == criterion_name.strip().lower():
-                    criterion_metadata = criterion
-                    break
-
-            if criterion_metadata:
-                # Validate scores and relevance against correct answers
-                scores_correct = True
-                relevance_correct = True
-
-                # Check scores for each applicant
-                for applicant_id in get_applicant_ids():
-                    entered_score = data['scores'].get(applicant_id, 0)
-                    correct_score = criterion_metadata['scores'].get(f'applicant_{applicant_id}', 0)
-
-                    if int(entered_score) != int(correct_score):
-                        scores_correct = False
-                        break
-
-                # Check relevance level
-                entered_relevance = data.get('relevance', 'normal')
-                correct_relevance = criterion_metadata.get('relevance', 'normal')
-
-                if entered_relevance != correct_relevance:
-                    relevance_correct = False
-
-                if scores_correct and relevance_correct:
-                    correct_count += 1
-                else:
-                    incorrect_count += 1
+        correct_count, incorrect_count, verdicts = validate_criteria(criteria_data, metadata['answer_index'])
 
         # Update player's performance counters
         self.criteria_correct_this_session = correct_count
         self.criteria_incorrect_this_session = incorrect_count
+        return verdicts
+
+
+class EvaluationPatch(ExtraModel):
+    """
+    One saved change of the HR coordinator's evaluation (see live_sync.py).
+    Replaying a group's patches in seq order gives its evaluation; their verdicts and running
+    counts trace how the evaluation's correctness developed over the vacancy.
+    """
+    group = models.Link(Group)
+    player = models.Link(Player)
+    seq = models.IntegerField(doc="Sequence number of the change within the group's evaluation")
+    criterion_name = models.LongStringField(doc="Criterion that was set or deleted")
+    criterion_json = models.LongStringField(doc="JSON of the criterion (scores, relevance), empty if deleted")
+    created = models.FloatField(doc="Unix time of the change")
+    correct = models.BooleanField(blank=True, doc="Whether the criterion is correct after the change, empty if deleted")
+    correct_total = models.IntegerField(doc="Correct criteria in the evaluation after the change")
+    incorrect_total = models.IntegerField(doc="Incorrect criteria in the evaluation after the change")
+
+
+# Fields FinalResults reads from each of the participant's rounds
+ROUND_SUMMARY_FIELDS = (
+    'round_number', 'group_id', 'selected_role',
+    'fatigue_level', 'mental_effort', 'concentration_difficulty', 'motivation_level', 'effort_cost_worth',
+    'cognitive_test_score', 'cognitive_test_reaction_time',
+    'baseline_kss_alertness', 'baseline_mfi_concentration', 'baseline_mfi_wander',
+    'baseline_zfe_dread', 'baseline_motivation', 'baseline_afi_follow',
+)
+# HR coordinator's criteria counts, shared with the whole group
+CRITERIA_SUMMARY_FIELDS = {
+    'criteria_added': 'criteria_added_this_session',
+    'criteria_correct': 'criteria_correct_this_session',
+    'criteria_incorrect': 'criteria_incorrect_this_session',
+}
+
+
+def load_round_summaries(player, round_numbers):
+    """
+    Loads the participant's values of several rounds together with the HR coordinator's
+    criteria counts of the same groups in two queries, instead of one in_round() and one
+    get_player_by_id() query per round. Only the needed columns are read.
+
+    Args:
+    player (Player): Any round's player object of the participant
+    round_numbers (iterable): Rounds to load
+
+    Returns:
+    dict: Round number -> dict with ROUND_SUMMARY_FIELDS and the keys of CRITERIA_SUMMARY_FIELDS
+          (None where a value was never set). Rounds without data are left out.
+    """
+    from otree.database import dbq
+
+    rows = dbq(*[getattr(Player, field) for field in ROUND_SUMMARY_FIELDS]).filter(
+        Player.participant_id == player.participant_id,
+        Player.round_number.in_(list(round_numbers)),
+    ).all()
+    summaries = {row.round_number: dict(zip(ROUND_SUMMARY_FIELDS, row)) for row in rows}
+
+    group_ids = [summary['group_id'] for summary in summaries.values() if summary['group_id'] is not None]
+    criteria_by_group = {}
+    if group_ids:
+        criteria_columns = [getattr(Player, field) for field in CRITERIA_SUMMARY_FIELDS.values()]
+        for row in dbq(Player.group_id, *criteria_columns).filter(
+                Player.group_id.in_(group_ids),
+                Player.id_in_group == 2,  # HR Coordinator
+        ):
+            criteria_by_group[row[0]] = dict(zip(CRITERIA_SUMMARY_FIELDS, row[1:]))
+
+    for summary in summaries.values():
+        summary.update(criteria_by_group.get(summary['group_id'], dict.fromkeys(CRITERIA_SUMMARY_FIELDS)))
+    return summaries
+
+
+def score_nutzwert(players):
+    """
+    Computes the Nutzwert ranking of the HR evaluations of the players' groups in one batch
+    (see nutzwert.py). Groups whose HR coordinator is not among the players or has not
+    submitted yet are left out. Nothing is written.
+
+    Args:
+    players (iterable): Players of any groups and rounds, e.g. a group or a whole session
+
+    Returns:
+    dict: Group -> values (Player field name without 'nutzwert_' -> value)
+    """
+    players_by_group = {}
+    for player in players:
+        players_by_group.setdefault(player.group, []).append(player)
+
+    groups, submissions, answer_indexes = [], [], []
+    for group, group_players in players_by_group.items():
+        hr = next((player for player in group_players if player.is_hr_coordinator()), None)
+        if hr is None or hr.field_maybe_none('criteria_correct_this_session') is None:
+            continue
+        try:
+            submission = json.loads(hr.field_maybe_none('validation_data_json') or '{}')
+        except ValueError:
+            submission = {}
+        # Validated like the live evaluation, malformed entries do not count
+        criteria, _ = clean_submitted_criteria(submission if isinstance(submission, dict) else {},
+                                               get_applicant_ids(), (C.MIN_SCORE, C.MAX_SCORE), C.RELEVANCE_FACTORS)
+        groups.append(group)
+        submissions.append(criteria)
+        answer_indexes.append(load_context_metadata(get_vacancy_context(hr))['answer_index'])
+
+    if not groups:
+        return {}
+    from .nutzwert import evaluate_groups  # NumPy is only loaded once an evaluation is scored
+
+    applicant_ids = get_applicant_ids()
+    nutzwert = evaluate_groups(submissions, answer_indexes, applicant_ids, C.RELEVANCE_FACTORS)
+
+    results = {}
+    for row, group in enumerate(groups):
+        values = {}
+        for column, applicant_id in enumerate(applicant_ids):
+            values[f'total_{applicant_id}'] = int(nutzwert['totals'][row, column])
+            values[f'percentage_{applicant_id}'] = int(nutzwert['percentages'][row, column])
+        values['ranking'] = ','.join(applicant_ids[column] for column in nutzwert['ranking'][row])
+        values['true_ranking'] = ','.join(applicant_ids[column] for column in nutzwert['true_ranking'][row])
+        values['ranking_distance'] = float(nutzwert['ranking_distance'][row])
+        values['percentage_deviation'] = float(nutzwert['percentage_deviation'][row])
+        results[group] = values
+    return results
+
+
+def store_nutzwert(players):
+    """
+    Scores the players' groups with score_nutzwert() and stores the values on the given players.
+
+    Returns:
+    dict: Group -> stored values, as returned by score_nutzwert()
+    """
+    players = list(players)
+    results = score_nutzwert(players)
+    for player in players:
+        for name, value in results.get(player.group, {}).items():
+            setattr(player, f'nutzwert_{name}', value)
+    return results
+
+
+def custom_export(players):
+    """
+    Data export with one row per participant, read from the running fatigue summary
+    (see fatigue_summary.py) instead of going over all rounds.
+    """
+    measures = SELF_ASSESSMENT_MEASURES + ('cognitive_test_score',)
+    yield (['session_code', 'participant_code', 'id_in_group', 'vacancies_completed', 'baseline_cognitive_score']
+           + [f'{measure}_{statistic}' for measure in measures for statistic in ('average', 'change')]
+           + [f'v{n}_fatigue_level' for n in range(1, MAX_VACANCIES + 1)])
+
+    exported = set()
+    for player in players:
+        participant = player.participant
+        if participant.code in exported:
+            continue
+        exported.add(participant.code)
+
+        summary = get_fatigue_summary(participant) or new_summary()
+        row = [player.session.code, participant.code, player.id_in_group, len(summary['vacancies']),
+               summary['baseline'].get('cognitive_test_score')]
+        for measure in measures:
+            row += [measure_average(summary, measure), measure_change(summary, measure)]
+        row += [summary['vacancies'].get(n, {}).get('fatigue_level') for n in range(1, MAX_VACANCIES + 1)]
+        yield row
@@ -0,0 +1,146 @@
+"""
+Server-side Nutzwert (weighted utility) ranking of the HR coordinators' evaluations.
+
+The calculation matches the live ranking on the pages (LiveEvaluation.html):
+- Each criterion's score is multiplied by its relevance factor (C.RELEVANCE_FACTORS); a
+  relevance not chosen counts as normal.
+- The weighted scores are summed per applicant.
+- Percentages are the rounded shares of all points.
+
+The ground truth is the same calculation over the correct scores and relevance of all
+criteria of the vacancy (metadata answer index). Criteria whose relevance has no factor
+(e.g. not_required) count 0 there.
+
+Each submission is decoded into a criteria x applicants score matrix and a weight vector.
+The rows of all groups of a batch are stacked and computed with NumPy in one go, so scoring
+every group of a session costs about as much as decoding the submitted JSON.
+"""
+import numpy as np
+
+
+def criteria_rows(criteria_data, applicant_ids, relevance_factors, unknown_factor, scores, weights):
+    """
+    Appends one score row and one relevance factor per criterion to the lists scores and weights.
+    """
+    for data in criteria_data.values():
+        entered_scores = data.get('scores') or {}
+        row = []
+        for applicant_id in applicant_ids:
+            try:
+                row.append(int(entered_scores.get(applicant_id) or 0))
+            except (TypeError, ValueError):
+                row.append(0)  # The page counts unparseable scores as 0
+        scores.append(row)
+        weights.append(relevance_factors.get(data.get('relevance'), unknown_factor))
+
+
+def decode_criteria(criteria_data, applicant_ids, relevance_factors, unknown_factor):
+    """
+    Decodes evaluated criteria into a score matrix and a relevance weight vector.
+
+    Args:
+    criteria_data (dict): Criterion name -> {'scores': {applicant_id: score}, 'relevance': str},
+                          as posted by the HR Coordinator page or in a metadata answer index
+    applicant_ids (list): Applicant IDs, the matrix columns
+    relevance_factors (dict): Relevance level -> factor
+    unknown_factor (int): Factor of a relevance that is not in relevance_factors
+
+    Returns:
+    tuple: (scores, weights) - int arrays of shape (criteria, applicants) and (criteria,)
+    """
+    scores = []
+    weights = []
+    criteria_rows(criteria_data, applicant_ids, relevance_factors, unknown_factor, scores, weights)
+    return (np.array(scores, dtype=np.int64).reshape(len(scores), len(applicant_ids)),
+            np.array(weights, dtype=np.int64))
+
+
+def ground_truth_totals(answer_index, applicant_ids, relevance_factors):
+    """
+    Returns the Nutzwert per applicant of the correct evaluation of a vacancy.
+
+    Args:
+    answer_index (dict): Lookup from metadata.build_answer_index()
+
+    Returns:
+    ndarray: Totals in applicant_ids order
+    """
+    scores, weights = decode_criteria(answer_index, applicant_ids, relevance_factors, unknown_factor=0)
+    return weights @ scores
+
+
+def percentages(totals):
+    """
+    Rounds each applicant's share of the points per row to whole percent (0 if there are no
+    points), rounding halves up like the pages' Math.round().
+    """
+    points = totals.sum(axis=1, keepdims=True)
+    shares = np.divide(totals, points, out=np.zeros(totals.shape), where=points > 0)
+    return np.floor(shares * 100 + 0.5).astype(np.int64)
+
+
+def ranking_distance(totals, true_totals):
+    """
+    Counts per row the applicant pairs ordered differently than in the ground truth
+    (Kendall tau distance). A pair tied on one side only counts half.
+    """
+    order = np.sign(totals[:, :, None] - totals[:, None, :])
+    true_order = np.sign(true_totals[:, :, None] - true_totals[:, None, :])
+    first, second = np.triu_indices(totals.shape[1], k=1)
+    return np.abs(order - true_order)[:, first, second].sum(axis=1) / 2
+
+
+def evaluate_groups(submissions, answer_indexes, applicant_ids, relevance_factors):
+    """
+    Computes the Nutzwert ranking of several groups' submissions in one batch.
+
+    Args:
+    submissions (list): Submitted criteria per group (see decode_criteria)
+    answer_indexes (list): The vacancy's answer index per group; groups of the same vacancy
+                           may share one object, its ground truth is computed once
+    applicant_ids (list): Applicant IDs
+    relevance_factors (dict): Relevance level -> factor (C.RELEVANCE_FACTORS)
+
+    Returns:
+    dict: Arrays with one row per group, columns in applicant_ids order:
+        - totals/percentages: Nutzwert of the submission
+        - true_totals/true_percentages: Nutzwert of the correct evaluation
+        - ranking/true_ranking: Column indexes by descending total (ties in applicant order)
+        - ranking_distance: See ranking_distance()
+        - percentage_deviation: Half the summed absolute percentage differences to the
+          ground truth (percentage points of the ranking that are misplaced)
+    """
+    num_groups = len(submissions)
+    default_factor = relevance_factors['normal']
+
+    # All groups' criteria in one matrix, group_rows tells which group a row belongs to
+    scores, weights, group_sizes = [], [], []
+    for criteria_data in submissions:
+        criteria_rows(criteria_data, applicant_ids, relevance_factors, default_factor, scores, weights)
+        group_sizes.append(len(criteria_data))
+    scores = np.array(scores, dtype=np.int64).reshape(len(weights), len(applicant_ids))
+    weights = np.array(weights, dtype=np.int64)
+    group_rows = np.repeat(np.arange(num_groups), group_sizes)
+
+    totals = np.zeros((num_groups, len(applicant_ids)), dtype=np.int64)
+    np.add.at(totals, group_rows, scores * weights[:, None])
+
+    truths = {}
+    for answer_index in answer_indexes:
+        if id(answer_index) not in truths:
+            truths[id(answer_index)] = ground_truth_totals(answer_index, applicant_ids, relevance_factors)
+    true_totals = np.array([truths[id(answer_index)] for answer_index in answer_indexes],
+                           dtype=np.int64).reshape(num_groups, len(applicant_ids))
+
+    submitted_percentages = percentages(totals)
+    true_percentages = percentages(true_totals)
+    return {
+        'totals': totals,
+        'percentages': submitted_percentages,
+        'true_totals': true_totals,
+        'true_percentages': true_percentages,
+        'ranking': np.argsort(-totals, axis=1, kind='stable'),
+        'true_ranking': np.argsort(-true_totals, axis=1, kind='stable'),
+        'ranking_distance': ranking_distance(totals, true_totals),
+        'percentage_deviation': np.abs(submitted_percentages - true_percentages).sum(axis=1) / 2,
+    }
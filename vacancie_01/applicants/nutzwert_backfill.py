@@ -0,0 +1,33 @@
+"""
+Stores the Nutzwert ranking (see models.store_nutzwert) for sessions that ran before it was
+stored at submit, or recomputes it after the metadata changed.
+
+Run from the project directory against the experiment's database (DATABASE_URL as for the
+server):
+    python -m applicants.nutzwert_backfill [--session CODE ...]
+"""
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store the Nutzwert ranking of all groups of past sessions.")
+    parser.add_argument('--session', nargs='+', help="Session codes (default: all sessions)")
+    args = parser.parse_args()
+
+    from otree.main import setup
+    setup()
+
+    from otree.database import session_scope
+    from otree.models import Session
+    from .models import Player, store_nutzwert
+
+    with session_scope():
+        sessions = Session.objects_filter(Session.code.in_(args.session)) if args.session \
+            else Session.objects_filter()
+        for session in sessions:
+            results = store_nutzwert(Player.objects_filter(session=session))
+            print(f"{session.code}: stored the Nutzwert ranking of {len(results)} groups")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,36 @@
 from otree.api import *  # Core oTree framework
-from .models import C, get_vacancy_info, get_applicants_data_for_vacancy, \
-    load_metadata_criteria, should_show_vacancy_session, get_applicant_ids, \
-    assign_static_role  # imports from models.py
+from .models import C, get_vacancy_info, should_show_vacancy_session, is_measurement_round, get_applicant_ids, \
+    assign_static_role, get_static_role, get_prefetch_assets, get_player_vacancy_registry, \
+    load_round_summaries, MAX_VACANCIES, get_vacancy_context, store_vacancy_context, \
+    load_context_metadata, store_nutzwert  # imports from models.py
+from .documents import load_recruiter_masks  # Word -> HTML converting
+from .warmup import warmup_requested, start_background_warmup
+from .assets import install_immutable_static_caching  # Content-hashed static URLs
+from .byte_ranges import install_byte_range_support  # Partial PDF downloads
+from .vendor import vendor_script_url  # Locally served chart libraries
+from .charts import get_final_results_charts  # Server-side SVG charts
+from .live_sync import install_shared_live_pages, get_evaluation, finalize_evaluation, \
+    AUTOSAVE_INTERVAL  # Live HR evaluation for the whole group
+from .fatigue_summary import record_measurements, get_fatigue_summary, summary_from_rounds, summary_metrics, \
+    BASELINE_MEASURES, SELF_ASSESSMENT_MEASURES, COGNITIVE_TEST_MEASURES  # Running fatigue summary
 import random  # for StroopTest Items
-from docx import Document  # Word -> HTML converting
-import os  # file paths
 import json
+import time
+
+
+def get_prefetch_urls(player, round_number):
+    """
+    Returns the static files the player's role will open in the vacancy of the given round.
+    Rendered as <link rel="prefetch"> so the browser loads them before the session clock starts.
+
+    Args:
+    player (Player): Current player
+    round_number (int): Round of the upcoming vacancy
+
+    Returns:
+    list: Static URLs, empty if the round has no vacancy
+    """
+    return get_prefetch_assets(get_static_role(player), get_vacancy_info(round_number, player))
 
 
 class Consent(Page):
@@ -13,6 +38,9 @@ class Consent(Page):
     def is_displayed(self):
         return self.player.round_number == 1  # only shown in the very first round
 
+    def before_next_page(self):
+        self.participant.experiment_start_time = time.time()  # For overall experiment duration
+
 
 # MAIN TASK PAGES
 
@@ -34,27 +62,28 @@ class Recruiter(Page):
         - vacancy_number: Which vacancy is active
         - remaining_time: Session timeout in seconds
         - static_path: Path to static files (PDFs, images)
-        - total_sessions: Total number of working sessions (6)
+        - total_sessions: Total number of working sessions (from the session config)
+        - applicant_colors/applicant_ids/relevance_factors: For the live ranking of the HR evaluation
     """
 
     def is_displayed(self):
         """
         Shows recruiter interface only during vacancy rounds with role assignment.
         """
-        if not should_show_vacancy_session(self.player.round_number):
+        if not should_show_vacancy_session(self.player.round_number, self.player):
             return False
 
         # AUTOMATIC ROLE ASSIGNMENT
         assign_static_role(self.player)
         return self.player.is_recruiter()
 
+    # Live HR evaluation shared with the group (see live_sync.py)
+    live_method = 'live_evaluation'
+
     def get_timeout_seconds(self):
         """
-        Returns timeout based on vacancy
+        Returns the vacancy's time limit from the session config (None = unlimited, e.g. Vacancy 1).
         """
-        if self.player.round_number == C.VACANCY_1_ROUND:
-            return None  # Unlimited time for Vacancy 1
-
         vacancy_info = get_vacancy_info(self.player.round_number, self.player)
         return vacancy_info['duration_seconds'] if vacancy_info else 720  # 12 min fallback
 
@@ -64,118 +93,33 @@ class Recruiter(Page):
         """
         Loads and processes all data needed for the recruiter interface.
         """
-        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
-        applicants_data = get_applicants_data_for_vacancy(vacancy_info)
+        # Vacancy settings and document paths shared by the group (built on the wait page)
+        context = get_vacancy_context(self.player)
+        applicants_data = context['applicants']
 
         applicants_with_content = []
-        doc_suffix = vacancy_info['doc_suffix'] if vacancy_info else '1'
+
+        # Documents not yet cached are loaded concurrently
+        descriptions = load_recruiter_masks([applicant['id'] for applicant in applicants_data], context['doc_suffix'])
 
         for applicant in applicants_data:
             # Create copy to avoid modifying original data
-            applicant_data = applicant.copy()
-            applicant_data['description'] = self.get_word_content(applicant['id'], doc_suffix)
+            applicant_data = dict(applicant)
+            applicant_data['description'] = descriptions[applicant['id']]
             applicants_with_content.append(applicant_data)
 
-        vacancy_number = vacancy_info['vacancy'] if vacancy_info else 1
-
         return {
             'applicants': applicants_with_content,
-            'session_number': vacancy_number,
-            'vacancy_number': vacancy_number,
-            'remaining_time': vacancy_info['duration_seconds'] if vacancy_info else 600,
+            'session_number': context['vacancy'],
+            'vacancy_number': context['vacancy'],
+            'remaining_time': context['duration_seconds'],
             'static_path': C.STATIC_APPLICANTS_PATH,
-            'total_sessions': 6
+            'total_sessions': context['total_sessions'],
+            'applicant_colors': C.APPLICANT_COLORS,
+            'applicant_ids': get_applicant_ids(),
+            'relevance_factors': C.RELEVANCE_FACTORS
         }
 
-    def get_word_content(self, applicant_id, doc_suffix='1'):
-        """
-        Loads recruiter mask Word document.
-
-        Args:
-            applicant_id (str): Applicant identifier ('a', 'b', or 'c')
-            doc_suffix (str): Vacancy-specific suffix
-
-        Returns:
-            str: HTML content for web display, or error message if file not found
-        """
-        try:
-            # Build absolute path to Word document
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-
-            doc_path = os.path.join(
-                current_dir,
-                '..',
-                '_static',
-                'applicants',
-                f'recruiter_maske_{applicant_id}{doc_suffix}.docx'
-            )
-
-            # Normalize path for cross-platform compatibility
-            doc_path = os.path.normpath(doc_path)
-
-            # Load Word document and convert to HTML
-            document = Document(doc_path)
-            html_content = self.convert_docx_to_html(document)
-            return html_content
-
-        except Exception as e:
-            return f"<p><em>Error loading document: {str(e)}</em></p>"
-
-    def convert_docx_to_html(self, document):
-        """
-        Processes Word document content and converts it to styled HTML.
-
-        Args:
-        document: python-docx Document object
-
-        Returns:
-        str: HTML content with styling ready for web display
-        """
-        html_parts = []
-
-        # Process paragraphs and headings
-        for paragraph in document.paragraphs:
-            text = paragraph.text.strip()
-            if text:
-                # Convert Word headings to HTML heading tags
-                if paragraph.style.name.startswith('Heading'):
-                    level = 3
-                    if 'Heading 1' in paragraph.style.name:
-                        level = 2
-                    elif 'Heading 2' in paragraph.style.name:
-                        level = 3
-                    html_parts.append(f'<h{level}>{text}</h{level}>')
-                else:
-                    # Regular paragraphs with bold text detection
-                    if any(run.bold for run in paragraph.runs):
-                        html_parts.append(f'<p><strong>{text}</strong></p>')
-                    else:
-                        html_parts.append(f'<p>{text}</p>')
-
-        # Process tables with styling and header detection
-        for table in document.tables:
-            html_parts.append('<table style="width:100%; border-collapse: collapse; margin: 10px 0;">')
-
-            for row_idx, row in enumerate(table.rows):
-                html_parts.append('<tr>')
-                for cell in row.cells:
-                    cell_text = cell.text.strip()
-                    # Style header cells differently
-                    if row_idx == 0 or any(run.bold for para in cell.paragraphs for run in para.runs):
-                        html_parts.append(
-                            f'<td style="border: 1px solid #ddd; padding: 5px; font-weight: bold; background-color: #f5f5f5;">{cell_text}</td>')
-                    else:
-                        html_parts.append(f'<td style="border: 1px solid #ddd; padding: 5px;">{cell_text}</td>')
-                html_parts.append('</tr>')
-
-            html_parts.append('</table>')
-
-        if not html_parts:
-            return "<p><em>The Word document is empty or could not be read.</em></p>"
-
-        # Combine all HTML parts into final output
-        return ''.join(html_parts)
-
 
 class HRCoordinator(Page):
     """
@@ -199,6 +143,8 @@ class HRCoordinator(Page):
             - job_desc_file: PDF file for job description access
             - min_score/max_score: Score range for evaluation dropdowns (0-8)
             - applicant_ids: List for score validation (['a', 'b', 'c'])
+            - saved_criteria: JSON list of the criteria entered before a reload (autosave)
+            - autosave_interval_ms: Pause in editing after which the page asks the server to save
 
     Form Fields:
         - criteria_added_this_session: Count of criteria added by player
@@ -207,12 +153,15 @@ class HRCoordinator(Page):
     form_model = 'player'
     form_fields = ['criteria_added_this_session', 'validation_data_json']
 
+    # Evaluation changes are sent to the group as they happen (see live_sync.py)
+    live_method = 'live_evaluation'
+
     def is_displayed(self):
         """
         Display logic and automatic role assignment.
         Uses static role assignment for 4-round structure.
         """
-        if not should_show_vacancy_session(self.player.round_number):
+        if not should_show_vacancy_session(self.player.round_number, self.player):
             return False
 
         # AUTOMATIC ROLE ASSIGNMENT
@@ -221,11 +170,8 @@ class HRCoordinator(Page):
 
     def get_timeout_seconds(self):
         """
-        Returns timeout based on vacancy: None for V1 (unlimited), 720s for V2-V6.
+        Returns the vacancy's time limit from the session config (None = unlimited, e.g. Vacancy 1).
         """
-        if self.player.round_number == C.VACANCY_1_ROUND:
-            return None  # Unlimited time for Vacancy 1
-
         vacancy_info = get_vacancy_info(self.player.round_number, self.player)
         return vacancy_info['duration_seconds'] if vacancy_info else 720  # 12 min fallback
 
@@ -233,101 +179,63 @@ class HRCoordinator(Page):
 
     def before_next_page(self):
         """
-        Validates player's criteria data against correct answers before proceeding.
-        Takes JSON data from frontend, compares it with metadata, and counts how many criteria were evaluated correctly vs incorrectly.
+        Finalizes the correct/incorrect counts of the player's criteria and stores the group's
+        Nutzwert ranking.
+        The criteria were scored one by one as they changed (see live_sync.py); only criteria
+        in the submitted JSON that the live channel did not report yet are scored here.
         """
-
+        # Get criteria data from hidden form field (sent by JavaScript)
         try:
-            # Get criteria data from hidden form field (sent by JavaScript)
-            validation_data_str = self.player.validation_data_json or '{}'
-
-            if not validation_data_str or validation_data_str == '{}':
-                self.player.criteria_correct_this_session = 0
-                self.player.criteria_incorrect_this_session = 0
-                return
-
-            # Parse JSON data from frontend
-            criteria_data = json.loads(validation_data_str)
-            correct_count = 0
-            incorrect_count = 0
-
-            # Load correct answers from metadata files
-            metadata = load_metadata_criteria(self.player.round_number, self.player)
-            metadata_criteria = metadata['criteria']
-
-            # Check each criterion the player evaluated
-            for criterion_name, data in criteria_data.items():
-                # Find the criterion in metadata
-                criterion_metadata = None
-                for criterion in metadata_criteria:
-                    if criterion['name'].strip().lower() == criterion_name.strip().lower():
-                        criterion_metadata = criterion
-                        break
-
-                if criterion_metadata:
-                    # Check scores and relevance
-                    scores_correct = True
-
-                    # Check scores for each applicant
-                    for applicant_id in get_applicant_ids():
-                        entered_score = data['scores'].get(applicant_id, 0)
-                        correct_score = criterion_metadata['scores'].get(f'applicant_{applicant_id}', 0)
-
-                        if int(entered_score or 0) != int(correct_score):
-                            scores_correct = False
-                            break
-
-                    # Validate relevance level
-                    entered_relevance = data.get('relevance', 'normal')
-                    correct_relevance = criterion_metadata.get('relevance', 'normal')
-                    relevance_correct = entered_relevance == correct_relevance
-
-                    # Count correct or incorrect
-                    if scores_correct and relevance_correct:
-                        correct_count += 1
-                    else:
-                        incorrect_count += 1
-                else:
-                    # Criterion not found in metadata = incorrect
-                    incorrect_count += 1
-
-            # Save results to player fields for later analysis
-            self.player.criteria_correct_this_session = correct_count
-            self.player.criteria_incorrect_this_session = incorrect_count
-
-        except Exception as e:
-            self.player.criteria_correct_this_session = 0
-            self.player.criteria_incorrect_this_session = 0
+            submitted_criteria = json.loads(self.player.validation_data_json or 'null')
+        except ValueError:
+            submitted_criteria = None
+        if not isinstance(submitted_criteria, dict):
+            # Nothing usable was posted, the live evaluation stands as it is
+            submitted_criteria = None
+
+        metadata = load_context_metadata(get_vacancy_context(self.player))
+        finalize_evaluation(self.group, self.player, metadata['answer_index'], submitted_criteria,
+                            applicant_ids=get_applicant_ids(), score_range=(C.MIN_SCORE, C.MAX_SCORE),
+                            relevance_factors=C.RELEVANCE_FACTORS)
+
+        # Store the group's Nutzwert ranking with the final evaluation
+        store_nutzwert(self.group.get_players())
 
     def vars_for_template(self):
         """
         Prepares all data needed for HR Coordinator interface.
         """
-        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
-        applicants_data = get_applicants_data_for_vacancy(vacancy_info)
+        # Vacancy settings and document paths shared by the group (built on the wait page)
+        context = get_vacancy_context(self.player)
 
-        # Load evaluation criteria and categories from Excel metadata
-        metadata = load_metadata_criteria(self.player.round_number, self.player)
+        # Evaluation criteria and categories from the cached Excel metadata
+        metadata = load_context_metadata(context)
 
-        vacancy_number = vacancy_info['vacancy'] if vacancy_info else 1
+        # Criteria entered before a reload or browser crash (empty on the first visit)
+        saved_criteria = list(get_evaluation(self.group, metadata['answer_index'])['criteria'].values())
 
         return {
-            'applicants': applicants_data,
+            'applicants': context['applicants'],
             'min_score': C.MIN_SCORE,
             'max_score': C.MAX_SCORE,
-            'session_number': vacancy_number,
-            'vacancy_number': vacancy_number,
-            'remaining_time': vacancy_info['duration_seconds'] if vacancy_info else 600,
+            'session_number': context['vacancy'],
+            'vacancy_number': context['vacancy'],
+            'remaining_time': context['duration_seconds'],
             'criteria_data': metadata['criteria'],
             'predefined_criteria': metadata['predefined_criteria'],
             'categories': metadata['categories'],
             'criteria_by_category': metadata['criteria_by_category'],
             'relevance_factors': C.RELEVANCE_FACTORS,
-            'job_desc_file': vacancy_info['job_desc_file'] if vacancy_info else 'job_description_1.pdf',
+            'job_desc_file': context['job_desc_file'],
+            'job_desc_cover_file': context['job_desc_cover_file'],
             'static_path': C.STATIC_APPLICANTS_PATH,
             'applicant_colors': C.APPLICANT_COLORS,
             'applicant_ids': get_applicant_ids(),
-            'total_sessions': 6
+            'chartjs_url': vendor_script_url('chart.js'),
+            'total_sessions': context['total_sessions'],
+            # JSON, as criterion names are free text; '</' is escaped for the inline script
+            'saved_criteria': json.dumps(saved_criteria).replace('</', '<\\/'),
+            'autosave_interval_ms': int(AUTOSAVE_INTERVAL * 1000)
         }
 
 
@@ -351,21 +259,23 @@ class BusinessPartner(Page):
             - min_score/max_score: Score range for criteria viewing (0-8)
             - email_file: Vacancy-specific email PDF filename
             - sticky_notes_file: Vacancy-specific sticky notes image filename
+            - notebook_file: Requirement catalog cover image filename
+            - applicant_colors/applicant_ids/relevance_factors: For the live ranking of the HR evaluation
     """
 
     def is_displayed(self):
-        if should_show_vacancy_session(self.player.round_number):
+        if should_show_vacancy_session(self.player.round_number, self.player):
             assign_static_role(self.player)
             return self.player.is_business_partner()
         return False
 
+    # Live HR evaluation shared with the group (see live_sync.py)
+    live_method = 'live_evaluation'
+
     def get_timeout_seconds(self):
         """
-        Returns timeout based on vacancy: None for V1 (unlimited), 720s for V2-V6.
+        Returns the vacancy's time limit from the session config (None = unlimited, e.g. Vacancy 1).
         """
-        if self.player.round_number == C.VACANCY_1_ROUND:
-            return None  # Unlimited time for Vacancy 1
-
         vacancy_info = get_vacancy_info(self.player.round_number, self.player)
         return vacancy_info['duration_seconds'] if vacancy_info else 720  # 12 min fallback
 
@@ -376,27 +286,28 @@ class BusinessPartner(Page):
         Prepares data for Business Partner requirements catalog interface.
         Now includes vacancy-specific email and sticky notes files.
         """
-        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
-        applicants_data = get_applicants_data_for_vacancy(vacancy_info)
-
-        metadata = load_metadata_criteria(self.player.round_number, self.player)
-
-        vacancy_number = vacancy_info['vacancy'] if vacancy_info else 1
+        # Vacancy settings and document paths shared by the group (built on the wait page)
+        context = get_vacancy_context(self.player)
+        metadata = load_context_metadata(context)
 
         return {
-            'applicants': applicants_data,
-            'session_number': vacancy_number,
-            'vacancy_number': vacancy_number,
-            'remaining_time': vacancy_info['duration_seconds'] if vacancy_info else 720,
+            'applicants': context['applicants'],
+            'session_number': context['vacancy'],
+            'vacancy_number': context['vacancy'],
+            'remaining_time': context['duration_seconds'],
             'criteria_data': metadata['criteria'],
             'categories': metadata['categories'],
             'criteria_by_category': metadata['criteria_by_category'],
             'static_path': C.STATIC_APPLICANTS_PATH,
             'min_score': C.MIN_SCORE,
             'max_score': C.MAX_SCORE,
-            'total_sessions': 6,
-            'email_file': f'Email_{vacancy_number}.pdf',
-            'sticky_notes_file': f'StickyNotes_{vacancy_number}.jpg'
+            'total_sessions': context['total_sessions'],
+            'email_file': context['email_file'],
+            'sticky_notes_file': context['sticky_notes_file'],
+            'notebook_file': context['notebook_file'],
+            'applicant_colors': C.APPLICANT_COLORS,
+            'applicant_ids': get_applicant_ids(),
+            'relevance_factors': C.RELEVANCE_FACTORS
         }
 
 
@@ -411,15 +322,28 @@ class WaitForVacancy(WaitPage):
         """
         Only displayed before main work sessions
         """
-        return should_show_vacancy_session(self.player.round_number)
+        return should_show_vacancy_session(self.player.round_number, self.player)
 
     def after_all_players_arrive(self):
         """
         Executed when all players have arrived.
-        Add setup code here if needed.
+        Builds the group's vacancy context once, which the three role pages then render from.
         """
-        pass
+        store_vacancy_context(self.group)
 
+    def vars_for_template(self):
+        """
+        Shows the player's role and prefetches the documents of the starting vacancy.
+        """
+        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
+
+        return {
+            'role': get_static_role(self.player),
+            'session_number': vacancy_info['vacancy'] if vacancy_info else 1,
+            'prefetch_urls': get_prefetch_urls(self.player, self.player.round_number),
+        }
+
+    template_name = 'applicants/WaitForVacancy.html'
     title_text = "Synchronization"
     body_text = "Waiting for other players to join the session..."
 
@@ -450,8 +374,7 @@ class SelfAssessment(Page):
             ]
 
     def is_displayed(self):
-        return self.player.round_number in [C.CONSENT_ROUND, C.VACANCY_1_ROUND, C.VACANCY_2_ROUND, C.VACANCY_3_ROUND,
-                                            C.VACANCY_4_ROUND, C.VACANCY_5_ROUND, C.VACANCY_6_ROUND]
+        return is_measurement_round(self.player.round_number, self.player)
 
     def before_next_page(self):
         """
@@ -504,6 +427,14 @@ class SelfAssessment(Page):
             if value is not None:
                 self.player.effort_cost_worth = round(value)
 
+        # Running fatigue summary of the participant (see fatigue_summary.py)
+        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
+        if vacancy_info:
+            summary = record_measurements(self.player, vacancy_info['vacancy'], SELF_ASSESSMENT_MEASURES)
+            self.participant.total_sessions_completed = len(summary['vacancies'])
+        else:
+            record_measurements(self.player, 0, BASELINE_MEASURES)
+
     def vars_for_template(self):
         """
         Prepares session information for self-assessment form.
@@ -524,7 +455,8 @@ class SelfAssessment(Page):
             'session_name': session_name,
             'vacancy_number': vacancy_number,
             'role_played': self.player.selected_role,
-            'total_sessions': 6
+            'total_sessions': get_player_vacancy_registry(self.player).num_vacancies,
+            'prefetch_urls': get_prefetch_urls(self.player, self.player.round_number + 1)  # Next vacancy
         }
 
 
@@ -588,7 +520,8 @@ class CognitiveTestInstructions(Page):
             'session_number': session_number,
             'session_name': session_name,
             'vacancy_number': vacancy_number,
-            'total_sessions': 6
+            'total_sessions': get_player_vacancy_registry(self.player).num_vacancies,
+            'prefetch_urls': get_prefetch_urls(self.player, self.player.round_number + 1)  # Next vacancy
         }
 
 
@@ -622,8 +555,17 @@ class CognitiveTest(Page):
         """
         Shown in all 7 measurement rounds: Baseline (Round 1) and after each vacancy (Rounds 2-7).
         """
-        return self.player.round_number in [C.CONSENT_ROUND, C.VACANCY_1_ROUND, C.VACANCY_2_ROUND, C.VACANCY_3_ROUND,
-                                            C.VACANCY_4_ROUND, C.VACANCY_5_ROUND, C.VACANCY_6_ROUND]
+        return is_measurement_round(self.player.round_number, self.player)
+
+    def before_next_page(self):
+        """
+        Adds the test result to the participant's running fatigue summary.
+        """
+        vacancy_info = get_vacancy_info(self.player.round_number, self.player)
+        record_measurements(self.player, vacancy_info['vacancy'] if vacancy_info else 0, COGNITIVE_TEST_MEASURES)
+        if self.player.round_number == C.CONSENT_ROUND:
+            # For comparing cognitive decline
+            self.participant.baseline_cognitive_score = self.player.field_maybe_none('cognitive_test_score')
 
     def vars_for_template(self):
         """
@@ -666,7 +608,7 @@ class CognitiveTest(Page):
             'session_number': session_number,
             'session_name': session_name,
             'vacancy_number': vacancy_number,
-            'total_sessions': 6
+            'total_sessions': get_player_vacancy_registry(self.player).num_vacancies
         }
 
 
@@ -687,8 +629,7 @@ class CognitiveTestResults(Page):
         """
         Shown in all 7 measurement rounds
         """
-        return self.player.round_number in [C.CONSENT_ROUND, C.VACANCY_1_ROUND, C.VACANCY_2_ROUND, C.VACANCY_3_ROUND,
-                                            C.VACANCY_4_ROUND, C.VACANCY_5_ROUND, C.VACANCY_6_ROUND]
+        return is_measurement_round(self.player.round_number, self.player)
 
     def vars_for_template(self):
         """
@@ -713,7 +654,8 @@ class CognitiveTestResults(Page):
             'reaction_time': self.player.field_maybe_none('cognitive_test_reaction_time') or 0,
             'errors': self.player.field_maybe_none('cognitive_test_errors') or 0,
             'total_questions': C.COGNITIVE_TEST_TOTAL_QUESTIONS,
-            'total_sessions': 6
+            'total_sessions': get_player_vacancy_registry(self.player).num_vacancies,
+            'prefetch_urls': get_prefetch_urls(self.player, self.player.round_number + 1)  # Next vacancy
         }
 
 
@@ -747,98 +689,59 @@ class FinalResults(Page):
 
         # Separate baseline from task sessions
         baseline_round = C.CONSENT_ROUND
-        task_rounds = [C.VACANCY_1_ROUND, C.VACANCY_2_ROUND, C.VACANCY_3_ROUND, C.VACANCY_4_ROUND, C.VACANCY_5_ROUND, C.VACANCY_6_ROUND]
+        task_rounds = get_player_vacancy_registry(self.player).vacancy_rounds
+
+        # All rounds of this participant plus the HR Coordinator's criteria counts in two queries
+        rounds = load_round_summaries(self.player, [baseline_round, *task_rounds])
+
+        def value_or(summary, field, default=0):
+            value = summary.get(field)
+            return value if value is not None else default
 
         # Extract baseline data separately
-        try:
-            baseline_player = self.player.in_round(baseline_round)
-            baseline_data = {
-                'kss_alertness': baseline_player.baseline_kss_alertness or 0,
-                'mfi_concentration': baseline_player.baseline_mfi_concentration or 0,
-                'mfi_wander': baseline_player.baseline_mfi_wander or 0,
-                'zfe_dread': baseline_player.baseline_zfe_dread or 0,
-                'baseline_motivation': baseline_player.baseline_motivation or 0,
-                'afi_follow': baseline_player.baseline_afi_follow or 0,
-                'cognitive_score': baseline_player.cognitive_test_score,
-                'cognitive_reaction_time': baseline_player.cognitive_test_reaction_time
-            }
-        except:
-            baseline_data = {
-                'kss_alertness': 0, 'mfi_concentration': 0, 'mfi_wander': 0,
-                'zfe_dread': 0, 'baseline_motivation': 0, 'afi_follow': 0, 'cognitive_score': 0,
-                'cognitive_reaction_time': 0
-            }
-
-        # Collect task session data (V1, V2, V3)
-        task_sessions_data = []
-        task_names = ['Vacancy 1', 'Vacancy 2', 'Vacancy 3', 'Vacancy 4', 'Vacancy 5', 'Vacancy 6']
+        baseline = rounds.get(baseline_round, {})
+        baseline_data = {
+            'kss_alertness': value_or(baseline, 'baseline_kss_alertness'),
+            'mfi_concentration': value_or(baseline, 'baseline_mfi_concentration'),
+            'mfi_wander': value_or(baseline, 'baseline_mfi_wander'),
+            'zfe_dread': value_or(baseline, 'baseline_zfe_dread'),
+            'baseline_motivation': value_or(baseline, 'baseline_motivation'),
+            'afi_follow': value_or(baseline, 'baseline_afi_follow'),
+            'cognitive_score': value_or(baseline, 'cognitive_test_score'),
+            'cognitive_reaction_time': value_or(baseline, 'cognitive_test_reaction_time')
+        }
 
+        # Collect task session data (one entry per vacancy played)
+        task_sessions_data = []
         for i, round_num in enumerate(task_rounds):
-            try:
-                round_player = self.player.in_round(round_num)
-
-                def safe_get(field_func, default=0):
-                    try:
-                        value = field_func()
-                        return value if value is not None else default
-                    except:
-                        return default
-
-                # Get criteria data from HR Coordinator in the same group
-                try:
-                    hr_coordinator = round_player.group.get_player_by_id(2)
-                    criteria_added = safe_get(lambda: hr_coordinator.criteria_added_this_session)
-                    criteria_correct = safe_get(lambda: hr_coordinator.criteria_correct_this_session)
-                    criteria_incorrect = safe_get(lambda: hr_coordinator.criteria_incorrect_this_session)
-                except:
-                    criteria_added = criteria_correct = criteria_incorrect = 0
-
-                session_data = {
-                    'session': i + 1,
-                    'session_name': task_names[i],
-                    'role': safe_get(lambda: round_player.selected_role, 'Unknown'),
-                    # Individual player data (fatigue, cognitive performance)
-                    'fatigue_level': safe_get(lambda: round_player.fatigue_level),
-                    'mental_effort': safe_get(lambda: round_player.mental_effort),
-                    'concentration_difficulty': safe_get(lambda: round_player.concentration_difficulty),
-                    'motivation_level': safe_get(lambda: round_player.motivation_level),
-                    'effort_cost_worth': safe_get(lambda: round_player.effort_cost_worth),
-                    'cognitive_score': safe_get(lambda: round_player.cognitive_test_score),
-                    'cognitive_reaction_time': safe_get(lambda: round_player.cognitive_test_reaction_time),
-                    # Criteria data from HR Coordinator (shared across all players)
-                    'criteria_added': criteria_added,
-                    'criteria_correct': criteria_correct,
-                    'criteria_incorrect': criteria_incorrect,
-                }
-                task_sessions_data.append(session_data)
-            except Exception as e:
+            summary = rounds.get(round_num)
+            if summary is None:
                 continue
 
-        # Calculate task progression metrics (V1 → V2 → V3)
-        if len(task_sessions_data) >= 2:
-            # Extract valid values for trend calculations
-            fatigue_values = [s['fatigue_level'] for s in task_sessions_data if s['fatigue_level'] > 0]
-            cognitive_values = [s['cognitive_score'] for s in task_sessions_data if s['cognitive_score'] > 0]
-            effort_values = [s['mental_effort'] for s in task_sessions_data if s['mental_effort'] > 0]
-            concentration_values = [s['concentration_difficulty'] for s in task_sessions_data if
-                                    s['concentration_difficulty'] > 0]
-            motivation_values = [s['motivation_level'] for s in task_sessions_data if s['motivation_level'] > 0]
-
-            # Task progression analysis (first task → last task)
-            task_fatigue_increase = fatigue_values[-1] - fatigue_values[0] if len(fatigue_values) >= 2 else 0
-            task_cognitive_decline = cognitive_values[0] - cognitive_values[-1] if len(cognitive_values) >= 2 else 0
-            task_effort_increase = effort_values[-1] - effort_values[0] if len(effort_values) >= 2 else 0
-            task_motivation_change = motivation_values[-1] - motivation_values[0] if len(motivation_values) >= 2 else 0
-
-            # Averages across task sessions only
-            average_task_fatigue = sum(fatigue_values) / len(fatigue_values) if fatigue_values else 0
-            average_task_effort = sum(effort_values) / len(effort_values) if effort_values else 0
-            average_task_concentration = sum(concentration_values) / len(
-                concentration_values) if concentration_values else 0
-            average_task_motivation = sum(motivation_values) / len(motivation_values) if motivation_values else 0
-        else:
-            task_fatigue_increase = task_cognitive_decline = task_effort_increase = task_motivation_change = 0
-            average_task_fatigue = average_task_effort = average_task_concentration = average_task_motivation = 0
+            task_sessions_data.append({
+                'session': i + 1,
+                'session_name': f'Vacancy {i + 1}',
+                'role': value_or(summary, 'selected_role', 'Unknown'),
+                # Individual player data (fatigue, cognitive performance)
+                'fatigue_level': value_or(summary, 'fatigue_level'),
+                'mental_effort': value_or(summary, 'mental_effort'),
+                'concentration_difficulty': value_or(summary, 'concentration_difficulty'),
+                'motivation_level': value_or(summary, 'motivation_level'),
+                'effort_cost_worth': value_or(summary, 'effort_cost_worth'),
+                'cognitive_score': value_or(summary, 'cognitive_test_score'),
+                'cognitive_reaction_time': value_or(summary, 'cognitive_test_reaction_time'),
+                # Criteria data from HR Coordinator (shared across all players)
+                'criteria_added': value_or(summary, 'criteria_added'),
+                'criteria_correct': value_or(summary, 'criteria_correct'),
+                'criteria_incorrect': value_or(summary, 'criteria_incorrect'),
+            })
+
+        # Trends and averages from the running summary; rebuilt from the rounds
+        # for participants who started before summaries were recorded
+        summary = get_fatigue_summary(self.participant)
+        if summary is None or not summary['baseline']:
+            summary = summary_from_rounds(rounds, baseline_round, task_rounds)
+        metrics = summary_metrics(summary, MAX_VACANCIES)
 
         # Check if current player is HR Coordinator (Player 2)
         is_hr_coordinator = self.player.id_in_group == 2
@@ -851,49 +754,16 @@ class FinalResults(Page):
             'task_sessions': task_sessions_data,
             'total_task_sessions': len(task_sessions_data),
 
-            # Task progression metrics (V1 → V2 → V3)
-            'task_fatigue_increase': task_fatigue_increase,
-            'task_cognitive_decline': task_cognitive_decline,
-            'task_effort_increase': task_effort_increase,
-            'task_motivation_change': task_motivation_change,
-
-            # Task session averages
-            'average_task_fatigue': average_task_fatigue,
-            'average_task_effort': average_task_effort,
-            'average_task_concentration': average_task_concentration,
-            'average_task_motivation': average_task_motivation,
-
-            # Individual task session values for detailed comparison
-            'v1_fatigue': fatigue_values[0] if len(fatigue_values) >= 1 else 0,
-            'v2_fatigue': fatigue_values[1] if len(fatigue_values) >= 2 else 0,
-            'v3_fatigue': fatigue_values[2] if len(fatigue_values) >= 3 else 0,
-            'v4_fatigue': fatigue_values[3] if len(fatigue_values) >= 4 else 0,
-            'v5_fatigue': fatigue_values[4] if len(fatigue_values) >= 5 else 0,
-            'v6_fatigue': fatigue_values[5] if len(fatigue_values) >= 6 else 0,
-
-            'v1_cognitive': cognitive_values[0] if len(cognitive_values) >= 1 else 0,
-            'v2_cognitive': cognitive_values[1] if len(cognitive_values) >= 2 else 0,
-            'v3_cognitive': cognitive_values[2] if len(cognitive_values) >= 3 else 0,
-            'v4_cognitive': cognitive_values[3] if len(cognitive_values) >= 4 else 0,
-            'v5_cognitive': cognitive_values[4] if len(cognitive_values) >= 5 else 0,
-            'v6_cognitive': cognitive_values[5] if len(cognitive_values) >= 6 else 0,
-
-            # Inter-vacancy changes
-            'v1_to_v2_fatigue_change': fatigue_values[1] - fatigue_values[0] if len(fatigue_values) >= 2 else 0,
-            'v2_to_v3_fatigue_change': fatigue_values[2] - fatigue_values[1] if len(fatigue_values) >= 3 else 0,
-            'v3_to_v4_fatigue_change': fatigue_values[3] - fatigue_values[2] if len(fatigue_values) >= 4 else 0,
-            'v4_to_v5_fatigue_change': fatigue_values[4] - fatigue_values[3] if len(fatigue_values) >= 5 else 0,
-            'v5_to_v6_fatigue_change': fatigue_values[5] - fatigue_values[4] if len(fatigue_values) >= 6 else 0,
-
-            'v1_to_v2_cognitive_change': cognitive_values[0] - cognitive_values[1] if len(cognitive_values) >= 2 else 0,
-            'v2_to_v3_cognitive_change': cognitive_values[1] - cognitive_values[2] if len(cognitive_values) >= 3 else 0,
-            'v3_to_v4_cognitive_change': cognitive_values[2] - cognitive_values[3] if len(cognitive_values) >= 4 else 0,
-            'v4_to_v5_cognitive_change': cognitive_values[3] - cognitive_values[4] if len(cognitive_values) >= 5 else 0,
-            'v5_to_v6_cognitive_change': cognitive_values[4] - cognitive_values[3] if len(cognitive_values) >= 6 else 0,
+            # Task progression metrics (first → last vacancy), averages and
+            # per-vacancy values with the changes between them
+            **metrics,
 
             # Role-specific flag
             'is_hr_coordinator': is_hr_coordinator,
 
+            # Charts rendered as inline SVG (cached per participant)
+            **get_final_results_charts(self.participant.code, task_sessions_data),
+
             'show_next_button': False,
             'is_final_results': True,
         }
@@ -913,3 +783,16 @@ page_sequence = [
     CognitiveTestResults,
     FinalResults
 ]
+
+# Opt-in precompilation of all vacancy assets at server start (APPLICANTS_WARMUP=1)
+if warmup_requested():
+    start_background_warmup()
+
+# Serve content-hashed asset names with immutable cache headers
+install_immutable_static_caching()
+
+# Byte-range requests, so PDF viewers can show the first page before the whole file arrives
+install_byte_range_support()
+
+# Deliver live evaluation updates to all three role pages of a group
+install_shared_live_pages()
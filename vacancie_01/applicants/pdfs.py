@@ -0,0 +1,68 @@
+"""
+Optional offline pass that linearizes ("fast web view") the applicant PDFs.
+
+A linearized PDF starts with the objects of its first page, so a browser PDF viewer that
+uses byte-range requests (see byte_ranges.py) can show page one before the rest arrives.
+Files are rewritten in place only if they are not linearized yet; the asset manifest is
+updated afterwards because the content hashes change.
+
+Requires pikepdf at build time only (pip install pikepdf):
+    python -m applicants.pdfs [--check]
+"""
+import argparse
+import os
+
+from .assets import build_asset_manifest, find_assets
+from .documents import APPLICANTS_STATIC_DIR
+
+
+def is_linearized(path):
+    """
+    Checks for the linearization dictionary, which must appear within the first 1 KB.
+    """
+    with open(path, 'rb') as f:
+        return b'/Linearized' in f.read(1024)
+
+
+def linearize_pdf(path):
+    """
+    Rewrites a PDF linearized, keeping its content. The file is replaced atomically.
+
+    Returns:
+    tuple: (size before, size after) in bytes
+    """
+    import pikepdf
+
+    size_before = os.path.getsize(path)
+    tmp_path = path + '.tmp'
+    with pikepdf.open(path) as pdf:
+        pdf.save(tmp_path, linearize=True)
+    os.replace(tmp_path, path)
+    return size_before, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Linearize applicant PDFs for progressive display.")
+    parser.add_argument('--check', action='store_true', help="Only list PDFs that are not linearized")
+    args = parser.parse_args()
+
+    pdf_names = [name for name in find_assets() if name.lower().endswith('.pdf')]
+    pending = [name for name in pdf_names if not is_linearized(os.path.join(APPLICANTS_STATIC_DIR, name))]
+
+    if args.check:
+        for name in pending:
+            print(f"not linearized: {name}")
+        print(f"{len(pdf_names) - len(pending)}/{len(pdf_names)} PDFs linearized")
+        raise SystemExit(1 if pending else 0)
+
+    for name in pending:
+        size_before, size_after = linearize_pdf(os.path.join(APPLICANTS_STATIC_DIR, name))
+        print(f"{name:<44} {size_before / 1024:>7.1f} KB -> {size_after / 1024:>7.1f} KB")
+
+    if pending:
+        build_asset_manifest()
+    print(f"Linearized {len(pending)} of {len(pdf_names)} PDFs")
+
+
+if __name__ == '__main__':
+    main()
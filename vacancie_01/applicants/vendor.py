@@ -0,0 +1,131 @@
+"""
+Vendored JavaScript libraries served from _static/vendor/ instead of a CDN.
+
+Each library lives under a versioned path (vendor/<library>/<version>/<file>), so its URL
+never changes content and is served with immutable cache headers (see assets.py).
+Pages get script URLs from vendor_script_url(); if a file has not been vendored yet the
+CDN URL is used and a warning is logged.
+
+Libraries are taken from their release package on npm where one is configured, otherwise
+from the CDN. Download missing libraries (needs internet access once):
+    python -m applicants.vendor [--force]
+
+Chart.js is not vendored yet: _static/vendor/chart.js/3.9.1/chart.min.js is not in the
+repository, so the HR Coordinator page still loads Chart.js from cdnjs and does not work on
+an offline network. Run the command above on a machine with internet access and commit the
+downloaded file.
+"""
+import argparse
+import io
+import logging
+import os
+import tarfile
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+VENDOR_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '_static', 'vendor')
+)
+STATIC_URL = '/static/'
+
+VENDOR_LIBRARIES = {
+    'chart.js': {
+        'version': '3.9.1',
+        'file': 'chart.min.js',
+        'cdn_url': 'https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js',
+        # Official release tarball, the file is the one the CDN serves
+        'package_url': 'https://registry.npmjs.org/chart.js/-/chart.js-3.9.1.tgz',
+        'package_file': 'package/dist/chart.min.js',
+    },
+}
+
+_missing_logged = set()
+
+
+def vendor_static_path(library):
+    """
+    Returns the path of a vendored library relative to _static/, e.g. 'vendor/chart.js/3.9.1/chart.min.js'.
+    """
+    config = VENDOR_LIBRARIES[library]
+    return f"vendor/{library}/{config['version']}/{config['file']}"
+
+
+def vendor_file_path(library):
+    """
+    Returns the absolute path of a vendored library file.
+    """
+    config = VENDOR_LIBRARIES[library]
+    return os.path.join(VENDOR_DIR, library, config['version'], config['file'])
+
+
+def vendor_script_url(library):
+    """
+    Returns the URL to load a library from.
+
+    Args:
+    library (str): Key of VENDOR_LIBRARIES, e.g. 'chart.js'
+
+    Returns:
+    str: Versioned local static URL, or the CDN URL if the library is not vendored
+    """
+    if os.path.isfile(vendor_file_path(library)):
+        return STATIC_URL + vendor_static_path(library)
+
+    if library not in _missing_logged:
+        _missing_logged.add(library)
+        logger.warning("%s is not vendored, loading it from the CDN. "
+                       "Run 'python -m applicants.vendor' to download it.", library)
+    return VENDOR_LIBRARIES[library]['cdn_url']
+
+
+def fetch_library(library):
+    """
+    Downloads a library from its npm package (or else its CDN URL) into the vendor folder.
+    The file must mention its version in the license banner.
+
+    Returns:
+    int: Size of the downloaded file in bytes
+    """
+    config = VENDOR_LIBRARIES[library]
+    source = config.get('package_url', config['cdn_url'])
+    with urllib.request.urlopen(source, timeout=60) as response:
+        data = response.read()
+    if 'package_url' in config:
+        with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as package:
+            data = package.extractfile(config['package_file']).read()
+
+    if config['version'].encode() not in data[:1000]:
+        raise ValueError(f"{source} does not look like {library} {config['version']}")
+
+    path = vendor_file_path(library)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+    return len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the JavaScript libraries into _static/vendor/.")
+    parser.add_argument('--force', action='store_true', help="Download again even if already vendored")
+    args = parser.parse_args()
+
+    failures = 0
+    for library in VENDOR_LIBRARIES:
+        if os.path.isfile(vendor_file_path(library)) and not args.force:
+            print(f"{library:<10} already vendored at {vendor_static_path(library)}")
+            continue
+        try:
+            size = fetch_library(library)
+            print(f"{library:<10} {size / 1024:>8.1f} KB -> {vendor_static_path(library)}")
+        except Exception as e:
+            failures += 1
+            print(f"{library:<10} FAILED: {type(e).__name__}: {e}")
+
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Optional warm-up stage that precompiles all vacancy assets when the server starts.
+
+Compiles the metadata of all six vacancies and renders every recruiter mask on a thread pool,
+so the first triad reaching a vacancy does not wait for Excel/Word parsing.
+
+Enable at server start by setting the environment variable APPLICANTS_WARMUP=1.
+Can also be run by hand to check all assets:
+    python -m applicants.warmup
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .documents import load_recruiter_mask_html, get_mask_cache_stats
+from .models import MAX_VACANCIES, get_vacancy_config, get_applicant_ids, load_vacancy_metadata
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENV_VAR = 'APPLICANTS_WARMUP'
+VACANCY_NUMBERS = range(1, MAX_VACANCIES + 1)
+DEFAULT_WORKERS = 4
+
+
+def warmup_requested():
+    """
+    Checks whether the warm-up stage was enabled via environment variable.
+    """
+    return os.environ.get(WARMUP_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def get_warmup_tasks():
+    """
+    Lists all assets to precompile.
+
+    Returns:
+    list: Tuples of (asset name, function, arguments)
+    """
+    tasks = []
+    for vacancy_number in VACANCY_NUMBERS:
+        vacancy_info = get_vacancy_config(vacancy_number)
+        doc_suffix = vacancy_info['doc_suffix']
+
+        tasks.append((f'metadata{vacancy_number}.xlsx', load_vacancy_metadata, (vacancy_info,)))
+        for applicant_id in get_applicant_ids():
+            tasks.append((f'recruiter_maske_{applicant_id}{doc_suffix}.docx',
+                          load_recruiter_mask_html, (applicant_id, doc_suffix)))
+    return tasks
+
+
+def run_task(asset, func, args):
+    """
+    Runs one warm-up task and records its duration and error, if any.
+
+    Returns:
+    dict: Result with keys 'asset', 'seconds' and 'error' (None on success)
+    """
+    start = time.perf_counter()
+    try:
+        func(*args)
+        error = None
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    return {'asset': asset, 'seconds': time.perf_counter() - start, 'error': error}
+
+
+def warm_up(max_workers=DEFAULT_WORKERS):
+    """
+    Precompiles all vacancy assets on a thread pool, filling the in-process caches.
+
+    Args:
+    max_workers (int): Number of worker threads
+
+    Returns:
+    list: One result per asset (see run_task), in task order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='applicants-warmup') as executor:
+        futures = [executor.submit(run_task, *task) for task in get_warmup_tasks()]
+        return [future.result() for future in futures]
+
+
+def log_report(report, total_seconds):
+    """
+    Logs per-asset timings and failures of a warm-up run.
+    """
+    for result in report:
+        if result['error']:
+            logger.warning("Warm-up failed for %s after %.1f ms: %s",
+                           result['asset'], result['seconds'] * 1e3, result['error'])
+        else:
+            logger.info("Warm-up compiled %s in %.1f ms", result['asset'], result['seconds'] * 1e3)
+
+    failures = sum(1 for result in report if result['error'])
+    logger.info("Warm-up finished: %d assets, %d failed, %.1f ms total, recruiter mask cache: %s",
+                len(report), failures, total_seconds * 1e3, get_mask_cache_stats())
+
+
+def start_background_warmup(max_workers=DEFAULT_WORKERS):
+    """
+    Runs the warm-up in a daemon thread so server start is not delayed.
+
+    Returns:
+    threading.Thread: The started thread
+    """
+    def run():
+        start = time.perf_counter()
+        report = warm_up(max_workers)
+        log_report(report, time.perf_counter() - start)
+
+    thread = threading.Thread(target=run, name='applicants-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompile metadata and recruiter masks of all vacancies.")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = warm_up(args.workers)
+    total_seconds = time.perf_counter() - start
+
+    for result in report:
+        status = f"FAILED: {result['error']}" if result['error'] else 'ok'
+        print(f"{result['asset']:<28} {result['seconds'] * 1e3:>8.1f} ms  {status}")
+    print(f"{len(report)} assets in {total_seconds * 1e3:.1f} ms")
+
+    if any(result['error'] for result in report):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark for the recruiter mask DOCX -> HTML converter.
+
+Compares the streaming lxml converter (applicants.documents.convert_docx_to_html) with the
+former python-docx object-model converter on the shipped recruiter masks and on synthetic
+large documents. Reports conversion time and peak resident memory, each converter running
+in its own process so memory high-water marks do not mix.
+
+Usage (from the project directory):
+    python -m benchmarks.docx_converter [--paragraphs 20000] [--table-rows 5000]
+"""
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from applicants.documents import APPLICANTS_STATIC_DIR, EMPTY_DOCUMENT_HTML, convert_docx_to_html
+
+
+def legacy_convert(path):
+    """
+    Previous implementation: python-docx object model, all paragraphs before all tables.
+    """
+    from docx import Document
+
+    document = Document(path)
+    html_parts = []
+
+    for paragraph in document.paragraphs:
+        text = paragraph.text.strip()
+        if text:
+            if paragraph.style.name.startswith('Heading'):
+                level = 3
+                if 'Heading 1' in paragraph.style.name:
+                    level = 2
+                elif 'Heading 2' in paragraph.style.name:
+                    level = 3
+                html_parts.append(f'<h{level}>{text}</h{level}>')
+            else:
+                if any(run.bold for run in paragraph.runs):
+                    html_parts.append(f'<p><strong>{text}</strong></p>')
+                else:
+                    html_parts.append(f'<p>{text}</p>')
+
+    for table in document.tables:
+        html_parts.append('<table style="width:100%; border-collapse: collapse; margin: 10px 0;">')
+        for row_idx, row in enumerate(table.rows):
+            html_parts.append('<tr>')
+            for cell in row.cells:
+                cell_text = cell.text.strip()
+                if row_idx == 0 or any(run.bold for para in cell.paragraphs for run in para.runs):
+                    html_parts.append(
+                        f'<td style="border: 1px solid #ddd; padding: 5px; font-weight: bold; background-color: #f5f5f5;">{cell_text}</td>')
+                else:
+                    html_parts.append(f'<td style="border: 1px solid #ddd; padding: 5px;">{cell_text}</td>')
+            html_parts.append('</tr>')
+        html_parts.append('</table>')
+
+    if not html_parts:
+        return EMPTY_DOCUMENT_HTML
+    return ''.join(html_parts)
+
+
+CONVERTERS = {'streaming': convert_docx_to_html, 'python-docx': legacy_convert}
+
+
+def create_synthetic_document(path, num_paragraphs, num_table_rows):
+    """
+    Writes a large .docx with headings, bold/plain paragraphs and one 4-column table.
+    All paragraphs come before the table, so both converters produce identical output.
+    """
+    from docx import Document
+
+    document = Document()
+    for index in range(num_paragraphs):
+        if index % 100 == 0:
+            document.add_heading(f'Section {index // 100}', level=1 + (index // 100) % 2)
+        paragraph = document.add_paragraph(f'Paragraph {index}: ')
+        paragraph.add_run('Qualification details ' * 3).bold = index % 7 == 0
+
+    table = document.add_table(rows=num_table_rows, cols=4)
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = f'Row {row_idx} column {col_idx}'
+    document.save(path)
+
+
+def peak_rss_kb():
+    """
+    Peak resident memory of this process in KB.
+    Prefers VmHWM, because ru_maxrss on Linux carries over the parent's high-water mark.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(converter_name, paths, repeat):
+    """
+    Runs inside the child process: returns best total time and peak RSS growth.
+    """
+    converter = CONVERTERS[converter_name]
+    # Import libraries before taking the memory baseline
+    import docx  # noqa: F401
+    import lxml.etree  # noqa: F401
+    rss_before = peak_rss_kb()
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            converter(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    rss_after = peak_rss_kb()
+    return {'seconds': best, 'peak_rss_growth_kb': rss_after - rss_before}
+
+
+def run_child(converter_name, paths, repeat):
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.docx_converter', '--child', converter_name,
+         '--repeat', str(repeat), *paths],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def report(label, paths, repeat):
+    mismatches = [path for path in paths if convert_docx_to_html(path) != legacy_convert(path)]
+    results = {name: run_child(name, paths, repeat) for name in CONVERTERS}
+
+    print(label)
+    for name, result in results.items():
+        print(f"  {name:<12} {result['seconds'] * 1e3:>10.1f} ms  peak RSS +{result['peak_rss_growth_kb'] / 1024:.1f} MB")
+    print(f"  speedup      {results['python-docx']['seconds'] / results['streaming']['seconds']:>10.1f}x")
+    print(f"  identical output: {len(paths) - len(mismatches)}/{len(paths)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DOCX -> HTML converters.")
+    parser.add_argument('--paragraphs', type=int, default=20000)
+    parser.add_argument('--table-rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', choices=list(CONVERTERS), help=argparse.SUPPRESS)
+    parser.add_argument('paths', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.paths, args.repeat)))
+        return
+
+    masks = sorted(glob.glob(os.path.join(APPLICANTS_STATIC_DIR, 'recruiter_maske_*.docx')))
+    report(f"Shipped recruiter masks ({len(masks)} files, all converted per run)", masks, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'synthetic.docx')
+        create_synthetic_document(path, args.paragraphs, args.table_rows)
+        report(f"Synthetic document ({args.paragraphs} paragraphs, {args.table_rows}x4 table, "
+               f"{os.path.getsize(path) / 1024:.0f} KB)", [path], 1)
+
+
+if __name__ == '__main__':
+    main()
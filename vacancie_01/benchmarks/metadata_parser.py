@@ -0,0 +1,131 @@
+"""
+Benchmark for the metadata parser on synthetic requirement catalogs.
+
+Times compile_criteria_frame() + organize_criteria() against the former row-by-row
+DataFrame.iterrows() implementation for growing catalog sizes. Time per requirement
+should stay roughly constant (linear scaling).
+
+Usage (from the project directory):
+    python -m benchmarks.metadata_parser [--sizes 1000 10000 20000]
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from applicants.metadata import POINT_FIELDS, compile_criteria_frame, organize_criteria
+
+CATEGORIES = ['organizational', 'general', 'language', 'technical', 'social and personal', 'application']
+RELEVANCES = ['low', 'normal', 'high', None]
+NEED_DEFINED_BY = ['tender', 'predefined', 'manager_stickynote', None]
+
+
+def synthetic_metadata_frame(num_requirements, seed=0):
+    """
+    Creates a DataFrame shaped like metadataN.xlsx (after header=1) with sparse point descriptions.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for index in range(num_requirements):
+        row = {
+            'requirement_name': f' Requirement {index} ' if index % 50 else None,
+            'requirement_category': rng.choice(CATEGORIES + [None]),
+            'requirement_need_defined_by': rng.choice(NEED_DEFINED_BY),
+            'requirement_relevance': rng.choice(RELEVANCES),
+        }
+        for point_field in POINT_FIELDS:
+            row[point_field] = f"['Level {point_field[-1]}']" if rng.random() < 0.5 else None
+        for applicant_id in 'abc':
+            row[f'applicant_{applicant_id}_points'] = rng.randint(0, 8) if rng.random() < 0.95 else None
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def legacy_parse(df):
+    """
+    Previous implementation: one pandas Series per row, per-cell notna/strip, per-category rescan.
+    """
+    criteria_data = []
+    predefined_criteria = []
+    categories = []
+
+    for index, row in df.iterrows():
+        name_value = row.get('requirement_name')
+        category_value = row.get('requirement_category')
+        relevance_value = row.get('requirement_relevance')
+        need_defined_by = row.get('requirement_need_defined_by')
+
+        applicant_a_score = row.get('applicant_a_points')
+        applicant_b_score = row.get('applicant_b_points')
+        applicant_c_score = row.get('applicant_c_points')
+
+        if pd.notna(name_value) and str(name_value).strip():
+            criterion = {
+                'name': str(name_value).strip(),
+                'category': str(category_value).strip() if pd.notna(category_value) else 'general',
+                'relevance': str(relevance_value).strip() if pd.notna(relevance_value) else 'normal',
+                'need_defined_by': str(need_defined_by).strip() if pd.notna(need_defined_by) else 'tender',
+                'scores': {
+                    'applicant_a': int(applicant_a_score) if pd.notna(applicant_a_score) else 0,
+                    'applicant_b': int(applicant_b_score) if pd.notna(applicant_b_score) else 0,
+                    'applicant_c': int(applicant_c_score) if pd.notna(applicant_c_score) else 0,
+                }
+            }
+            for points in range(9):
+                point_field = f'requirement_point_is_{points}'
+                point_value = row.get(point_field)
+                if pd.notna(point_value):
+                    criterion[point_field] = str(point_value).strip()
+
+            criteria_data.append(criterion)
+            if need_defined_by and str(need_defined_by).strip().lower() == 'predefined':
+                predefined_criteria.append(criterion)
+            if criterion['category'] not in categories:
+                categories.append(criterion['category'])
+
+    criteria_by_category = {}
+    for category in categories:
+        criteria_by_category[category] = [c for c in criteria_data if c['category'] == category]
+
+    return {
+        'criteria': criteria_data,
+        'predefined_criteria': predefined_criteria,
+        'categories': categories,
+        'criteria_by_category': criteria_by_category
+    }
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the metadata parser.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000, 20000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true', help="Only time the current parser")
+    args = parser.parse_args()
+
+    print(f"{'requirements':>12} {'columnar ms':>12} {'us/req':>8} {'legacy ms':>10} {'us/req':>8} {'speedup':>8}")
+    for size in args.sizes:
+        df = synthetic_metadata_frame(size)
+        current_time, current = best_of(lambda: organize_criteria(compile_criteria_frame(df)), args.repeat)
+
+        if args.skip_legacy:
+            print(f"{size:>12} {current_time * 1e3:>12.1f} {current_time / size * 1e6:>8.2f}")
+            continue
+
+        legacy_time, legacy = best_of(lambda: legacy_parse(df), 1)
+        assert current == legacy, "Parsers disagree"
+        print(f"{size:>12} {current_time * 1e3:>12.1f} {current_time / size * 1e6:>8.2f} "
+              f"{legacy_time * 1e3:>10.1f} {legacy_time / size * 1e6:>8.2f} {legacy_time / current_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
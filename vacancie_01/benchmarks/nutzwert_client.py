@@ -0,0 +1,127 @@
+"""
+Client benchmark: cost of one evaluation change in the live Nutzwert ranking.
+
+Runs the script of LiveEvaluation.html (shared by the HR Coordinator, Recruiter and Business
+Partner pages) in Node.js, at a git revision and in the working tree. Each run loads an
+evaluation with the given number of criteria from a snapshot, then applies single-criterion
+changes as the HR coordinator makes them (one score or the relevance at a time). Reports the
+mean time per change, including the Nutzwert results handed to the page, and how many changes
+made the page redraw. Rendering itself (Chart.js, DOM) is not included.
+
+Lab PCs are slower than a development machine; compare the columns, not the absolute times.
+
+Usage (from the project directory, requires node):
+    python -m benchmarks.nutzwert_client [--before HEAD] [--criteria 100 500 1000] [--changes 2000]
+"""
+import argparse
+import json
+import re
+import shutil
+import subprocess
+
+from applicants.models import C, get_applicant_ids
+
+from .page_weight import read_template
+
+TEMPLATE = 'LiveEvaluation.html'
+SCRIPT_PATTERN = re.compile(r'<script>(.*?)</script>', re.DOTALL)
+
+# Stubs for what the page and oTree's live.js provide, then the benchmark itself
+HARNESS = """
+let renders = 0;
+function renderLiveEvaluation(results) { renders++; }
+function liveSend(message) {}
+const document = {addEventListener() {}};
+
+%(script)s
+
+let random = 1;
+function nextRandom(limit) {
+    random = (random * 48271) %% 2147483647;
+    return random %% limit;
+}
+
+const applicantIds = liveEvaluation.applicantIds;
+const levels = Object.keys(liveEvaluation.relevanceFactors).concat(['']);
+const criteria = {};
+for (let i = 0; i < %(criteria)d; i++) {
+    const scores = {};
+    applicantIds.forEach(applicantId => { scores[applicantId] = nextRandom(%(max_score)d + 1); });
+    criteria['Criterion ' + i] = {name: 'Criterion ' + i, scores: scores, relevance: levels[nextRandom(levels.length)]};
+}
+liveRecv({type: 'snapshot', seq: 0, criteria: Object.assign({}, criteria)});
+
+// Changes as the server sends them: a new criterion object per delta
+const deltas = [];
+for (let seq = 1; seq <= %(changes)d; seq++) {
+    const name = 'Criterion ' + nextRandom(%(criteria)d);
+    const criterion = {name: name, scores: Object.assign({}, criteria[name].scores), relevance: criteria[name].relevance};
+    if (nextRandom(4) === 0) {
+        criterion.relevance = levels[nextRandom(levels.length)];
+    } else {
+        criterion.scores[applicantIds[nextRandom(applicantIds.length)]] = nextRandom(%(max_score)d + 1);
+    }
+    criteria[name] = criterion;
+    deltas.push({type: 'delta', seq: seq, name: name, criterion: criterion});
+}
+
+renders = 0;
+const start = process.hrtime.bigint();
+deltas.forEach(liveRecv);
+const elapsed = Number(process.hrtime.bigint() - start) / 1e6;
+console.log(JSON.stringify({ms_per_change: elapsed / deltas.length, renders: renders}));
+"""
+
+
+def live_evaluation_script(template_text):
+    """
+    Extracts the template's script with the template variables filled in as the pages do.
+    """
+    script = SCRIPT_PATTERN.search(template_text).group(1)
+    script = script.replace('{{ applicant_ids|safe }}', json.dumps(get_applicant_ids()))
+    return script.replace('{{ relevance_factors|safe }}', json.dumps(C.RELEVANCE_FACTORS))
+
+
+def run_client(script, criteria, changes):
+    """
+    Runs the benchmark in Node.js.
+
+    Returns:
+    dict: ms_per_change and renders (changes that redrew the page)
+    """
+    program = HARNESS % {'script': script, 'criteria': criteria, 'changes': changes, 'max_score': C.MAX_SCORE}
+    result = subprocess.run(['node'], input=program, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def format_result(result, changes):
+    if result is None:
+        return f"{'-':>24}"
+    return f"{result['ms_per_change']:>10.4f} ms {result['renders']:>6}/{changes:<6}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the live Nutzwert update cost between a git revision "
+                                                 "and the working tree.")
+    parser.add_argument('--before', default='HEAD', help="Git revision to compare against")
+    parser.add_argument('--criteria', type=int, nargs='+', default=[100, 500, 1000],
+                        help="Evaluation sizes to measure")
+    parser.add_argument('--changes', type=int, default=2000, help="Changes applied per run")
+    args = parser.parse_args()
+
+    if shutil.which('node') is None:
+        parser.error("node is required to run the page script")
+
+    before_text = read_template(TEMPLATE, args.before)
+    before_script = live_evaluation_script(before_text) if before_text is not None else None
+    after_script = live_evaluation_script(read_template(TEMPLATE))
+
+    print(f"{'criteria':>8}  {'before: per change':>19} {'redraws':>13}  {'after: per change':>18} {'redraws':>13}")
+    for criteria in args.criteria:
+        before = run_client(before_script, criteria, args.changes) if before_script is not None else None
+        after = run_client(after_script, criteria, args.changes)
+        print(f"{criteria:>8}  {format_result(before, args.changes)}  {format_result(after, args.changes)}")
+
+
+if __name__ == '__main__':
+    main()
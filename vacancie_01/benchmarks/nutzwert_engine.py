@@ -0,0 +1,98 @@
+"""
+Server benchmark: Nutzwert ranking of all groups of a session (applicants/nutzwert.py).
+
+Builds HR submissions for the given numbers of groups from the vacancies' metadata (random
+scores and relevance for a random share of each vacancy's criteria, spread over the six
+vacancies) and times evaluate_groups() against scoring each group on its own in plain
+Python, the way the pages compute it. Both must give the same totals. Reports the median
+over several runs.
+
+Usage (from the project directory):
+    python -m benchmarks.nutzwert_engine [--groups 100 300 1000] [--runs 5]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from applicants.models import C, MAX_VACANCIES, get_applicant_ids, get_vacancy_config, build_vacancy_context, \
+    load_context_metadata
+from applicants.nutzwert import evaluate_groups
+
+
+def make_submissions(num_groups, answer_indexes, seed=1):
+    """
+    Returns (submissions, answer_indexes) for num_groups groups, cycling through the vacancies.
+    """
+    rng = random.Random(seed)
+    levels = list(C.RELEVANCE_FACTORS)
+    submissions, group_indexes = [], []
+    for group in range(num_groups):
+        answer_index = answer_indexes[group % len(answer_indexes)]
+        names = rng.sample(sorted(answer_index), rng.randint(1, len(answer_index)))
+        submissions.append({name: {'name': name,
+                                   'scores': {applicant_id: rng.randint(C.MIN_SCORE, C.MAX_SCORE)
+                                              for applicant_id in get_applicant_ids()},
+                                   'relevance': rng.choice(levels)} for name in names})
+        group_indexes.append(answer_index)
+    return submissions, group_indexes
+
+
+def score_one_by_one(submissions, answer_indexes):
+    """
+    Scores each group separately in plain Python, as LiveEvaluation.html does per page.
+    """
+    applicant_ids = get_applicant_ids()
+    factors = C.RELEVANCE_FACTORS
+    results = []
+    for criteria_data, answer_index in zip(submissions, answer_indexes):
+        totals = dict.fromkeys(applicant_ids, 0)
+        true_totals = dict.fromkeys(applicant_ids, 0)
+        for data in criteria_data.values():
+            for applicant_id in applicant_ids:
+                totals[applicant_id] += (data['scores'].get(applicant_id) or 0) * (
+                    factors.get(data['relevance']) or factors['normal'])
+        for data in answer_index.values():
+            for applicant_id in applicant_ids:
+                true_totals[applicant_id] += data['scores'][applicant_id] * factors.get(data['relevance'], 0)
+        results.append(([totals[applicant_id] for applicant_id in applicant_ids],
+                        [true_totals[applicant_id] for applicant_id in applicant_ids]))
+    return results
+
+
+def median_time(function, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the batched Nutzwert ranking of many groups.")
+    parser.add_argument('--groups', type=int, nargs='+', default=[100, 300, 1000], help="Group counts to measure")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    answer_indexes = []
+    for vacancy in range(1, MAX_VACANCIES + 1):
+        context = build_vacancy_context(get_vacancy_config(vacancy), MAX_VACANCIES)
+        answer_indexes.append(load_context_metadata(context)['answer_index'])
+
+    print(f"{'groups':>6} {'criteria':>9} {'one by one':>12} {'batched':>10}")
+    for num_groups in args.groups:
+        submissions, group_indexes = make_submissions(num_groups, answer_indexes)
+        single_time, single = median_time(lambda: score_one_by_one(submissions, group_indexes), args.runs)
+        batch_time, batch = median_time(
+            lambda: evaluate_groups(submissions, group_indexes, get_applicant_ids(), C.RELEVANCE_FACTORS), args.runs)
+
+        if batch['totals'].tolist() != [totals for totals, _ in single] or \
+                batch['true_totals'].tolist() != [true_totals for _, true_totals in single]:
+            raise SystemExit(f"Batched totals differ from the per-group ones for {num_groups} groups")
+        criteria = sum(len(submission) for submission in submissions)
+        print(f"{num_groups:>6} {criteria:>9} {single_time * 1000:>9.1f} ms {batch_time * 1000:>7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Page-weight report: bytes each page downloads for scripts, stylesheets and images.
+
+Compares the page templates at a git revision with the working tree. Sizes are counted as
+transferred on a first visit:
+    - local static files: size on disk (oTree's static file server does not compress)
+    - CDN scripts: gzip size of the same library version (CDNs compress), taken from the
+      vendored copy; reported as unknown if the library is not vendored
+    - other external scripts (e.g. the meeting API): counted, size unknown
+'blocking' is the part loaded by scripts without defer/async, which delays rendering.
+Template variables are resolved with the values the pages pass today; resources that
+depend on other variables are skipped.
+
+Usage (from the project directory):
+    python -m benchmarks.page_weight [--before HEAD]
+"""
+import argparse
+import gzip
+import os
+import re
+import subprocess
+
+from applicants.assets import STATIC_URL_PREFIX, logical_asset_name
+from applicants.images import resolve_image
+from applicants.models import C
+from applicants.vendor import VENDOR_LIBRARIES, vendor_file_path, vendor_script_url
+
+TEMPLATES_DIR = os.path.join('applicants', 'templates', 'applicants')
+INCLUDES = {'Prefetch.html'}  # Not pages themselves
+STATIC_DIR = '_static'
+
+RESOURCE_PATTERN = re.compile(
+    r'<(script|img)\b([^>]*?)\bsrc="([^"]+)"|<link\b([^>]*?)\bhref="([^"]+)"', re.IGNORECASE
+)
+VARIABLE_PATTERN = re.compile(r'{{\s*(\w+)\s*}}')
+
+
+def template_context():
+    """
+    Values of the template variables used in resource URLs.
+    """
+    return {
+        'static_path': C.STATIC_APPLICANTS_PATH,
+        'chartjs_url': vendor_script_url('chart.js'),
+        'notebook_file': resolve_image('notebook'),
+        'job_desc_cover_file': resolve_image('job_description_cover'),
+    }
+
+
+def cdn_sizes():
+    """
+    Maps CDN URLs of vendored libraries to their gzip-compressed size.
+    """
+    sizes = {}
+    for library, config in VENDOR_LIBRARIES.items():
+        path = vendor_file_path(library)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                sizes[config['cdn_url']] = len(gzip.compress(f.read()))
+    return sizes
+
+
+def find_resources(template_text, context):
+    """
+    Lists the resources a template loads.
+
+    Returns:
+    list: (url, is_blocking_script) for each resource whose URL could be resolved
+    """
+    resources = []
+    for match in RESOURCE_PATTERN.finditer(template_text):
+        tag, script_attributes, url, link_attributes, link_url = match.groups()
+        if tag is None:
+            if 'stylesheet' not in link_attributes:
+                continue  # e.g. prefetch hints
+            url = link_url
+            blocking = False
+        else:
+            blocking = tag.lower() == 'script' and not re.search(r'\b(defer|async)\b', script_attributes)
+
+        unresolved = [name for name in VARIABLE_PATTERN.findall(url) if name not in context]
+        if unresolved:
+            continue
+        url = VARIABLE_PATTERN.sub(lambda m: str(context[m.group(1)]), url)
+        resources.append((url, blocking))
+    return resources
+
+
+def static_file_path(static_url):
+    """
+    Maps a /static/ URL to its file, following content-hashed names back to the logical file.
+    """
+    relative_path = static_url.split('/static/', 1)[-1]
+    if relative_path.startswith(STATIC_URL_PREFIX):
+        relative_path = STATIC_URL_PREFIX + (logical_asset_name(relative_path[len(STATIC_URL_PREFIX):])
+                                             or relative_path[len(STATIC_URL_PREFIX):])
+    return os.path.join(STATIC_DIR, relative_path)
+
+
+def page_weight(template_text, context, cdn):
+    """
+    Sums the first-visit download size of a page's resources.
+
+    Returns:
+    dict: total, blocking and external byte counts, requests and unknown-size resources
+    """
+    weight = {'total': 0, 'blocking': 0, 'external': 0, 'requests': 0, 'unknown': 0}
+    for url, blocking in find_resources(template_text, context):
+        weight['requests'] += 1
+        if url.startswith('http'):
+            size = cdn.get(url)
+            if size is not None:
+                weight['external'] += size
+        else:
+            path = static_file_path(url)
+            size = os.path.getsize(path) if os.path.isfile(path) else None
+
+        if size is None:
+            weight['unknown'] += 1
+            continue
+        weight['total'] += size
+        if blocking:
+            weight['blocking'] += size
+    return weight
+
+
+def read_template(name, revision=None):
+    path = os.path.join(TEMPLATES_DIR, name)
+    if revision is None:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    result = subprocess.run(['git', 'show', f'{revision}:./{path}'], capture_output=True, text=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def format_weight(weight):
+    if weight is None:
+        return f"{'-':>32}"
+    unknown = f" +{weight['unknown']}?" if weight['unknown'] else ''
+    return (f"{weight['total'] / 1024:>9.1f} KB {weight['blocking'] / 1024:>8.1f} KB"
+            f" {weight['requests']:>3} req{unknown:<4}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare page weights between a git revision and the working tree.")
+    parser.add_argument('--before', default='HEAD', help="Git revision to compare against")
+    args = parser.parse_args()
+
+    context = template_context()
+    cdn = cdn_sizes()
+    names = sorted(name for name in os.listdir(TEMPLATES_DIR) if name.endswith('.html') and name not in INCLUDES)
+
+    print(f"{'page':<28} {'before: total':>14} {'blocking':>11} {'':>8}  {'after: total':>13} {'blocking':>11}")
+    for name in names:
+        before_text = read_template(name, args.before)
+        before = page_weight(before_text, context, cdn) if before_text is not None else None
+        after = page_weight(read_template(name), context, cdn)
+        print(f"{name[:-5]:<28} {format_weight(before)}  {format_weight(after)}")
+    print("'+N?' = resources of unknown size (external, not vendored)")
+
+
+if __name__ == '__main__':
+    main()
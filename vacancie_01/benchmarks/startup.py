@@ -0,0 +1,87 @@
+"""
+Startup benchmark: time to import the app and render the first vacancy pages in a fresh process.
+
+Every measurement runs in a new interpreter, like a freshly started prodserver worker or a
+devserver reload. Reports the median over several runs of:
+    - otree.api import (framework baseline)
+    - applicants.pages import (app modules on top of the framework)
+    - first vars_for_template() of Recruiter, HRCoordinator and BusinessPartner (cold caches)
+
+Usage (from the project directory):
+    python -m benchmarks.startup [--runs 5] [--round 2]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+STEPS = ['otree_api_import', 'app_import', 'recruiter_first_page', 'hr_first_page', 'business_partner_first_page']
+
+
+def measure(round_number):
+    """
+    Runs inside the child process and returns the timings of one cold start in seconds.
+    """
+    from types import SimpleNamespace
+
+    timings = {}
+
+    start = time.perf_counter()
+    import otree.api  # noqa: F401
+    timings['otree_api_import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from applicants import pages
+    timings['app_import'] = time.perf_counter() - start
+
+    # A group without a stored vacancy context, as on a fresh server before the wait page
+    group = SimpleNamespace(id=None, field_maybe_none=lambda name: None)
+    # No database here; on a first visit the group has no autosaved evaluation patches
+    from applicants import live_sync
+    live_sync.load_stored_patches = lambda group: []
+    player = SimpleNamespace(round_number=round_number, group=group)
+    for step, page_class in [('recruiter_first_page', pages.Recruiter),
+                             ('hr_first_page', pages.HRCoordinator),
+                             ('business_partner_first_page', pages.BusinessPartner)]:
+        page = page_class.__new__(page_class)
+        page.player = player
+        start = time.perf_counter()
+        page.vars_for_template()
+        timings[step] = time.perf_counter() - start
+
+    timings['heavy_modules_loaded'] = sorted(name for name in ('pandas', 'numpy', 'openpyxl', 'docx') if name in sys.modules)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import and first-page render times.")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--round', type=int, default=2, help="Round number of the rendered vacancy pages")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.round)))
+        return
+
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.startup', '--child', '--round', str(args.round)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    total = 0
+    for step in STEPS:
+        median = statistics.median(run[step] for run in runs)
+        total += median
+        print(f"{step:<30} {median * 1e3:>9.1f} ms")
+    print(f"{'total':<30} {total * 1e3:>9.1f} ms")
+    print(f"heavy modules loaded after first pages: {', '.join(runs[-1]['heavy_modules_loaded']) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,10 @@ SESSION_CONFIGS = [
         display_name="Mental Fatigue Simulation",
         app_sequence=['applicants'],
         num_demo_participants=3,
+        # Vacancies played (1-6), time limit of each vacancy, practice run without limit
+        num_vacancies=6,
+        vacancy_duration_minutes=12,
+        first_vacancy_unlimited=True,
     ),
 ]
 
@@ -19,7 +23,8 @@ SESSION_CONFIG_DEFAULTS = dict(
 PARTICIPANT_FIELDS = [
     'baseline_cognitive_score',  # For comparing cognitive decline
     'experiment_start_time',     # For overall experiment duration
-    'total_sessions_completed'   # For completion tracking
+    'total_sessions_completed',  # For completion tracking
+    'fatigue_summary',           # Running summary of all measurements (see applicants/fatigue_summary.py)
 ]
 
 SESSION_FIELDS = [